@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import json
 import socket
+import time
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
-import async_timeout
 from pydantic import TypeAdapter
 
-from custom_components.ubiquiti_mobile.model.jsonrpc import Response
-from custom_components.ubiquiti_mobile.model.uimqtt import UIMQTT_METHOD, UIMQTT_PATH
-
 from .const import LOGGER
+from .model.jsonrpc import Response
 from .model.session import (
     SESSION_METHOD,
     SESSION_PATH,
@@ -21,6 +23,8 @@ from .model.session import (
     SessionResult,
 )
 from .model.uimqtt import (
+    UIMQTT_METHOD,
+    UIMQTT_PATH,
     GetDeviceInfoRequest,
     GetDeviceInfoResponse,
     GetGPSInfoRequest,
@@ -30,6 +34,9 @@ from .model.uimqtt import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .capture import PayloadCapture
     from .data import SessionData
 
 
@@ -49,16 +56,44 @@ class UbiquitiMobileApiClientAuthenticationError(
     """Exception to indicate an authentication error."""
 
 
-async def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
-    """Verify that the response is valid."""
+# Response bodies of at least this many bytes are decoded and validated in the
+# executor, so large client tables do not block the event loop.
+PARSE_IN_EXECUTOR_BYTES = 32 * 1024
+
+
+def _verify_response_or_raise(response: aiohttp.ClientResponse, body: bytes) -> None:
+    """
+    Verify that the response is valid.
+
+    A JSON-RPC error in the body of a failed response takes precedence over its
+    status, so access errors still lead to a new login. The body of a successful
+    response is decoded and checked for errors when it is parsed.
+    """
     if response.status in (401, 403):
         msg = "Invalid credentials"
         raise UbiquitiMobileApiClientAuthenticationError(
             msg,
         )
 
+    if not response.ok:
+        # Bodies that are not JSON fall through to the status error.
+        with contextlib.suppress(UbiquitiMobileApiClientCommunicationError):
+            _decode_or_raise(body)
+
+    response.raise_for_status()
+
+
+def _decode_or_raise(body: bytes) -> Any:
+    """Decode a response body, raising for JSON-RPC errors."""
+    try:
+        data = json.loads(body)
+    except ValueError as exception:
+        msg = f"Invalid response from gateway - {exception}"
+        raise UbiquitiMobileApiClientCommunicationError(
+            msg,
+        ) from exception
+
     # Handle response errors including authentication
-    data = await response.json()
     if "error" in data:
         if (
             data["error"]["message"] == "Access denied"
@@ -74,53 +109,73 @@ async def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
             msg,
         )
 
-    response.raise_for_status()
+    return data
+
+
+def _parse_response[T](adapter: TypeAdapter[T], body: bytes) -> T:
+    """Decode a response body and validate it."""
+    return adapter.validate_python(_decode_or_raise(body))
+
+
+# The response validators are built once, when the module is imported; Home
+# Assistant imports integrations in an executor thread, so neither the event loop
+# nor the polls pay for building them.
+_parse_device_info = partial(
+    _parse_response, TypeAdapter(Response[GetDeviceInfoResponse, Any])
+)
+_parse_gps_info = partial(
+    _parse_response, TypeAdapter(Response[GetGPSInfoResponse, Any])
+)
+_parse_high_info = partial(
+    _parse_response, TypeAdapter(Response[GetHighInfoResponse, Any])
+)
+_parse_session = partial(_parse_response, TypeAdapter(Response[SessionResult, Any]))
+
+# The uimqtt request bodies never change, so they are only serialized once.
+DEVICE_INFO_REQUEST = GetDeviceInfoRequest().model_dump()
+GPS_INFO_REQUEST = GetGPSInfoRequest().model_dump()
+HIGH_INFO_REQUEST = GetHighInfoRequest().model_dump()
 
 
 class UbiquitiMobileApiClient:
     """API client for Ubiquiti Mobile Gateway."""
 
     def __init__(
-        self, session_data: SessionData, session: aiohttp.ClientSession
+        self,
+        session_data: SessionData,
+        session: aiohttp.ClientSession,
+        capture: PayloadCapture | None = None,
     ) -> None:
         """Initialize the API client."""
         self._session_data: SessionData = session_data
         self._session = session
+        self.capture = capture
 
     async def get_device_info(self) -> Response[GetDeviceInfoResponse, Any]:
         """Call GetDeviceInfo using the router API."""
-        response_dict = await self._api_wrapper(
+        return await self._api_wrapper(
             method=UIMQTT_METHOD,
             path=UIMQTT_PATH,
-            data=GetDeviceInfoRequest().model_dump(),
-        )
-
-        return TypeAdapter(Response[GetDeviceInfoResponse, Any]).validate_python(
-            response_dict
+            data=DEVICE_INFO_REQUEST,
+            parse=_parse_device_info,
         )
 
     async def get_gps_info(self) -> Response[GetGPSInfoResponse, Any]:
         """Call GetGPSInfo using the router API."""
-        response_dict = await self._api_wrapper(
+        return await self._api_wrapper(
             method=UIMQTT_METHOD,
             path=UIMQTT_PATH,
-            data=GetGPSInfoRequest().model_dump(),
-        )
-
-        return TypeAdapter(Response[GetGPSInfoResponse, Any]).validate_python(
-            response_dict
+            data=GPS_INFO_REQUEST,
+            parse=_parse_gps_info,
         )
 
     async def get_high_info(self) -> Response[GetHighInfoResponse, Any]:
         """Call InfoHighDump using the router API."""
-        response_dict = await self._api_wrapper(
+        return await self._api_wrapper(
             method=UIMQTT_METHOD,
             path=UIMQTT_PATH,
-            data=GetHighInfoRequest().model_dump(),
-        )
-
-        return TypeAdapter(Response[GetHighInfoResponse, Any]).validate_python(
-            response_dict
+            data=HIGH_INFO_REQUEST,
+            parse=_parse_high_info,
         )
 
     async def async_start_session(self) -> Response[SessionResult, Any]:
@@ -143,7 +198,7 @@ class UbiquitiMobileApiClient:
                 # Send a request to get a new session token. Verify the response is a
                 # 200 ok and that it has the correct data. Then save the token to self
                 # and return.
-                async with async_timeout.timeout(10):
+                async with asyncio.timeout(10):
                     response = await self._session.request(
                         ssl=False,
                         method=SESSION_METHOD,
@@ -153,11 +208,10 @@ class UbiquitiMobileApiClient:
                         },
                         json=req_model.model_dump(),
                     )
-                    await _verify_response_or_raise(response)
+                    body = await response.read()
+                    _verify_response_or_raise(response, body)
 
-                    json_data = await response.json()
-
-                    resp_model = Response[SessionResult, Any](**json_data)
+                    resp_model = _parse_session(body)
 
                     if resp_model.result is None:
                         msg = "No result returned from gateway"
@@ -187,32 +241,28 @@ class UbiquitiMobileApiClient:
                 msg,
             )
 
-    async def _api_wrapper(
+    async def _api_wrapper[T](
         self,
         method: str,
         path: str,
         data: dict | None = None,
-    ) -> Any:
-        """Get information from the API. If not authenticated, attempt to do so."""
+        parse: Callable[[bytes], T] = _decode_or_raise,
+    ) -> T:
+        """
+        Get information from the API. If not authenticated, attempt to do so.
+
+        The response body is handed to parse, which runs in the executor for bodies
+        of at least PARSE_IN_EXECUTOR_BYTES.
+        """
         # If we do not have a session token, then try to get one
         if self._session_data.token is None:
             await self.async_start_session()
 
         try:
-            async with async_timeout.timeout(10):
-                response = await self._session.request(
-                    ssl=False,
-                    method=method,
-                    url=f"https://{self._session_data.host}{path}",
-                    headers={
-                        "Content-type": "application/json; charset=UTF-8",
-                        "Authorization": "Bearer "
-                        + (self._session_data.token or "none"),
-                    },
-                    json=data,
-                )
-                await _verify_response_or_raise(response)
-                return await response.json()
+            body = await self._api_request(method, path, data)
+            if len(body) < PARSE_IN_EXECUTOR_BYTES:
+                return parse(body)
+            return await asyncio.get_running_loop().run_in_executor(None, parse, body)
 
         except TimeoutError as exception:
             msg = f"Timeout error fetching information - {exception}"
@@ -230,4 +280,34 @@ class UbiquitiMobileApiClient:
             # This will throw an authentication error if it can't sign in. Because it is
             # not protected with a try/except, recursion won't occur in that case
             await self.async_start_session()
-            return await self._api_wrapper(method, path, data)
+            return await self._api_wrapper(method, path, data, parse)
+
+    async def _api_request(
+        self,
+        method: str,
+        path: str,
+        data: dict | None = None,
+    ) -> bytes:
+        """Send a request to the API and return the raw response body."""
+        started = time.monotonic()
+        async with asyncio.timeout(10):
+            response = await self._session.request(
+                ssl=False,
+                method=method,
+                url=f"https://{self._session_data.host}{path}",
+                headers={
+                    "Content-type": "application/json; charset=UTF-8",
+                    "Authorization": "Bearer " + (self._session_data.token or "none"),
+                },
+                json=data,
+            )
+            body = await response.read()
+            _verify_response_or_raise(response, body)
+
+        if self.capture is not None:
+            self.capture.record(
+                (data or {}).get("method", path),
+                body,
+                time.monotonic() - started,
+            )
+        return body
@@ -0,0 +1,147 @@
+"""Raw payload capture for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+# Keys whose values are replaced before a payload is written.
+REDACTED_KEYS = frozenset(
+    {
+        "lte_apn_password",
+        "password",
+        "token",
+        "ubus_rpc_session",
+    }
+)
+REDACTED = "**REDACTED**"
+# Captured responses are written in batches at most this often, in seconds.
+CAPTURE_FLUSH_SECONDS = 30
+# A capture file is rotated once it grows past this size; CAPTURE_BACKUPS older
+# files are kept.
+CAPTURE_MAX_BYTES = 20 * 1024 * 1024
+CAPTURE_BACKUPS = 3
+
+
+def capture_path(hass: HomeAssistant, entry_id: str) -> Path:
+    """Return the capture file of an entry."""
+    return Path(hass.config.path(DOMAIN, f"capture_{entry_id}.jsonl.gz"))
+
+
+def _backup_path(path: Path, index: int) -> Path:
+    """Return a rotated capture file, 1 being the most recent."""
+    return path.with_name(f"{path.name}.{index}")
+
+
+def remove_capture(path: Path) -> None:
+    """Delete a capture file and its rotated backups."""
+    path.unlink(missing_ok=True)
+    for index in range(1, CAPTURE_BACKUPS + 1):
+        _backup_path(path, index).unlink(missing_ok=True)
+
+
+def redact(value: Any) -> Any:
+    """Return a copy of a decoded payload with secrets replaced."""
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if key in REDACTED_KEYS else redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+    return value
+
+
+class PayloadCapture:
+    """
+    Append raw RPC responses to a rolling, gzip-compressed JSON lines file.
+
+    Recording only keeps a reference to the raw response body. Decoding, redaction,
+    compression and file I/O happen in batches in the default executor, so the event
+    loop only pays for appending to a list.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the capture."""
+        self._path = path
+        self._pending: list[tuple[float, str, float, bytes]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Future[None] | None = None
+
+    def record(self, method: str, body: bytes, latency: float) -> None:
+        """Queue a response body for writing."""
+        self._pending.append((time.time(), method, latency, body))
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                CAPTURE_FLUSH_SECONDS, self._schedule_flush
+            )
+
+    def _schedule_flush(self) -> None:
+        """Write the pending batch in the executor."""
+        self._flush_handle = None
+        if not self._pending:
+            return
+        loop = asyncio.get_running_loop()
+        if self._flush_task is not None and not self._flush_task.done():
+            # The previous batch is still being written; try again later.
+            self._flush_handle = loop.call_later(
+                CAPTURE_FLUSH_SECONDS, self._schedule_flush
+            )
+            return
+        batch, self._pending = self._pending, []
+        self._flush_task = loop.run_in_executor(None, self._write, batch)
+
+    async def async_close(self) -> None:
+        """Write any pending responses and stop the flush timer."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        if self._flush_task is not None:
+            await self._flush_task
+        self._schedule_flush()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        if self._flush_task is not None:
+            await self._flush_task
+
+    def _write(self, batch: list[tuple[float, str, float, bytes]]) -> None:
+        """Redact and append a batch, rotating the file when it is too large."""
+        lines = []
+        for timestamp, method, latency, body in batch:
+            try:
+                response = redact(json.loads(body))
+            except ValueError:
+                response = body.decode(errors="replace")
+            lines.append(
+                json.dumps(
+                    {
+                        "ts": timestamp,
+                        "method": method,
+                        "latency": round(latency, 6),
+                        "response": response,
+                    },
+                    separators=(",", ":"),
+                )
+            )
+
+        path = self._path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists() and path.stat().st_size > CAPTURE_MAX_BYTES:
+            for index in range(CAPTURE_BACKUPS - 1, 0, -1):
+                older = _backup_path(path, index)
+                if older.exists():
+                    older.replace(_backup_path(path, index + 1))
+            path.replace(_backup_path(path, 1))
+
+        # Each batch is appended as its own gzip member; readers such as gzip.open
+        # and zcat treat the concatenation as a single stream.
+        with gzip.open(path, "at", encoding="utf-8") as capture:
+            capture.write("\n".join(lines) + "\n")
@@ -0,0 +1,85 @@
+"""Client join and leave events for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from custom_components.ubiquiti_mobile.model.uimqtt import HighClientInfo
+
+CLIENT_EVENT_JOINED = "client_joined"
+CLIENT_EVENT_LEFT = "client_left"
+CLIENT_EVENT_CHANGED = "client_changed"
+
+
+class ClientIdentity(NamedTuple):
+    """The client fields carried by client events."""
+
+    host_name: str
+    ip: str
+    connection: str
+
+
+class ClientEventTracker:
+    """
+    Diff consecutive client tables into joined, left and changed events.
+
+    Each sample is compared with the previous one in a single pass: every reported
+    client is popped from the previous table, so whatever remains afterwards has
+    left. Unlike the device trackers, no consider-home period is applied; a client
+    that misses one sample leaves and joins again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._clients: dict[str, ClientIdentity] | None = None
+
+    def update(self, clients: Iterable[HighClientInfo]) -> list[dict[str, Any]]:
+        """Record the clients of a new sample and return events for the changes."""
+        previous = self._clients
+        current: dict[str, ClientIdentity] = {}
+        events: list[dict[str, Any]] = []
+
+        for client in clients:
+            mac = client.mac.lower()
+            if not mac or mac in current:
+                continue
+            identity = ClientIdentity(client.host_name, client.ip, client.connection)
+            current[mac] = identity
+            if previous is None:
+                continue
+
+            before = previous.pop(mac, None)
+            if before is None:
+                events.append(_event(CLIENT_EVENT_JOINED, mac, identity))
+            elif before != identity:
+                event = _event(CLIENT_EVENT_CHANGED, mac, identity)
+                event["changed"] = [
+                    field
+                    for field, old, new in zip(
+                        ClientIdentity._fields, before, identity, strict=True
+                    )
+                    if old != new
+                ]
+                events.append(event)
+
+        if previous:
+            events.extend(
+                _event(CLIENT_EVENT_LEFT, mac, identity)
+                for mac, identity in previous.items()
+            )
+        self._clients = current
+        return events
+
+
+def _event(event_type: str, mac: str, identity: ClientIdentity) -> dict[str, Any]:
+    """Return the data of a client event."""
+    return {
+        "type": event_type,
+        "mac": mac,
+        "host_name": identity.host_name,
+        "ip": identity.ip,
+        "connection": identity.connection,
+    }
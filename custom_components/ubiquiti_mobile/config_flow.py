@@ -6,13 +6,34 @@ from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from custom_components.ubiquiti_mobile.data import SessionData
 
 from .api import UbiquitiMobileApiClient
-from .const import DOMAIN
+from .const import (
+    CONF_CAPTURE,
+    CONF_CLIENT_ALLOWLIST,
+    CONF_COMPACT_CLIENTS,
+    CONF_CONSIDER_HOME,
+    CONF_DATA_CAP,
+    CONF_FAST_START,
+    CONF_STATISTICS_ONLY,
+    CONF_TRACK_SPILL,
+    CONF_USAGE_STATISTICS,
+    DEFAULT_CAPTURE,
+    DEFAULT_CLIENT_ALLOWLIST,
+    DEFAULT_COMPACT_CLIENTS,
+    DEFAULT_CONSIDER_HOME,
+    DEFAULT_DATA_CAP,
+    DEFAULT_FAST_START,
+    DEFAULT_STATISTICS_ONLY,
+    DEFAULT_TRACK_SPILL,
+    DEFAULT_USAGE_STATISTICS,
+    DOMAIN,
+)
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigFlowResult
@@ -23,6 +44,14 @@ class UbiquitiMobileConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,  # noqa: ARG004
+    ) -> UbiquitiMobileOptionsFlow:
+        """Return the options flow for this handler."""
+        return UbiquitiMobileOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -75,3 +104,80 @@ class UbiquitiMobileConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="user", data_schema=data_schema, errors=errors
         )
+
+
+class UbiquitiMobileOptionsFlow(config_entries.OptionsFlow):
+    """Handle options for an existing Ubiquiti Mobile Gateway entry."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the integration options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        data_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_CONSIDER_HOME,
+                    default=options.get(CONF_CONSIDER_HOME, DEFAULT_CONSIDER_HOME),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=3600,
+                        step=1,
+                        unit_of_measurement="s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    ),
+                ),
+                vol.Required(
+                    CONF_TRACK_SPILL,
+                    default=options.get(CONF_TRACK_SPILL, DEFAULT_TRACK_SPILL),
+                ): selector.BooleanSelector(),
+                vol.Required(
+                    CONF_FAST_START,
+                    default=options.get(CONF_FAST_START, DEFAULT_FAST_START),
+                ): selector.BooleanSelector(),
+                vol.Required(
+                    CONF_DATA_CAP,
+                    default=options.get(CONF_DATA_CAP, DEFAULT_DATA_CAP),
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        step=0.1,
+                        unit_of_measurement="GB",
+                        mode=selector.NumberSelectorMode.BOX,
+                    ),
+                ),
+                vol.Required(
+                    CONF_CAPTURE,
+                    default=options.get(CONF_CAPTURE, DEFAULT_CAPTURE),
+                ): selector.BooleanSelector(),
+                vol.Required(
+                    CONF_COMPACT_CLIENTS,
+                    default=options.get(CONF_COMPACT_CLIENTS, DEFAULT_COMPACT_CLIENTS),
+                ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_CLIENT_ALLOWLIST,
+                    default=options.get(
+                        CONF_CLIENT_ALLOWLIST, DEFAULT_CLIENT_ALLOWLIST
+                    ),
+                ): selector.TextSelector(
+                    selector.TextSelectorConfig(
+                        type=selector.TextSelectorType.TEXT, multiple=True
+                    ),
+                ),
+                vol.Required(
+                    CONF_USAGE_STATISTICS,
+                    default=options.get(
+                        CONF_USAGE_STATISTICS, DEFAULT_USAGE_STATISTICS
+                    ),
+                ): selector.BooleanSelector(),
+                vol.Required(
+                    CONF_STATISTICS_ONLY,
+                    default=options.get(CONF_STATISTICS_ONLY, DEFAULT_STATISTICS_ONLY),
+                ): selector.BooleanSelector(),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=data_schema)
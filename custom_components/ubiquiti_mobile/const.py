@@ -6,6 +6,39 @@ LOGGER: Logger = getLogger(__package__)
 
 DOMAIN = "ubiquiti_mobile"
 
+EVENT_RADIO = f"{DOMAIN}_radio_event"
+EVENT_CLIENT = f"{DOMAIN}_client_event"
+
 CONF_HOST = "host"
+CONF_CONSIDER_HOME = "consider_home"
+CONF_TRACK_SPILL = "track_spill"
+CONF_FAST_START = "fast_start"
+CONF_DATA_CAP = "data_cap"
+CONF_CAPTURE = "capture"
+CONF_COMPACT_CLIENTS = "compact_clients"
+CONF_CLIENT_ALLOWLIST = "client_allowlist"
+CONF_USAGE_STATISTICS = "usage_statistics"
+CONF_STATISTICS_ONLY = "statistics_only"
+
+DEFAULT_CONSIDER_HOME = 180
+DEFAULT_TRACK_SPILL = False
+DEFAULT_FAST_START = False
+DEFAULT_DATA_CAP = 0
+DEFAULT_CAPTURE = False
+DEFAULT_COMPACT_CLIENTS = False
+DEFAULT_CLIENT_ALLOWLIST: list[str] = []
+DEFAULT_USAGE_STATISTICS = False
+DEFAULT_STATISTICS_ONLY = False
+
+# Sensors that are not created in statistics only mode: the tags of the gateway
+# usage sensors and the keys of the client usage sensors.
+USAGE_SENSOR_TAGS = frozenset({"data_usage", "upload_usage", "download_usage"})
+CLIENT_USAGE_SENSOR_KEYS = frozenset({"rx_total", "tx_total"})
+
+# Gateway fields that identify the subscriber or the device. They are not exposed
+# as sensors, so they do not end up in the state history.
+IDENTIFIER_FIELDS = frozenset(
+    {"device_ac", "iccid", "imei", "imsi", "lte_apn_username"}
+)
 
 PLATFORMS: list[str] = ["sensor"]  # later you can add switch, binary_sensor, etc.
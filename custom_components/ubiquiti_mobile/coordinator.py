@@ -2,16 +2,64 @@
 
 from __future__ import annotations
 
+import math
+import time
+from dataclasses import replace
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from custom_components.ubiquiti_mobile.const import DOMAIN, LOGGER
+from custom_components.ubiquiti_mobile.client_events import ClientEventTracker
+from custom_components.ubiquiti_mobile.const import (
+    CONF_CLIENT_ALLOWLIST,
+    CONF_COMPACT_CLIENTS,
+    CONF_CONSIDER_HOME,
+    CONF_DATA_CAP,
+    CONF_FAST_START,
+    CONF_STATISTICS_ONLY,
+    CONF_TRACK_SPILL,
+    DEFAULT_CLIENT_ALLOWLIST,
+    DEFAULT_COMPACT_CLIENTS,
+    DEFAULT_CONSIDER_HOME,
+    DEFAULT_DATA_CAP,
+    DEFAULT_FAST_START,
+    DEFAULT_STATISTICS_ONLY,
+    DEFAULT_TRACK_SPILL,
+    DOMAIN,
+    EVENT_CLIENT,
+    EVENT_RADIO,
+    LOGGER,
+)
 from custom_components.ubiquiti_mobile.data import (
     UbiquitiMobileStateData,
+    clients_by_mac,
+)
+from custom_components.ubiquiti_mobile.gps import GpsFilter, GpsFix
+from custom_components.ubiquiti_mobile.link_quality import LinkQualityAnalyzer
+from custom_components.ubiquiti_mobile.model.uimqtt import (
+    GetDeviceInfoResponse,
+    GetGPSInfoResponse,
+    GetHighInfoResponse,
 )
+from custom_components.ubiquiti_mobile.occupancy import wifi_occupancy
+from custom_components.ubiquiti_mobile.polling import (
+    DEFAULT_POLL_SECONDS,
+    GPS_POLL_SECONDS,
+    LoadController,
+    SamplePhaseLock,
+)
+from custom_components.ubiquiti_mobile.presence import ClientPresenceTracker
+from custom_components.ubiquiti_mobile.projection import UsageProjector
+from custom_components.ubiquiti_mobile.radio import RadioTracker
+from custom_components.ubiquiti_mobile.talkers import top_talkers
+from custom_components.ubiquiti_mobile.timestamps import TimestampTracker
+from custom_components.ubiquiti_mobile.track import GpsTrack, track_spill_path
+from custom_components.ubiquiti_mobile.usage import ClientUsageAccountant
 
 from .api import (
     UbiquitiMobileApiClient,
@@ -23,10 +71,23 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from .data import UbiquitiMobileConfigEntry
+    from .usage_statistics import UsageStatisticsImporter
+
+SNAPSHOT_STORAGE_VERSION = 1
+# Clients that have not been reported for this long are forgotten, together with
+# their usage totals, device and entities.
+CLIENT_EXPIRY_SECONDS = 30 * 86400
+# Minimum time between two snapshot writes, in seconds.
+SNAPSHOT_SAVE_INTERVAL = 300
+
+
+def snapshot_storage_key(entry_id: str) -> str:
+    """Return the storage key for the persisted snapshot of an entry."""
+    return f"{DOMAIN}.{entry_id}.snapshot"
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-class UbiquitiDataUpdateCoordinator(DataUpdateCoordinator):
+class UbiquitiDataUpdateCoordinator(DataUpdateCoordinator[UbiquitiMobileStateData]):
     """Class to manage fetching data from the API."""
 
     config_entry: UbiquitiMobileConfigEntry
@@ -36,32 +97,338 @@ class UbiquitiDataUpdateCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         client: UbiquitiMobileApiClient,
         config_entry: UbiquitiMobileConfigEntry,
+        usage_statistics: UsageStatisticsImporter | None = None,
     ) -> None:
         """Initialize."""
         super().__init__(
             hass=hass,
             logger=LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=5),
+            update_interval=timedelta(seconds=DEFAULT_POLL_SECONDS),
             config_entry=config_entry,
-            always_update=True,
+            # Polls that return an already seen sample hand back the previous data
+            # object, which lets the coordinator skip notifying listeners.
+            always_update=False,
         )
 
         self.client = client
+        self.phase_lock = SamplePhaseLock()
+        self.load_controller = LoadController()
+        # Set when the next poll falls between two samples and only reads GPS.
+        self._gps_only = False
+        self._gps_polled_at: float | None = None
+        self.gps_filter = GpsFilter()
+        self.track = GpsTrack(
+            hass,
+            spill_path=track_spill_path(hass, config_entry.entry_id)
+            if config_entry.options.get(CONF_TRACK_SPILL, DEFAULT_TRACK_SPILL)
+            else None,
+        )
+        self.presence = ClientPresenceTracker(
+            consider_home=config_entry.options.get(
+                CONF_CONSIDER_HOME, DEFAULT_CONSIDER_HOME
+            )
+        )
+        self.usage = ClientUsageAccountant(hass, config_entry.entry_id)
+        # The data cap is configured in gigabytes.
+        data_cap = config_entry.options.get(CONF_DATA_CAP, DEFAULT_DATA_CAP)
+        # Hourly usage statistics are imported when the entry set up an importer. In
+        # statistics only mode the usage counter sensors are not created, so their
+        # states are never recorded.
+        self.usage_statistics = usage_statistics
+        self.statistics_only = self.usage_statistics is not None and (
+            config_entry.options.get(CONF_STATISTICS_ONLY, DEFAULT_STATISTICS_ONLY)
+        )
+        self.projector = UsageProjector(
+            data_cap=int(data_cap * 1_000_000_000) if data_cap else None
+        )
+        self.link_quality = LinkQualityAnalyzer()
+        self.radio = RadioTracker()
+        self.client_events = ClientEventTracker()
+        self.timestamps = TimestampTracker()
+        # In compact mode only allowlisted clients get their own entities; all
+        # clients are listed by the client table sensor.
+        self.compact_clients = config_entry.options.get(
+            CONF_COMPACT_CLIENTS, DEFAULT_COMPACT_CLIENTS
+        )
+        self.client_allowlist = frozenset(
+            dr.format_mac(mac.strip())
+            for mac in config_entry.options.get(
+                CONF_CLIENT_ALLOWLIST, DEFAULT_CLIENT_ALLOWLIST
+            )
+            if mac.strip()
+        )
+        # MACs and MAC/metric keys that the platforms already created entities for.
+        self.tracked_clients: set[str] = set()
+        self.tracked_client_metrics: set[str] = set()
+        self.client_expiry = CLIENT_EXPIRY_SECONDS
+
+        self.fast_start = config_entry.options.get(CONF_FAST_START, DEFAULT_FAST_START)
+        self._snapshot_store: Store[dict[str, Any]] = Store(
+            hass, SNAPSHOT_STORAGE_VERSION, snapshot_storage_key(config_entry.entry_id)
+        )
+        self._snapshot_saved_at: float | None = None
+
+    def has_client_entities(self, mac: str) -> bool:
+        """Return True if a client gets its own tracker and sensors."""
+        return not self.compact_clients or mac in self.client_allowlist
+
+    async def async_restore_snapshot(self) -> bool:
+        """
+        Load the last persisted snapshot as the coordinator data.
+
+        Returns False if there is no usable snapshot, in which case the caller should
+        wait for a live refresh instead.
+        """
+        stored = await self._snapshot_store.async_load()
+        if not stored or not stored.get("info"):
+            return False
+
+        try:
+            state_data = UbiquitiMobileStateData(
+                info=GetDeviceInfoResponse.model_validate(stored["info"]),
+                gps=GetGPSInfoResponse.model_validate(stored["gps"])
+                if stored.get("gps")
+                else None,
+                high=GetHighInfoResponse.model_validate(stored["high"])
+                if stored.get("high")
+                else None,
+                location=GpsFix(**stored["location"])
+                if stored.get("location")
+                else None,
+            )
+        except (TypeError, ValueError) as exception:
+            LOGGER.warning(f"Ignoring unreadable snapshot - {exception}")
+            return False
+
+        self.gps_filter.published = state_data.location
+        if state_data.high is not None:
+            self.presence.update(
+                state_data.high.client_details,
+                dt_util.utcnow().timestamp(),
+                state_data.high.sample_time,
+            )
+            self.timestamps.update(state_data.high)
+            state_data.boot_time = self.timestamps.boot_time
+            state_data.associated_at = self.presence.connected_since()
+            state_data.clients = clients_by_mac(state_data.high)
+
+        self.data = state_data
+        return True
+
+    def _async_save_snapshot(self, state_data: UbiquitiMobileStateData) -> None:
+        """Persist the latest data, at most once every SNAPSHOT_SAVE_INTERVAL."""
+        now = time.monotonic()
+        if (
+            self._snapshot_saved_at is not None
+            and now - self._snapshot_saved_at < SNAPSHOT_SAVE_INTERVAL
+        ):
+            return
+        self._snapshot_saved_at = now
 
-    async def _async_update_data(self) -> Any:
+        def _snapshot() -> dict[str, Any]:
+            location = state_data.location
+            return {
+                "info": state_data.info.model_dump() if state_data.info else None,
+                "gps": state_data.gps.model_dump() if state_data.gps else None,
+                "high": state_data.high.model_dump() if state_data.high else None,
+                "location": {
+                    "latitude": location.latitude,
+                    "longitude": location.longitude,
+                    "accuracy": location.accuracy,
+                    "timestamp": location.timestamp,
+                }
+                if location
+                else None,
+            }
+
+        self._snapshot_store.async_delay_save(_snapshot)
+
+    async def _async_update_data(self) -> UbiquitiMobileStateData:
         """Update data via library."""
         try:
-            info = await self.client.get_device_info()
-            gps = await self.client.get_gps_info()
+            if self._gps_only and self.data:
+                # No new sample is due yet; only follow the GPS position.
+                state_data = await self._async_update_location(self.data)
+                self._schedule_next_poll()
+                return state_data
+
+            started = time.monotonic()
             high = await self.client.get_high_info()
+            latency = time.monotonic() - started
 
-            state_data: UbiquitiMobileStateData = UbiquitiMobileStateData(
-                info=info.result, gps=gps.result, high=high.result
+            now = dt_util.utcnow().timestamp()
+            fresh = high.result is None or self.phase_lock.update(
+                high.result.sample_time, high.result.sample_interval_second, now
             )
+            # A repeated sample carries the same load readings, so it must not
+            # push the controller further.
+            if fresh:
+                self.load_controller.update(
+                    cpu=high.result.cpu if high.result else None,
+                    memory=high.result.memory if high.result else None,
+                    latency=latency,
+                )
+            decision = self.load_controller.decision
+            if not fresh and self.data:
+                # The gateway has not taken a new sample since the last poll, but
+                # the GPS position is read live and may have moved. Retries for a late
+                # sample only read it at the GPS poll interval.
+                state_data = await self._async_update_location(
+                    self.data, GPS_POLL_SECONDS
+                )
+                self._schedule_next_poll()
+                return state_data
 
-            return vars(state_data)
+            # Device info rarely changes, so it is skipped while the gateway is
+            # under load and the previous result is reused.
+            if decision.defer_low_priority and self.data and self.data.info:
+                info_result = self.data.info
+            else:
+                info_result = (await self.client.get_device_info()).result
+            gps, location = await self._async_poll_gps()
+
+            if high.result is not None:
+                self.presence.update(
+                    high.result.client_details, now, high.result.sample_time
+                )
+                self.usage.update(high.result.client_details, high.result.uptime, now)
+                self._async_expire_clients(now)
+                if self.usage_statistics is not None:
+                    self.usage_statistics.update(
+                        high.result, self.usage, dt_util.utcnow()
+                    )
+                projection = self.projector.update(high.result)
+                link_quality = self.link_quality.update(high.result)
+                talkers = top_talkers(high.result.client_details)
+                occupancy = wifi_occupancy(high.result.client_details)
+                self.timestamps.update(high.result)
+                self._fire_events(high.result)
+            else:
+                projection = None
+                link_quality = self.link_quality.quality
+                talkers = None
+                occupancy = None
+
+            state_data: UbiquitiMobileStateData = UbiquitiMobileStateData(
+                info=info_result,
+                gps=gps,
+                high=high.result,
+                location=location,
+                polling=decision,
+                projection=projection,
+                link_quality=link_quality,
+                radio=self.radio.state,
+                talkers=talkers,
+                occupancy=occupancy,
+                boot_time=self.timestamps.boot_time,
+                associated_at=self.presence.connected_since(),
+                clients=clients_by_mac(high.result) if high.result else None,
+            )
         except UbiquitiMobileApiClientAuthenticationError as exception:
             raise ConfigEntryAuthFailed(exception) from exception
         except UbiquitiMobileApiClientError as exception:
             raise UpdateFailed(exception) from exception
+
+        if self.fast_start:
+            self._async_save_snapshot(state_data)
+
+        self._schedule_next_poll()
+        return state_data
+
+    async def _async_poll_gps(
+        self,
+    ) -> tuple[GetGPSInfoResponse | None, GpsFix | None]:
+        """Read the GPS position and record it in the track if it moved."""
+        self._gps_polled_at = time.monotonic()
+        gps = (await self.client.get_gps_info()).result
+        previous_location = self.gps_filter.published
+        location = self.gps_filter.update(gps) if gps is not None else previous_location
+        if location is not None and location is not previous_location:
+            self.track.append(location)
+            await self.track.async_flush()
+        return gps, location
+
+    async def _async_update_location(
+        self, data: UbiquitiMobileStateData, min_age: float = 0.0
+    ) -> UbiquitiMobileStateData:
+        """
+        Return the data with the latest GPS position.
+
+        GPS is only read if the last GPS poll is at least min_age seconds old. The
+        data object is returned unchanged if the position did not change, so the
+        coordinator does not notify its listeners.
+        """
+        if (
+            self._gps_polled_at is not None
+            and time.monotonic() - self._gps_polled_at < min_age
+        ):
+            return data
+        gps, location = await self._async_poll_gps()
+        if gps == data.gps and location is data.location:
+            return data
+        return replace(data, gps=gps, location=location)
+
+    def _async_expire_clients(self, now: float) -> None:
+        """
+        Forget the clients that have not been reported for client_expiry seconds.
+
+        The usage accountant persists when each client was last seen, so clients
+        also expire across restarts. Their devices are removed from the registry,
+        which removes their entities as well.
+        """
+        expired = self.usage.expire(now - self.client_expiry)
+        if not expired:
+            return
+
+        self.presence.forget(expired)
+        self.tracked_clients.difference_update(expired)
+        sanitized = [mac.replace(":", "") for mac in expired]
+        prefixes = tuple(f"{mac}_" for mac in sanitized)
+        self.tracked_client_metrics.difference_update(
+            [key for key in self.tracked_client_metrics if key.startswith(prefixes)]
+        )
+
+        device_registry = dr.async_get(self.hass)
+        entry_id = self.config_entry.entry_id
+        for mac in sanitized:
+            device = device_registry.async_get_device(
+                identifiers={(DOMAIN, f"{entry_id}_client_{mac}")}
+            )
+            if device is not None:
+                device_registry.async_update_device(
+                    device.id, remove_config_entry_id=entry_id
+                )
+
+    def _fire_events(self, high: GetHighInfoResponse) -> None:
+        """Fire the radio and client events of a new sample."""
+        for event in self.radio.update(high):
+            self.hass.bus.async_fire(
+                EVENT_RADIO,
+                {"config_entry_id": self.config_entry.entry_id, **event},
+            )
+        for event in self.client_events.update(high.client_details):
+            self.hass.bus.async_fire(
+                EVENT_CLIENT,
+                {"config_entry_id": self.config_entry.entry_id, **event},
+            )
+
+    def _schedule_next_poll(self) -> None:
+        """
+        Set the delay until the next poll.
+
+        The phase lock aims at an absolute point in time, while the coordinator
+        starts counting update_interval once the update has finished, so the delay is
+        computed from the time the update finishes rather than from the sample time.
+
+        If the next sample is further away than the GPS poll interval, the wait is
+        split into equal parts and the polls in between only read GPS. Equal parts
+        keep the last of them well clear of the sample poll.
+        """
+        decision = self.load_controller.decision
+        delay = self.phase_lock.next_delay(dt_util.utcnow().timestamp()) + (
+            decision.factor - 1
+        ) * (self.phase_lock.sample_interval or DEFAULT_POLL_SECONDS)
+        polls = math.ceil(delay / (GPS_POLL_SECONDS * decision.factor))
+        self._gps_only = polls > 1
+        self.update_interval = timedelta(seconds=delay / polls)
@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
 
@@ -13,10 +15,18 @@ if TYPE_CHECKING:
         GetDeviceInfoResponse,
         GetGPSInfoResponse,
         GetHighInfoResponse,
+        HighClientInfo,
     )
 
     from .api import UbiquitiMobileApiClient
     from .coordinator import UbiquitiDataUpdateCoordinator
+    from .gps import GpsFix
+    from .link_quality import LinkQuality
+    from .occupancy import BandOccupancy
+    from .polling import PollingDecision
+    from .projection import UsageProjection
+    from .radio import RadioState
+    from .talkers import TopTalkers
 
 
 type UbiquitiMobileConfigEntry = ConfigEntry[UbiquitiMobileData]
@@ -50,3 +60,20 @@ class UbiquitiMobileStateData:
     info: GetDeviceInfoResponse | None = None
     gps: GetGPSInfoResponse | None = None
     high: GetHighInfoResponse | None = None
+    location: GpsFix | None = None
+    polling: PollingDecision | None = None
+    projection: UsageProjection | None = None
+    link_quality: LinkQuality | None = None
+    radio: RadioState | None = None
+    talkers: TopTalkers | None = None
+    occupancy: dict[str, BandOccupancy] | None = None
+    boot_time: datetime | None = None
+    associated_at: dict[str, datetime] | None = None
+    # The clients of the sample by lowercase MAC, so per-client entities do not
+    # scan the client table.
+    clients: dict[str, HighClientInfo] | None = None
+
+
+def clients_by_mac(high: GetHighInfoResponse) -> dict[str, HighClientInfo]:
+    """Return the clients of a sample by lowercase MAC."""
+    return {client.mac.lower(): client for client in high.client_details}
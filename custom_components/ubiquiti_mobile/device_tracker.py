@@ -10,7 +10,6 @@ from homeassistant.const import STATE_HOME, STATE_NOT_HOME
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, DeviceInfo
 
 from custom_components.ubiquiti_mobile.const import DOMAIN
-from custom_components.ubiquiti_mobile.data import UbiquitiMobileStateData
 from custom_components.ubiquiti_mobile.entity import UbiquitiMobileEntity
 
 if TYPE_CHECKING:
@@ -31,21 +30,17 @@ async def async_setup_entry(
     """Set up client trackers."""
     coordinator: UbiquitiDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     # Cache MACs so each tracker entity is only created once.
-    tracked_clients: set[str] = set()
+    tracked_clients = coordinator.tracked_clients
 
     def _handle_coordinator_update() -> None:
-        data = coordinator.data
-        if not data:
-            return
-
-        state_data = UbiquitiMobileStateData(**data)
-        if not state_data.high:
+        state_data = coordinator.data
+        if not state_data or not state_data.high:
             return
 
         new_entities: list[UbiquitiMobileClientTracker] = []
         for client in state_data.high.client_details:
             mac = client.mac.lower()
-            if mac in tracked_clients:
+            if mac in tracked_clients or not coordinator.has_client_entities(mac):
                 continue
 
             new_entities.append(
@@ -124,8 +119,8 @@ class UbiquitiMobileClientTracker(UbiquitiMobileEntity, TrackerEntity):
 
     @property
     def is_connected(self) -> bool:
-        """Return the connection state."""
-        return self._client is not None
+        """Return the connection state, honouring the consider-home period."""
+        return self.coordinator.presence.is_home(self._mac)
 
     @property
     def name(self) -> str:
@@ -141,7 +136,12 @@ class UbiquitiMobileClientTracker(UbiquitiMobileEntity, TrackerEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, str | int | None]:
-        """Return extra attributes describing the client."""
+        """
+        Return extra attributes describing the client.
+
+        Only attributes that rarely change are included, so the tracker does not
+        write a new state every poll. Traffic and signal have their own sensors.
+        """
         client = self._client
         if not client:
             return {}
@@ -152,38 +152,14 @@ class UbiquitiMobileClientTracker(UbiquitiMobileEntity, TrackerEntity):
             "hostname": client.host_name,
             "connection": client.connection,
             "link_speed": client.link_speed,
-            "rx_bytes": client.rxBytes,
-            "tx_bytes": client.txBytes,
-            "rx_rate": client.rx_rate,
-            "tx_rate": client.tx_rate,
-            "rx_packets": client.rxPackets,
-            "tx_packets": client.txPackets,
             "band": client.band,
             "channel": client.channel,
-            "signal": client.signal,
-            "score": client.score,
-            "uptime": client.uptime,
             "associated_at": client.associated_at,
             "ssid": client.ssid,
             "mode": client.mode,
-            "rx_bitrate": client.rxBitRate,
-            "tx_bitrate": client.txBitRate,
         }
 
     @property
     def _client(self) -> HighClientInfo | None:
-        """Return the current client information from the coordinator."""
-        data = self.coordinator.data
-        if not data:
-            return None
-
-        state_data = UbiquitiMobileStateData(**data)
-        if not state_data.high:
-            return None
-
-        for client in state_data.high.client_details:
-            if client.mac.lower() == self._mac:
-                return client
-
-        # Client disappeared from the latest payload.
-        return None
+        """Return the last known client information while the client is home."""
+        return self.coordinator.presence.client(self._mac)
@@ -0,0 +1,25 @@
+"""Diagnostics support for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .const import DOMAIN
+from .memory import memory_footprint
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import UbiquitiDataUpdateCoordinator
+    from .data import UbiquitiMobileConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: UbiquitiMobileConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: UbiquitiDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "options": dict(entry.options),
+        "memory": memory_footprint(coordinator).as_dict(),
+    }
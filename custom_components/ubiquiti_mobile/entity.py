@@ -5,8 +5,6 @@ from __future__ import annotations
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from custom_components.ubiquiti_mobile.data import UbiquitiMobileStateData
-
 from .coordinator import UbiquitiDataUpdateCoordinator
 
 
@@ -23,7 +21,7 @@ class UbiquitiMobileEntity(CoordinatorEntity[UbiquitiDataUpdateCoordinator]):
         """Initialize."""
         super().__init__(coordinator)
 
-        state_data = UbiquitiMobileStateData(**coordinator.data)
+        state_data = coordinator.data
 
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{tag}"
         if device_info is not None:
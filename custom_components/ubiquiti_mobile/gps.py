@@ -0,0 +1,102 @@
+"""GPS fix filtering for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.util.location import distance
+
+if TYPE_CHECKING:
+    from custom_components.ubiquiti_mobile.model.uimqtt import GetGPSInfoResponse
+
+# Fixes with a quality of 0 carry no position (NMEA "fix not available").
+MIN_QUALITY = 1
+# Fixes with a worse horizontal dilution of precision are discarded.
+MAX_HDOP = 10.0
+# Typical user equivalent range error of a consumer GPS receiver, in metres. The
+# horizontal accuracy of a fix is estimated as hdop * UERE.
+UERE_METERS = 5.0
+# How quickly the filtered position may drift, in metres per second. Larger values
+# follow the raw fixes more closely.
+PROCESS_NOISE_METERS_PER_SECOND = 3.0
+# The published position only moves once the filtered position has moved further
+# than this many times its own accuracy, and never for less than MIN_MOVEMENT_METERS.
+MOVEMENT_ACCURACY_FACTOR = 1.0
+MIN_MOVEMENT_METERS = 10.0
+
+
+@dataclass(frozen=True, slots=True)
+class GpsFix:
+    """A filtered position."""
+
+    latitude: float
+    longitude: float
+    accuracy: float
+    timestamp: int
+
+
+class GpsFilter:
+    """
+    Smooth GPS fixes and only publish meaningful movement.
+
+    Fixes are run through a single-state Kalman filter whose measurement noise is
+    derived from the reported hdop. Fixes without a valid quality, with a poor hdop,
+    or with a timestamp that is not newer than the last accepted fix are rejected.
+    The published position only changes when the filtered position moves further
+    than its accuracy, so a parked vehicle keeps a constant location.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty filter."""
+        self._latitude: float | None = None
+        self._longitude: float | None = None
+        self._variance: float = 0.0
+        self._timestamp: int | None = None
+        self.published: GpsFix | None = None
+
+    def update(self, gps: GetGPSInfoResponse) -> GpsFix | None:
+        """Feed a raw fix into the filter and return the published position."""
+        if (
+            gps.quality < MIN_QUALITY
+            or gps.hdop > MAX_HDOP
+            or (self._timestamp is not None and gps.timestamp <= self._timestamp)
+        ):
+            return self.published
+
+        measurement_variance = (max(gps.hdop, 1.0) * UERE_METERS) ** 2
+
+        if self._latitude is None or self._longitude is None or self._timestamp is None:
+            self._latitude = gps.latitude
+            self._longitude = gps.longitude
+            self._variance = measurement_variance
+        else:
+            elapsed = gps.timestamp - self._timestamp
+            self._variance += elapsed * PROCESS_NOISE_METERS_PER_SECOND**2
+            gain = self._variance / (self._variance + measurement_variance)
+            self._latitude += gain * (gps.latitude - self._latitude)
+            self._longitude += gain * (gps.longitude - self._longitude)
+            self._variance *= 1 - gain
+        self._timestamp = gps.timestamp
+
+        accuracy = math.sqrt(self._variance)
+        published = self.published
+        if published is not None:
+            moved = distance(
+                published.latitude,
+                published.longitude,
+                self._latitude,
+                self._longitude,
+            )
+            threshold = max(MIN_MOVEMENT_METERS, MOVEMENT_ACCURACY_FACTOR * accuracy)
+            if moved is not None and moved <= threshold:
+                return published
+
+        self.published = GpsFix(
+            latitude=self._latitude,
+            longitude=self._longitude,
+            accuracy=accuracy,
+            timestamp=gps.timestamp,
+        )
+        return self.published
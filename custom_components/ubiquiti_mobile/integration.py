@@ -0,0 +1,250 @@
+"""Home Assistant entry points for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.importlib import async_import_module
+from homeassistant.helpers.storage import Store
+
+from custom_components.ubiquiti_mobile.coordinator import (
+    SNAPSHOT_STORAGE_VERSION,
+    UbiquitiDataUpdateCoordinator,
+    snapshot_storage_key,
+)
+from custom_components.ubiquiti_mobile.data import SessionData
+
+from .api import UbiquitiMobileApiClient
+from .capture import PayloadCapture, capture_path, remove_capture
+from .const import (
+    CLIENT_USAGE_SENSOR_KEYS,
+    CONF_CAPTURE,
+    CONF_USAGE_STATISTICS,
+    DEFAULT_CAPTURE,
+    DEFAULT_USAGE_STATISTICS,
+    DOMAIN,
+    IDENTIFIER_FIELDS,
+    USAGE_SENSOR_TAGS,
+)
+from .services import async_setup_services
+from .track import remove_track_spill, track_spill_path
+from .usage import (
+    USAGE_STATISTICS_STORAGE_VERSION,
+    USAGE_STORAGE_VERSION,
+    usage_statistics_storage_key,
+    usage_storage_key,
+)
+from .websocket import async_end_subscriptions, async_setup_websocket_api
+
+if TYPE_CHECKING:
+    from homeassistant.core import Event, HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
+
+    from .data import UbiquitiMobileConfigEntry
+
+PLATFORMS: list[Platform] = [
+    Platform.SENSOR,
+    Platform.DEVICE_TRACKER,
+    # Platform.BINARY_SENSOR,
+    # Platform.SWITCH,
+]
+
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Set up the Ubiquiti Mobile integration."""
+    await async_setup_services(hass)
+    async_setup_websocket_api(hass)
+    # The metrics endpoint is only served when the HTTP server is running, and the
+    # module serving it is only imported then.
+    if "http" in hass.config.components:
+        metrics = await async_import_module(hass, f"{__package__}.metrics")
+        metrics.async_setup_metrics_view(hass)
+    return True
+
+
+# https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
+async def async_setup_entry(
+    hass: HomeAssistant, entry: UbiquitiMobileConfigEntry
+) -> bool:
+    """Set up Ubiquiti Mobile Gateway from a config entry."""
+    session = async_get_clientsession(hass)
+
+    # Build a session data object from the session_data key in entry.data
+    session_data: SessionData = SessionData(**entry.data["session_data"])
+
+    # Optionally record the raw responses for later analysis
+    capture = None
+    if entry.options.get(CONF_CAPTURE, DEFAULT_CAPTURE):
+        capture = PayloadCapture(capture_path(hass, entry.entry_id))
+
+    # Make an API client using this session data
+    client = UbiquitiMobileApiClient(
+        session_data=session_data,
+        session=session,
+        capture=capture,
+    )
+
+    # Hourly usage statistics are imported when enabled and the recorder is running.
+    # The importer pulls in the recorder's statistics module, so it is only imported
+    # when it is used.
+    usage_statistics = None
+    if (
+        entry.options.get(CONF_USAGE_STATISTICS, DEFAULT_USAGE_STATISTICS)
+        and "recorder" in hass.config.components
+    ):
+        module = await async_import_module(hass, f"{__package__}.usage_statistics")
+        usage_statistics = module.UsageStatisticsImporter(hass, entry.entry_id)
+
+    # Create and store a coordinator that has a reference to the API client as well
+    # as the origional entry
+    hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN][entry.entry_id] = coordinator = UbiquitiDataUpdateCoordinator(
+        hass=hass,
+        client=client,
+        config_entry=entry,
+        usage_statistics=usage_statistics,
+    )
+
+    await coordinator.usage.async_load()
+    await coordinator.track.async_load()
+    if coordinator.usage_statistics is not None:
+        await coordinator.usage_statistics.async_load()
+
+    _async_remove_identifier_entities(hass, entry)
+    if coordinator.compact_clients:
+        _async_remove_compact_client_devices(hass, entry, coordinator)
+    if coordinator.statistics_only:
+        _async_remove_usage_entities(hass, entry)
+
+    if coordinator.fast_start and await coordinator.async_restore_snapshot():
+        # Entities are created from the restored snapshot straight away and the
+        # first live poll runs in the background, so an unreachable gateway does
+        # not hold up Home Assistant startup.
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
+    else:
+        # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
+        await coordinator.async_config_entry_first_refresh()
+
+        # Set up each platform that is supported by this integration
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    # Reload the entry when its options change so new settings take effect.
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
+    # Entries are not unloaded when Home Assistant stops, so the track held in
+    # memory is saved on stop as well as on unload.
+    async def _async_save_track(_event: Event) -> None:
+        await coordinator.track.async_save()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_save_track)
+    )
+
+    return True
+
+
+def _async_remove_compact_client_devices(
+    hass: HomeAssistant,
+    entry: UbiquitiMobileConfigEntry,
+    coordinator: UbiquitiDataUpdateCoordinator,
+) -> None:
+    """Remove client devices, and their entities, that are not allowlisted."""
+    device_registry = dr.async_get(hass)
+    prefix = f"{entry.entry_id}_client_"
+    allowed = {mac.replace(":", "") for mac in coordinator.client_allowlist}
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+        if any(
+            domain == DOMAIN
+            and identifier.startswith(prefix)
+            and identifier.removeprefix(prefix) not in allowed
+            for domain, identifier in device.identifiers
+        ):
+            device_registry.async_update_device(
+                device.id, remove_config_entry_id=entry.entry_id
+            )
+
+
+def _async_remove_identifier_entities(
+    hass: HomeAssistant, entry: UbiquitiMobileConfigEntry
+) -> None:
+    """Remove the sensors that earlier versions created for identifier fields."""
+    entity_registry = er.async_get(hass)
+    for field in IDENTIFIER_FIELDS:
+        if entity_id := entity_registry.async_get_entity_id(
+            Platform.SENSOR, DOMAIN, f"{entry.entry_id}_{field}"
+        ):
+            entity_registry.async_remove(entity_id)
+
+
+def _async_remove_usage_entities(
+    hass: HomeAssistant, entry: UbiquitiMobileConfigEntry
+) -> None:
+    """Remove the usage counter sensors that statistics only mode does not create."""
+    entity_registry = er.async_get(hass)
+    gateway_ids = {f"{entry.entry_id}_{tag}" for tag in USAGE_SENSOR_TAGS}
+    client_prefix = f"{entry.entry_id}_client_"
+    client_suffixes = tuple(f"_{key}" for key in CLIENT_USAGE_SENSOR_KEYS)
+    for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
+        unique_id = entity.unique_id
+        if unique_id in gateway_ids or (
+            unique_id.startswith(client_prefix) and unique_id.endswith(client_suffixes)
+        ):
+            entity_registry.async_remove(entity.entity_id)
+
+
+async def async_unload_entry(
+    hass: HomeAssistant, entry: UbiquitiMobileConfigEntry
+) -> bool:
+    """Unload a config entry."""
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+    if unload_ok:
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        async_end_subscriptions(hass, entry.entry_id)
+        await coordinator.track.async_save()
+        if coordinator.client.capture is not None:
+            await coordinator.client.capture.async_close()
+
+    return unload_ok
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, entry: UbiquitiMobileConfigEntry
+) -> None:
+    """Remove data persisted for a config entry."""
+    await Store(
+        hass, SNAPSHOT_STORAGE_VERSION, snapshot_storage_key(entry.entry_id)
+    ).async_remove()
+    await Store(
+        hass, USAGE_STORAGE_VERSION, usage_storage_key(entry.entry_id)
+    ).async_remove()
+    await hass.async_add_executor_job(
+        remove_track_spill, track_spill_path(hass, entry.entry_id)
+    )
+    await hass.async_add_executor_job(
+        remove_capture, capture_path(hass, entry.entry_id)
+    )
+    await Store(
+        hass,
+        USAGE_STATISTICS_STORAGE_VERSION,
+        usage_statistics_storage_key(entry.entry_id),
+    ).async_remove()
+
+
+async def async_reload_entry(
+    hass: HomeAssistant,
+    entry: UbiquitiMobileConfigEntry,
+) -> None:
+    """Reload config entry."""
+    await hass.config_entries.async_reload(entry.entry_id)
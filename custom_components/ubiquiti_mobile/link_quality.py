@@ -0,0 +1,135 @@
+"""Link quality analytics for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from custom_components.ubiquiti_mobile.model.uimqtt import GetHighInfoResponse
+
+# Number of intervals kept for the rolling statistics.
+LINK_QUALITY_WINDOW = 120
+# Smoothing factor of the jitter estimate, as used by RFC 3550.
+JITTER_GAIN = 1 / 16
+# latency_avg_ms is rounded to whole milliseconds, so the true mean lies within
+# half a millisecond of it.
+LATENCY_AVG_ROUNDING_MS = 0.5
+
+
+@dataclass(frozen=True, slots=True)
+class LinkQuality:
+    """Link quality derived from the gateway's latency probes."""
+
+    interval_latency: float
+    interval_packet_loss: float
+    packet_loss: float | None
+    jitter: float | None
+    latency_p50: float | None
+    latency_p95: float | None
+    latency_max: int
+
+
+def _percentile(ordered: list[float], percent: float) -> float | None:
+    """Return the nearest-rank percentile of a sorted list."""
+    if not ordered:
+        return None
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class LinkQualityAnalyzer:
+    """
+    Derive loss, jitter and latency percentiles from the latency counters.
+
+    latency_sample_count, latency_packet_loss_count and latency_avg_ms describe
+    all probes since the gateway booted, so the deltas between two InfoHighDump
+    samples describe the probes sent in that interval. The first sample, and the
+    first one after the counters fall back, only set the baseline.
+
+    The mean latency of an interval is the change in the latency sum divided by
+    the change in the probe count. The gateway only reports the sum as a mean
+    rounded to whole milliseconds, so the analyzer keeps its own estimate of the
+    sum: every interval adds the new probes at the reported mean, and the estimate
+    is then moved the least amount needed to agree with the rounded mean again.
+    A steady link therefore reports its mean latency, and a change in latency
+    shows up in the interval where the reported mean moves.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the analyzer."""
+        # Counters of the previous sample.
+        self._baseline: tuple[int, int] | None = None
+        # Estimated sum of the latency of all probes since boot, in milliseconds.
+        self._latency_sum = 0.0
+        self._jitter: float | None = None
+        self._previous_latency: float | None = None
+        self._latencies: deque[float] = deque(maxlen=LINK_QUALITY_WINDOW)
+        self._intervals: deque[tuple[int, int]] = deque()
+        self._window_samples = 0
+        self._window_losses = 0
+        self.quality: LinkQuality | None = None
+
+    def update(self, high: GetHighInfoResponse) -> LinkQuality | None:
+        """Add a sample and return the updated link quality."""
+        count = high.latency_sample_count
+        losses = high.latency_packet_loss_count
+        average = high.latency_avg_ms
+
+        baseline = self._baseline
+        self._baseline = (count, losses)
+        if baseline is None or count < baseline[0]:
+            # The counters cover everything since boot or a reset, which is not an
+            # interval of comparable length.
+            self._latency_sum = float(average * count)
+            return self.quality
+
+        previous_count, previous_losses = baseline
+        samples = count - previous_count
+        if samples <= 0:
+            # No probes completed since the last sample.
+            return self.quality
+        lost = min(max(losses - previous_losses, 0), samples)
+
+        previous_sum = self._latency_sum
+        self._latency_sum = min(
+            max(
+                previous_sum + average * samples,
+                (average - LATENCY_AVG_ROUNDING_MS) * count,
+            ),
+            (average + LATENCY_AVG_ROUNDING_MS) * count,
+        )
+        latency = min(
+            max((self._latency_sum - previous_sum) / samples, 0.0),
+            float(max(high.latency_max_ms, average)),
+        )
+        if self._previous_latency is not None:
+            difference = abs(latency - self._previous_latency)
+            jitter = self._jitter or 0.0
+            self._jitter = jitter + (difference - jitter) * JITTER_GAIN
+        self._previous_latency = latency
+        self._latencies.append(latency)
+
+        self._intervals.append((samples, lost))
+        self._window_samples += samples
+        self._window_losses += lost
+        if len(self._intervals) > LINK_QUALITY_WINDOW:
+            old_samples, old_lost = self._intervals.popleft()
+            self._window_samples -= old_samples
+            self._window_losses -= old_lost
+
+        ordered = sorted(self._latencies)
+        self.quality = LinkQuality(
+            interval_latency=latency,
+            interval_packet_loss=lost / samples * 100,
+            packet_loss=self._window_losses / self._window_samples * 100
+            if self._window_samples
+            else None,
+            jitter=self._jitter,
+            latency_p50=_percentile(ordered, 50),
+            latency_p95=_percentile(ordered, 95),
+            latency_max=high.latency_max_ms,
+        )
+        return self.quality
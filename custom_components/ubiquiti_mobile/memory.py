@@ -0,0 +1,162 @@
+"""Memory footprint instrumentation for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+import dataclasses
+import sys
+from collections import deque
+from enum import Enum
+from functools import partial
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.entity_platform import async_get_platforms
+from pydantic import BaseModel
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .coordinator import UbiquitiDataUpdateCoordinator
+
+# Objects that are shared with the rest of the process and never counted.
+_OPAQUE_TYPES = (
+    type,
+    ModuleType,
+    FunctionType,
+    MethodType,
+    BuiltinFunctionType,
+    partial,
+    Enum,
+)
+_CONTAINER_TYPES = (list, tuple, set, frozenset, deque)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class MemoryFootprint:
+    """Retained memory of a config entry by category, in bytes."""
+
+    snapshot: int
+    clients: int
+    entities: int
+    caches: int
+    client_count: int
+    entity_count: int
+
+    @property
+    def total(self) -> int:
+        """Return the retained memory of all categories."""
+        return self.snapshot + self.clients + self.entities + self.caches
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the footprint as a dictionary."""
+        return {
+            "snapshot": self.snapshot,
+            "clients": self.clients,
+            "entities": self.entities,
+            "caches": self.caches,
+            "total": self.total,
+            "client_count": self.client_count,
+            "entity_count": self.entity_count,
+        }
+
+
+def _expandable(value: Any) -> bool:
+    """Return True for objects whose attributes are owned by this integration."""
+    return (
+        isinstance(value, BaseModel)
+        or dataclasses.is_dataclass(value)
+        or type(value).__module__.startswith(__package__)
+    )
+
+
+def deep_sizeof(objects: Iterable[Any], seen: set[int]) -> int:
+    """
+    Return the size of objects and everything they retain, in bytes.
+
+    Containers, pydantic models, dataclasses and this integration's own classes are
+    followed; other objects are counted without their attributes. Objects whose id
+    is in seen are skipped and every counted object is added to it, so an object
+    shared between categories is only counted by the first.
+    """
+    size = 0
+    stack = list(objects)
+    while stack:
+        value = stack.pop()
+        if id(value) in seen or isinstance(value, _OPAQUE_TYPES):
+            continue
+        seen.add(id(value))
+        size += sys.getsizeof(value)
+
+        if isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, _CONTAINER_TYPES):
+            stack.extend(value)
+        elif _expandable(value):
+            if hasattr(value, "__dict__"):
+                stack.append(vars(value))
+            for cls in type(value).__mro__:
+                slots = getattr(cls, "__slots__", ())
+                stack.extend(
+                    getattr(value, name, None)
+                    for name in ((slots,) if isinstance(slots, str) else slots)
+                    if name not in ("__dict__", "__weakref__")
+                )
+    return size
+
+
+def memory_footprint(coordinator: UbiquitiDataUpdateCoordinator) -> MemoryFootprint:
+    """Measure the memory retained for the coordinator's config entry."""
+    entry = coordinator.config_entry
+    platforms = [
+        platform
+        for platform in async_get_platforms(coordinator.hass, DOMAIN)
+        if platform.config_entry is not None
+        and platform.config_entry.entry_id == entry.entry_id
+    ]
+    entities = [
+        entity for platform in platforms for entity in platform.entities.values()
+    ]
+
+    # Shared objects that entities and helpers refer to are not part of any
+    # category.
+    seen = {
+        id(coordinator),
+        id(coordinator.hass),
+        id(coordinator.client),
+        id(entry),
+        *(id(platform) for platform in platforms),
+    }
+    return MemoryFootprint(
+        snapshot=deep_sizeof([coordinator.data], seen),
+        clients=deep_sizeof(
+            [
+                coordinator.presence,
+                coordinator.usage,
+                coordinator.usage_statistics,
+                coordinator.client_events,
+                coordinator.timestamps,
+                coordinator.tracked_clients,
+                coordinator.tracked_client_metrics,
+            ],
+            seen,
+        ),
+        entities=deep_sizeof(entities, seen),
+        caches=deep_sizeof(
+            [
+                coordinator.gps_filter,
+                coordinator.track,
+                coordinator.phase_lock,
+                coordinator.load_controller,
+                coordinator.projector,
+                coordinator.link_quality,
+                coordinator.radio,
+                coordinator.client.capture,
+            ],
+            seen,
+        ),
+        client_count=len(coordinator.tracked_clients),
+        entity_count=len(entities),
+    )
@@ -0,0 +1,236 @@
+"""OpenMetrics export of gateway and client metrics for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from aiohttp import web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.core import callback
+
+from .const import DOMAIN
+from .talkers import client_rx_rate, client_tx_rate
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import UbiquitiDataUpdateCoordinator
+    from .data import UbiquitiMobileStateData
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+# Suffix of the sample name by metric type.
+SAMPLE_SUFFIXES = {"counter": "_total", "gauge": "", "info": "_info"}
+
+# InfoHighDump fields exported for every gateway, as (metric, field, help).
+GATEWAY_COUNTERS: tuple[tuple[str, str, str], ...] = (
+    ("upload_usage_bytes", "upload_usage", "Data uploaded in the usage cycle."),
+    ("download_usage_bytes", "download_usage", "Data downloaded in the usage cycle."),
+    ("total_usage_bytes", "total_usage", "Data transferred in the usage cycle."),
+)
+GATEWAY_GAUGES: tuple[tuple[str, str, str], ...] = (
+    ("uptime_seconds", "uptime", "Time since the gateway booted."),
+    ("cpu_percent", "cpu", "CPU usage."),
+    ("memory_percent", "memory", "Memory usage."),
+    ("clients", "client_numbers", "Connected clients."),
+    ("wifi_clients", "wifi_clients", "Connected wireless clients."),
+    ("experience", "experience", "Experience score."),
+    ("signal_level", "signal_level", "Cellular signal level."),
+    ("rssi_dbm", "rssi", "Cellular RSSI."),
+    ("rsrp_dbm", "rsrp", "Cellular RSRP."),
+    ("rsrq_db", "rsrq", "Cellular RSRQ."),
+    ("upload_speed_bytes_per_second", "upload_speed", "Current upload rate."),
+    ("download_speed_bytes_per_second", "download_speed", "Current download rate."),
+    ("latency_avg_milliseconds", "latency_avg_ms", "Average probe latency."),
+    ("latency_max_milliseconds", "latency_max_ms", "Maximum probe latency."),
+)
+
+
+def _escape(value: object) -> str:
+    """Return a label value escaped for the exposition format."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _MetricFamilies:
+    """Collect samples grouped by metric family, as the format requires."""
+
+    def __init__(self) -> None:
+        """Initialize the collection."""
+        self._families: dict[str, tuple[str, str, list[str]]] = {}
+
+    def add(
+        self,
+        name: str,
+        metric_type: str,
+        help_text: str,
+        labels: dict[str, object],
+        value: float | None,
+    ) -> None:
+        """Add a sample; samples without a value are skipped."""
+        if value is None:
+            return
+        name = f"{DOMAIN}_{name}"
+        family = self._families.setdefault(name, (metric_type, help_text, []))
+        label_text = ",".join(
+            f'{key}="{_escape(label)}"'
+            for key, label in labels.items()
+            if label is not None
+        )
+        family[2].append(
+            f"{name}{SAMPLE_SUFFIXES[metric_type]}{{{label_text}}} {value}"
+        )
+
+    def render(self) -> str:
+        """Return the exposition text of all families."""
+        lines: list[str] = []
+        for name, (metric_type, help_text, samples) in self._families.items():
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.append(f"# HELP {name} {help_text}")
+            lines.extend(samples)
+        lines.append("# EOF\n")
+        return "\n".join(lines)
+
+
+def render_metrics(coordinators: Iterable[UbiquitiDataUpdateCoordinator]) -> str:
+    """Render the latest data of the coordinators as OpenMetrics text."""
+    families = _MetricFamilies()
+    for coordinator in coordinators:
+        data: UbiquitiMobileStateData | None = coordinator.data
+        if data is None:
+            continue
+        gateway = {"entry_id": coordinator.config_entry.entry_id}
+
+        if data.info:
+            families.add(
+                "gateway",
+                "info",
+                "Gateway identity.",
+                {
+                    **gateway,
+                    "mac": data.info.mac.lower(),
+                    "model": data.info.model_name,
+                    "fw": data.high.fw if data.high else None,
+                },
+                1,
+            )
+        if data.link_quality and data.link_quality.packet_loss is not None:
+            families.add(
+                "packet_loss_percent",
+                "gauge",
+                "Probe packet loss over the link quality window.",
+                gateway,
+                data.link_quality.packet_loss,
+            )
+
+        high = data.high
+        if high is None:
+            continue
+        for name, field, help_text in GATEWAY_COUNTERS:
+            families.add(name, "counter", help_text, gateway, getattr(high, field))
+        for name, field, help_text in GATEWAY_GAUGES:
+            families.add(name, "gauge", help_text, gateway, getattr(high, field))
+
+        # A series may only appear once, so repeated MACs are skipped.
+        macs: set[str] = set()
+        for client in high.client_details:
+            mac = client.mac.lower()
+            if not mac or mac in macs:
+                continue
+            macs.add(mac)
+            labels = {**gateway, "mac": mac}
+            families.add(
+                "client",
+                "info",
+                "Client identity.",
+                {
+                    **labels,
+                    "host_name": client.host_name,
+                    "ip": client.ip,
+                    "connection": client.connection,
+                    "band": client.band,
+                },
+                1,
+            )
+            usage = coordinator.usage.get(mac)
+            families.add(
+                "client_receive_bytes",
+                "counter",
+                "Data received by the client.",
+                labels,
+                usage.rx_total if usage else None,
+            )
+            families.add(
+                "client_transmit_bytes",
+                "counter",
+                "Data sent by the client.",
+                labels,
+                usage.tx_total if usage else None,
+            )
+            families.add(
+                "client_receive_rate_bytes_per_second",
+                "gauge",
+                "Current receive rate of the client.",
+                labels,
+                client_rx_rate(client),
+            )
+            families.add(
+                "client_transmit_rate_bytes_per_second",
+                "gauge",
+                "Current transmit rate of the client.",
+                labels,
+                client_tx_rate(client),
+            )
+            families.add(
+                "client_signal_dbm",
+                "gauge",
+                "Wireless signal of the client.",
+                labels,
+                client.signal,
+            )
+    return families.render()
+
+
+class UbiquitiMobileMetricsView(HomeAssistantView):
+    """
+    Serve the metrics of all gateways in the OpenMetrics text format.
+
+    The body is rendered from the coordinators' current data, never from a gateway
+    call, and is reused until any coordinator publishes new data, so scrapes that
+    fall within the same poll cost nothing extra.
+    """
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+
+    def __init__(self) -> None:
+        """Initialize the view."""
+        self._rendered_from: list[tuple[str, UbiquitiMobileStateData | None]] = []
+        self._body = b""
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the metrics."""
+        hass = request.app[KEY_HASS]
+        coordinators: dict[str, UbiquitiDataUpdateCoordinator] = hass.data.get(
+            DOMAIN, {}
+        )
+        snapshots = [
+            (entry_id, coordinator.data)
+            for entry_id, coordinator in coordinators.items()
+        ]
+        if len(snapshots) != len(self._rendered_from) or any(
+            entry_id != cached_id or data is not cached_data
+            for (entry_id, data), (cached_id, cached_data) in zip(
+                snapshots, self._rendered_from, strict=False
+            )
+        ):
+            self._body = render_metrics(coordinators.values()).encode()
+            self._rendered_from = snapshots
+        return web.Response(body=self._body, headers={"Content-Type": CONTENT_TYPE})
+
+
+@callback
+def async_setup_metrics_view(hass: HomeAssistant) -> None:
+    """Register the metrics view."""
+    hass.http.register_view(UbiquitiMobileMetricsView())
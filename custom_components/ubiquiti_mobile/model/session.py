@@ -2,7 +2,7 @@
 
 from pydantic import BaseModel, Field
 
-from custom_components.ubiquiti_mobile.model.jsonrpc import Request, Response
+from .jsonrpc import Request, Response
 
 # ---------------------------
 # Pydantic Models
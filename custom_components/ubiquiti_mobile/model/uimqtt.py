@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from .jsonrpc import Request
 
@@ -72,6 +72,8 @@ class GetHighInfoRequest(Request[dict[str, str]]):
 class HighClientInfo(BaseModel):
     """Represents information about a connected client."""
 
+    model_config = ConfigDict(frozen=True)
+
     ip: str
     mac: str
     id: int
@@ -103,6 +105,10 @@ class HighClientInfo(BaseModel):
 class GetHighInfoResponse(BaseModel):
     """Class that reflects a response from a InfoHighDump Request."""
 
+    # Large responses are validated in the executor; the resulting snapshot is
+    # shared with the event loop and never modified.
+    model_config = ConfigDict(frozen=True)
+
     fw: str
     uptime: int
     iccid: str
@@ -0,0 +1,115 @@
+"""Wi-Fi radio occupancy analytics for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from custom_components.ubiquiti_mobile.model.uimqtt import HighClientInfo
+
+# Upper bounds of the packet error rate histogram buckets, in percent. Rates at or
+# above the last bound fall into a final open bucket.
+PER_BUCKETS = (5, 10, 20, 50)
+PER_BUCKET_LABELS = (
+    *(
+        f"{low}-{high}"
+        for low, high in zip((0, *PER_BUCKETS), PER_BUCKETS, strict=False)
+    ),
+    f"{PER_BUCKETS[-1]}+",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BandOccupancy:
+    """Wireless clients of one band, aggregated over a sample."""
+
+    band: str
+    clients: int
+    mean_signal: float | None
+    min_signal: int | None
+    # Clients per channel, and per packet error rate bucket.
+    channels: dict[int, int]
+    per_histogram: tuple[int, ...]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the occupancy as a dictionary."""
+        return {
+            "band": self.band,
+            "clients": self.clients,
+            "mean_signal": self.mean_signal,
+            "min_signal": self.min_signal,
+            "channels": self.labelled_channels(),
+            "per_histogram": self.labelled_per_histogram(),
+        }
+
+    def labelled_channels(self) -> dict[str, int]:
+        """Return the clients per channel keyed by channel number as text."""
+        return {str(channel): count for channel, count in self.channels.items()}
+
+    def labelled_per_histogram(self) -> dict[str, int]:
+        """Return the packet error rate histogram keyed by bucket label."""
+        return dict(zip(PER_BUCKET_LABELS, self.per_histogram, strict=True))
+
+
+@dataclass(slots=True)
+class _BandAccumulator:
+    """Running totals of one band while a sample is aggregated."""
+
+    clients: int = 0
+    signal: int = 0
+    signal_count: int = 0
+    min_signal: int | None = None
+    channels: dict[int, int] = field(default_factory=dict)
+    per: list[int] = field(default_factory=lambda: [0] * (len(PER_BUCKETS) + 1))
+
+
+def _per_bucket(per: int) -> int:
+    """Return the index of the histogram bucket of a packet error rate."""
+    for index, bound in enumerate(PER_BUCKETS):
+        if per < bound:
+            return index
+    return len(PER_BUCKETS)
+
+
+def wifi_occupancy(clients: Iterable[HighClientInfo]) -> dict[str, BandOccupancy]:
+    """
+    Group the wireless clients of a sample by band and channel.
+
+    All statistics are accumulated in a single pass over the clients. Clients
+    without a band are wired and are skipped; missing signal, channel or packet
+    error rate values are left out of the respective statistic only.
+    """
+    bands: dict[str, _BandAccumulator] = {}
+    for client in clients:
+        if not client.band:
+            continue
+        if (band := bands.get(client.band)) is None:
+            band = bands[client.band] = _BandAccumulator()
+
+        band.clients += 1
+        if client.channel is not None:
+            band.channels[client.channel] = band.channels.get(client.channel, 0) + 1
+        if (signal := client.signal) is not None:
+            band.signal += signal
+            band.signal_count += 1
+            if band.min_signal is None or signal < band.min_signal:
+                band.min_signal = signal
+        if client.per is not None:
+            band.per[_per_bucket(client.per)] += 1
+
+    return {
+        name: BandOccupancy(
+            band=name,
+            clients=band.clients,
+            mean_signal=round(band.signal / band.signal_count, 1)
+            if band.signal_count
+            else None,
+            min_signal=band.min_signal,
+            channels=dict(sorted(band.channels.items())),
+            per_histogram=tuple(band.per),
+        )
+        for name, band in bands.items()
+    }
@@ -0,0 +1,157 @@
+"""Poll scheduling for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass
+
+# Default poll interval, used until the gateway's sampling phase is known.
+DEFAULT_POLL_SECONDS = 5.0
+# Poll this long after the gateway is expected to have taken a new sample.
+PHASE_MARGIN_SECONDS = 0.25
+# Stop probing for an earlier poll time once the phase is known this precisely.
+PHASE_TOLERANCE_SECONDS = 0.5
+# Retry delay when a poll returns a sample that was already seen.
+STALE_RETRY_SECONDS = 1.0
+MIN_POLL_SECONDS = 0.5
+# Longest delay between two polls, or two sample intervals if that is longer, so
+# that a bad phase estimate costs at most one sample.
+MAX_POLL_SECONDS = 30.0
+# GPS fixes are read live instead of being sampled, so the position is polled at
+# least this often, also between samples.
+GPS_POLL_SECONDS = 5.0
+# Number of observations used to estimate the gateway clock offset, so that the
+# estimate follows clock drift.
+OFFSET_WINDOW = 20
+
+
+class SamplePhaseLock:
+    """
+    Align polls with the gateway's own InfoHighDump sampling.
+
+    The gateway only refreshes its metrics every sample_interval_second. The offset
+    between the local clock and the moment a sample becomes available is bounded
+    from above by the age of fresh samples and from below by polls that returned an
+    already seen sample. While the bounds are far apart, polls probe their midpoint;
+    once they converge, each poll is scheduled just after the next sample is due.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the phase lock."""
+        self.sample_time: int | None = None
+        self.sample_interval: float | None = None
+        self._fresh_ages: deque[float] = deque(maxlen=OFFSET_WINDOW)
+        self._stale_bounds: deque[float] = deque(maxlen=OFFSET_WINDOW)
+        self._fresh = True
+
+    def update(self, sample_time: int, sample_interval: int, now: float) -> bool:
+        """Record a polled sample and return True if it is new."""
+        self._fresh = sample_time != self.sample_time
+        if not self._fresh:
+            if self.sample_interval is not None:
+                # The next sample was not available yet at this point in time.
+                self._stale_bounds.append(now - sample_time - self.sample_interval)
+            return False
+
+        self.sample_time = sample_time
+        self.sample_interval = sample_interval if sample_interval > 0 else None
+        self._fresh_ages.append(now - sample_time)
+        return True
+
+    def next_delay(self, now: float) -> float:
+        """Return the number of seconds until the next poll should run."""
+        if self.sample_time is None or self.sample_interval is None:
+            return DEFAULT_POLL_SECONDS
+
+        interval = self.sample_interval
+        max_delay = max(MAX_POLL_SECONDS, 2 * interval)
+        upper = min(self._fresh_ages)
+        lower = max(self._stale_bounds, default=upper - interval)
+        lower = max(lower, upper - interval)
+
+        offset = upper
+        if self._fresh and upper - lower > PHASE_TOLERANCE_SECONDS:
+            offset = (lower + upper) / 2
+
+        delay = self.sample_time + interval + offset + PHASE_MARGIN_SECONDS - now
+        if delay < MIN_POLL_SECONDS:
+            if not self._fresh:
+                # The expected sample is late; check again shortly, falling back to
+                # the sample interval if the gateway appears to have stopped.
+                if -delay < interval:
+                    return STALE_RETRY_SECONDS
+                return interval
+            delay += interval * math.ceil((MIN_POLL_SECONDS - delay) / interval)
+
+        return min(delay, max_delay)
+
+
+# Gateway load above which polling backs off.
+HIGH_CPU_PERCENT = 85
+HIGH_MEMORY_PERCENT = 90
+HIGH_LATENCY_SECONDS = 2.0
+# Polls are stretched to at most this many sample intervals.
+MAX_BACKOFF_FACTOR = 8
+
+POLLING_STATE_NORMAL = "normal"
+POLLING_STATE_THROTTLED = "throttled"
+POLLING_STATE_RECOVERING = "recovering"
+POLLING_STATES = (
+    POLLING_STATE_NORMAL,
+    POLLING_STATE_THROTTLED,
+    POLLING_STATE_RECOVERING,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PollingDecision:
+    """The load controller's current decision."""
+
+    state: str
+    factor: int
+    reason: str | None = None
+
+    @property
+    def defer_low_priority(self) -> bool:
+        """Return True if low-priority endpoints should be skipped."""
+        return self.factor > 1
+
+
+class LoadController:
+    """
+    Back off polling while the gateway is under load.
+
+    The poll interval is doubled (up to MAX_BACKOFF_FACTOR sample intervals) for
+    every poll in which the gateway reports high CPU or memory usage, or responds
+    slowly. Once the load subsides the factor is reduced by one per poll, so the
+    poll rate recovers gradually instead of snapping back to full speed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the controller at the normal poll rate."""
+        self.decision = PollingDecision(state=POLLING_STATE_NORMAL, factor=1)
+
+    def update(self, cpu: int | None, memory: int | None, latency: float) -> None:
+        """Update the decision from the latest gateway load and response latency."""
+        reason: str | None = None
+        if cpu is not None and cpu >= HIGH_CPU_PERCENT:
+            reason = "cpu"
+        elif memory is not None and memory >= HIGH_MEMORY_PERCENT:
+            reason = "memory"
+        elif latency >= HIGH_LATENCY_SECONDS:
+            reason = "latency"
+
+        factor = self.decision.factor
+        if reason is not None:
+            self.decision = PollingDecision(
+                state=POLLING_STATE_THROTTLED,
+                factor=min(factor * 2, MAX_BACKOFF_FACTOR),
+                reason=reason,
+            )
+        elif factor > 1:
+            factor -= 1
+            self.decision = PollingDecision(
+                state=POLLING_STATE_RECOVERING if factor > 1 else POLLING_STATE_NORMAL,
+                factor=factor,
+            )
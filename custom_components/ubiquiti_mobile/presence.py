@@ -0,0 +1,147 @@
+"""Client presence tracking with consider-home hysteresis."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from custom_components.ubiquiti_mobile.model.uimqtt import HighClientInfo
+
+# associated_at is a timestamp kept by the gateway, so any change beyond rounding is
+# a new association.
+ASSOCIATION_TOLERANCE_SECONDS = 2
+# Session starts derived as sample_time - uptime wobble by a few seconds, as both
+# are whole seconds that are not read at the same instant, and the gateway clock
+# may be stepped by NTP.
+UPTIME_TOLERANCE_SECONDS = 60
+
+
+@dataclass(slots=True)
+class ClientPresence:
+    """Last known state of a single client."""
+
+    client: HighClientInfo | None
+    last_seen: float
+    home: bool = True
+    # Start of the current association, and whether it came from associated_at.
+    connected_since: datetime | None = None
+    associated: bool = False
+
+
+class ClientPresenceTracker:
+    """
+    Decide which clients are home, tolerating short gaps in the client table.
+
+    Clients that roam between bands routinely miss a single InfoHighDump sample. A
+    client is therefore only declared away once it has been missing for longer than
+    the consider-home period. All clients are evaluated in a single pass per poll.
+    The client information of a client that went away is released, since it is
+    only reported while the client is home.
+
+    The start of each client's association is taken from associated_at, or from
+    sample_time - uptime for clients that do not report one. A client that
+    reconnected between two polls, or while it was missing from the client table,
+    reports a new association time, which starts a new session although the client
+    never went away. A client that was away starts a new session when it returns.
+    """
+
+    def __init__(self, consider_home: float) -> None:
+        """Initialize the tracker with the grace period in seconds."""
+        self.consider_home = consider_home
+        self._clients: dict[str, ClientPresence] = {}
+
+    def update(
+        self,
+        clients: Iterable[HighClientInfo],
+        now: float,
+        sample_time: int | None = None,
+    ) -> None:
+        """Record the clients reported in the latest sample."""
+        records = self._clients
+        seen: set[str] = set()
+
+        for client in clients:
+            mac = client.mac.lower()
+            if not mac:
+                continue
+            seen.add(mac)
+
+            record = records.get(mac)
+            if record is None:
+                record = records[mac] = ClientPresence(client=client, last_seen=now)
+            elif not record.home:
+                # The client was away, so this is a new session.
+                record.connected_since = None
+            record.client = client
+            record.last_seen = now
+            record.home = True
+            _update_session(record, client, sample_time, now)
+
+        deadline = now - self.consider_home
+        for mac, record in records.items():
+            if mac not in seen and record.home and record.last_seen < deadline:
+                record.home = False
+                record.client = None
+
+    def forget(self, macs: Iterable[str]) -> None:
+        """Drop the records of clients that expired."""
+        for mac in macs:
+            self._clients.pop(mac, None)
+
+    def is_home(self, mac: str) -> bool:
+        """Return True if the client is considered home."""
+        record = self._clients.get(mac)
+        return record is not None and record.home
+
+    def client(self, mac: str) -> HighClientInfo | None:
+        """Return the last known information for a client that is still home."""
+        record = self._clients.get(mac)
+        return record.client if record else None
+
+    def last_seen(self, mac: str) -> float | None:
+        """Return the timestamp at which the client was last reported."""
+        record = self._clients.get(mac)
+        return record.last_seen if record else None
+
+    def connected_since(self) -> dict[str, datetime]:
+        """Return the start of the current session of every client that is home."""
+        return {
+            mac: record.connected_since
+            for mac, record in self._clients.items()
+            if record.home and record.connected_since is not None
+        }
+
+
+def _update_session(
+    record: ClientPresence,
+    client: HighClientInfo,
+    sample_time: int | None,
+    now: float,
+) -> None:
+    """Start a new session if the client's association time moved."""
+    if client.associated_at is not None:
+        started: float = client.associated_at
+        tolerance = ASSOCIATION_TOLERANCE_SECONDS
+    elif client.uptime is not None and sample_time is not None:
+        started = sample_time - client.uptime
+        tolerance = UPTIME_TOLERANCE_SECONDS
+    elif record.connected_since is None:
+        # Nothing is known about the association, so the session starts now.
+        record.connected_since = datetime.fromtimestamp(now, UTC)
+        record.associated = False
+        return
+    else:
+        return
+
+    previous = record.connected_since
+    if (
+        previous is None
+        or record.associated != (client.associated_at is not None)
+        or abs(previous.timestamp() - started) > tolerance
+    ):
+        record.connected_since = datetime.fromtimestamp(started, UTC)
+        record.associated = client.associated_at is not None
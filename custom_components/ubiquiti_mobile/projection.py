@@ -0,0 +1,138 @@
+"""Billing cycle data usage projection for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from custom_components.ubiquiti_mobile.model.uimqtt import GetHighInfoResponse
+
+# Burn rates are computed over these sliding windows, in seconds.
+SHORT_WINDOW_SECONDS = 3600
+LONG_WINDOW_SECONDS = 86400
+# Window points are kept at most this often, which bounds each window's size.
+WINDOW_RESOLUTION_SECONDS = 60
+
+
+@dataclass(frozen=True, slots=True)
+class UsageProjection:
+    """Projected usage for the current billing cycle."""
+
+    cycle_start: datetime
+    cycle_end: datetime
+    usage: int
+    short_rate: float | None
+    long_rate: float | None
+    projected_usage: int | None
+    seconds_to_cap: float | None
+
+
+class _RateWindow:
+    """Usage samples over a sliding window."""
+
+    def __init__(self, span: float) -> None:
+        """Initialize an empty window."""
+        self._span = span
+        self._points: deque[tuple[float, int]] = deque()
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._points.clear()
+
+    def add(self, timestamp: float, usage: int) -> None:
+        """Add a sample and expire samples that fell out of the window."""
+        points = self._points
+        if not points or timestamp - points[-1][0] >= WINDOW_RESOLUTION_SECONDS:
+            points.append((timestamp, usage))
+        while timestamp - points[0][0] > self._span:
+            points.popleft()
+
+    def rate(self, timestamp: float, usage: int) -> float | None:
+        """Return the usage rate in bytes per second up to the given sample."""
+        if not self._points:
+            return None
+        start, start_usage = self._points[0]
+        if timestamp <= start:
+            return None
+        return (usage - start_usage) / (timestamp - start)
+
+
+def _add_month(value: datetime) -> datetime:
+    """Return the same day and time one month later, clamped to the month end."""
+    year, month = divmod(value.year * 12 + value.month, 12)
+    month += 1
+    for day in range(value.day, 27, -1):
+        try:
+            return value.replace(year=year, month=month, day=day)
+        except ValueError:
+            continue
+    return value.replace(year=year, month=month)
+
+
+class UsageProjector:
+    """
+    Project the usage at the end of the billing cycle.
+
+    The cycle starts at reset_usage_timestamp and is assumed to last one calendar
+    month. Each poll adds one sample to a short and a long sliding window, so the
+    burn rate and projection are updated in constant time. The long window rate is
+    used for the projection once it is available.
+    """
+
+    def __init__(self, data_cap: int | None) -> None:
+        """Initialize the projector with an optional data cap in bytes."""
+        self._data_cap = data_cap
+        self._reset_timestamp: int | None = None
+        self._last_usage: int | None = None
+        self._short = _RateWindow(SHORT_WINDOW_SECONDS)
+        self._long = _RateWindow(LONG_WINDOW_SECONDS)
+
+    def update(self, high: GetHighInfoResponse) -> UsageProjection:
+        """Add a sample and return the updated projection."""
+        timestamp = high.sample_time
+        usage = high.total_usage
+
+        if high.reset_usage_timestamp != self._reset_timestamp or (
+            self._last_usage is not None and usage < self._last_usage
+        ):
+            # A new cycle started or the counter was reset.
+            self._reset_timestamp = high.reset_usage_timestamp
+            self._short.clear()
+            self._long.clear()
+        self._last_usage = usage
+
+        short_rate = self._short.rate(timestamp, usage)
+        long_rate = self._long.rate(timestamp, usage)
+        self._short.add(timestamp, usage)
+        self._long.add(timestamp, usage)
+
+        cycle_start = dt_util.utc_from_timestamp(high.reset_usage_timestamp)
+        cycle_end = _add_month(cycle_start)
+
+        rate = long_rate if long_rate is not None else short_rate
+        projected_usage: int | None = None
+        seconds_to_cap: float | None = None
+        if rate is not None:
+            remaining = max(cycle_end.timestamp() - timestamp, 0)
+            projected_usage = round(usage + rate * remaining)
+            if self._data_cap:
+                if usage >= self._data_cap:
+                    seconds_to_cap = 0
+                elif rate > 0:
+                    seconds_to_cap = (self._data_cap - usage) / rate
+
+        return UsageProjection(
+            cycle_start=cycle_start,
+            cycle_end=cycle_end,
+            usage=usage,
+            short_rate=short_rate,
+            long_rate=long_rate,
+            projected_usage=projected_usage,
+            seconds_to_cap=seconds_to_cap,
+        )
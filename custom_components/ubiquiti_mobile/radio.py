@@ -0,0 +1,191 @@
+"""Cellular radio state tracking for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from custom_components.ubiquiti_mobile.model.uimqtt import GetHighInfoResponse
+
+# Signal levels from best to worst, with the lower bound of each level in dB/dBm.
+# Values below the last bound are "poor".
+SIGNAL_LEVELS = ("excellent", "good", "fair", "poor")
+RSRP_BOUNDS = (-80, -90, -100)
+RSRQ_BOUNDS = (-10, -15, -20)
+# A level only changes once the value is this far past the boundary.
+SIGNAL_HYSTERESIS_DB = 3
+
+RADIO_EVENT_BAND = "band_change"
+RADIO_EVENT_OPERATOR = "operator_change"
+RADIO_EVENT_LTE_STATE = "lte_state_change"
+RADIO_EVENT_RSRP = "rsrp_level_change"
+RADIO_EVENT_RSRQ = "rsrq_level_change"
+
+
+@dataclass(frozen=True, slots=True)
+class RadioState:
+    """Published cellular radio state; only changes on meaningful transitions."""
+
+    operator_name: str
+    band: str
+    lte_band: str
+    lte_4g_band: str
+    lte_mode: str
+    lte_state: int
+    rx_channel: int
+    tx_channel: int
+    rsrp_level: str
+    rsrq_level: str
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state as a dictionary."""
+        return {
+            "operator_name": self.operator_name,
+            "band": self.band,
+            "lte_band": self.lte_band,
+            "lte_4g_band": self.lte_4g_band,
+            "lte_mode": self.lte_mode,
+            "lte_state": self.lte_state,
+            "rx_channel": self.rx_channel,
+            "tx_channel": self.tx_channel,
+            "rsrp_level": self.rsrp_level,
+            "rsrq_level": self.rsrq_level,
+        }
+
+
+def _level(value: float, bounds: tuple[int, ...]) -> int:
+    """Return the index into SIGNAL_LEVELS for a value."""
+    for index, bound in enumerate(bounds):
+        if value >= bound:
+            return index
+    return len(bounds)
+
+
+def _level_with_hysteresis(value: int, bounds: tuple[int, ...], current: str) -> str:
+    """Return the signal level, only leaving the current level past the hysteresis."""
+    index = SIGNAL_LEVELS.index(current)
+    better = _level(value - SIGNAL_HYSTERESIS_DB, bounds)
+    if better < index:
+        return SIGNAL_LEVELS[better]
+    worse = _level(value + SIGNAL_HYSTERESIS_DB, bounds)
+    if worse > index:
+        return SIGNAL_LEVELS[worse]
+    return current
+
+
+class RadioTracker:
+    """
+    Track the cellular radio and report meaningful transitions.
+
+    Signal strength is reduced to RSRP and RSRQ levels that only change once the
+    value has moved past a level boundary by SIGNAL_HYSTERESIS_DB, so the published
+    state stays constant while the raw values fluctuate.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self.state: RadioState | None = None
+
+    def update(self, high: GetHighInfoResponse) -> list[dict[str, Any]]:
+        """Update the published state and return events for its transitions."""
+        previous = self.state
+        if previous is None:
+            self.state = RadioState(
+                operator_name=high.operator_name,
+                band=high.band,
+                lte_band=high.lte_band,
+                lte_4g_band=high.lte_4g_band,
+                lte_mode=high.lte_mode,
+                lte_state=high.lte_state,
+                rx_channel=high.rx_channel,
+                tx_channel=high.tx_channel,
+                rsrp_level=SIGNAL_LEVELS[_level(high.rsrp, RSRP_BOUNDS)],
+                rsrq_level=SIGNAL_LEVELS[_level(high.rsrq, RSRQ_BOUNDS)],
+            )
+            return []
+
+        current = replace(
+            previous,
+            operator_name=high.operator_name,
+            band=high.band,
+            lte_band=high.lte_band,
+            lte_4g_band=high.lte_4g_band,
+            lte_mode=high.lte_mode,
+            lte_state=high.lte_state,
+            rx_channel=high.rx_channel,
+            tx_channel=high.tx_channel,
+            rsrp_level=_level_with_hysteresis(
+                high.rsrp, RSRP_BOUNDS, previous.rsrp_level
+            ),
+            rsrq_level=_level_with_hysteresis(
+                high.rsrq, RSRQ_BOUNDS, previous.rsrq_level
+            ),
+        )
+        if current == previous:
+            return []
+        self.state = current
+
+        events: list[dict[str, Any]] = []
+        if current.operator_name != previous.operator_name:
+            events.append(
+                {
+                    "type": RADIO_EVENT_OPERATOR,
+                    "from": previous.operator_name,
+                    "to": current.operator_name,
+                }
+            )
+        if (
+            current.band,
+            current.lte_band,
+            current.lte_4g_band,
+            current.lte_mode,
+            current.rx_channel,
+            current.tx_channel,
+        ) != (
+            previous.band,
+            previous.lte_band,
+            previous.lte_4g_band,
+            previous.lte_mode,
+            previous.rx_channel,
+            previous.tx_channel,
+        ):
+            events.append(
+                {
+                    "type": RADIO_EVENT_BAND,
+                    "from": previous.band,
+                    "to": current.band,
+                    "lte_band": current.lte_band,
+                    "lte_4g_band": current.lte_4g_band,
+                    "lte_mode": current.lte_mode,
+                    "rx_channel": current.rx_channel,
+                    "tx_channel": current.tx_channel,
+                }
+            )
+        if current.lte_state != previous.lte_state:
+            events.append(
+                {
+                    "type": RADIO_EVENT_LTE_STATE,
+                    "from": previous.lte_state,
+                    "to": current.lte_state,
+                }
+            )
+        if current.rsrp_level != previous.rsrp_level:
+            events.append(
+                {
+                    "type": RADIO_EVENT_RSRP,
+                    "from": previous.rsrp_level,
+                    "to": current.rsrp_level,
+                    "rsrp": high.rsrp,
+                }
+            )
+        if current.rsrq_level != previous.rsrq_level:
+            events.append(
+                {
+                    "type": RADIO_EVENT_RSRQ,
+                    "from": previous.rsrq_level,
+                    "to": current.rsrq_level,
+                    "rsrq": high.rsrq,
+                }
+            )
+        return events
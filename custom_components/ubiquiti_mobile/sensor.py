@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.device_tracker.config_entry import (
     TrackerEntity,
@@ -17,6 +18,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import (
     PERCENTAGE,
+    SIGNAL_STRENGTH_DECIBELS,
     SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
     EntityCategory,
     UnitOfDataRate,
@@ -24,23 +26,44 @@ from homeassistant.const import (
     UnitOfTime,
 )
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, DeviceInfo
+from homeassistant.util import slugify
 
-from custom_components.ubiquiti_mobile.const import DOMAIN
-from custom_components.ubiquiti_mobile.data import UbiquitiMobileStateData
+from custom_components.ubiquiti_mobile.const import (
+    CLIENT_USAGE_SENSOR_KEYS,
+    DOMAIN,
+    IDENTIFIER_FIELDS,
+    USAGE_SENSOR_TAGS,
+)
+from custom_components.ubiquiti_mobile.model.uimqtt import (
+    GetDeviceInfoResponse,
+    GetHighInfoResponse,
+)
+from custom_components.ubiquiti_mobile.polling import POLLING_STATES
+from custom_components.ubiquiti_mobile.talkers import (
+    client_rx_rate,
+    client_tx_rate,
+    link_utilization,
+)
 
 from .entity import UbiquitiMobileEntity
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from datetime import datetime
 
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
     from homeassistant.helpers.typing import StateType
+    from pydantic import BaseModel
 
+    from custom_components.ubiquiti_mobile.data import UbiquitiMobileStateData
     from custom_components.ubiquiti_mobile.model.uimqtt import HighClientInfo
 
     from .coordinator import UbiquitiDataUpdateCoordinator
     from .data import UbiquitiMobileConfigEntry
+    from .occupancy import BandOccupancy
+    from .talkers import Talker
+    from .usage import ClientUsage
 
 
 async def async_setup_entry(
@@ -50,37 +73,73 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensor platform."""
     coord = hass.data[DOMAIN][entry.entry_id]
+    # In statistics only mode usage history comes from the imported statistics, so
+    # the usage counter sensors are not created.
     sensors = [
         UbiquitiMobileSensor(coordinator=coord, config=config)
         for config in SENSOR_CONFIGS
+        if not (coord.statistics_only and config.tag in USAGE_SENSOR_TAGS)
     ]
+    client_sensor_configs = tuple(
+        config
+        for config in CLIENT_SENSOR_CONFIGS
+        if not (coord.statistics_only and config.key in CLIENT_USAGE_SENSOR_KEYS)
+    )
     trackers = [
         UbiquitiMobileTracker(coordinator=coord, config=config)
         for config in TRACKER_CONFIGS
     ]
+    sensors.extend(
+        UbiquitiMobileClientListSensor(coordinator=coord, config=config)
+        for config in TOP_TALKER_SENSOR_CONFIGS
+    )
+    if coord.compact_clients:
+        sensors.append(
+            UbiquitiMobileClientListSensor(
+                coordinator=coord, config=CLIENT_TABLE_SENSOR_CONFIG
+            )
+        )
     async_add_entities([*sensors, *trackers])
 
+    # Wi-Fi bands are named by the gateway, so their sensors are created when a
+    # band first has clients.
+    wifi_bands: set[str] = set()
+
+    def _register_wifi_band_sensors() -> None:
+        """Create occupancy sensors when a new Wi-Fi band appears."""
+        state_data = coord.data
+        if not state_data or not state_data.occupancy:
+            return
+
+        new_bands = state_data.occupancy.keys() - wifi_bands
+        if new_bands:
+            wifi_bands.update(new_bands)
+            async_add_entities(
+                UbiquitiMobileSensor(coordinator=coord, config=config)
+                for band in sorted(new_bands)
+                for config in _wifi_band_sensor_configs(band)
+            )
+
+    _register_wifi_band_sensors()
+    entry.async_on_unload(coord.async_add_listener(_register_wifi_band_sensors))
+
     # Remember which MAC/metric combinations already exist so we do not add duplicates.
-    tracked_client_metrics: set[str] = set()
+    tracked_client_metrics = coord.tracked_client_metrics
 
     def _register_client_sensors() -> None:
         """Create client-level sensors when new clients appear."""
-        data = coord.data
-        if not data:
-            return
-
-        state_data = UbiquitiMobileStateData(**data)
-        if not state_data.high:
+        state_data = coord.data
+        if not state_data or not state_data.high:
             return
 
         new_entities: list[UbiquitiMobileClientSensor] = []
         for client in state_data.high.client_details:
             mac = client.mac.lower()
-            if not mac:
+            if not mac or not coord.has_client_entities(mac):
                 continue
             sanitized_mac = mac.replace(":", "")
 
-            for config in CLIENT_SENSOR_CONFIGS:
+            for config in client_sensor_configs:
                 unique_key = f"{sanitized_mac}_{config.key}"
                 if unique_key in tracked_client_metrics:
                     continue
@@ -109,7 +168,8 @@ class UbiquitiMobileSensorConfig:
 
     tag: str
     entity_description: SensorEntityDescription
-    value_fn: Callable[[UbiquitiMobileStateData], StateType]
+    value_fn: Callable[[UbiquitiMobileStateData], StateType | datetime]
+    attributes_fn: Callable[[UbiquitiMobileStateData], dict[str, Any]] | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -120,37 +180,10 @@ class UbiquitiMobileTrackerConfig:
     entity_description: TrackerEntityDescription
     latitude_fn: Callable[[UbiquitiMobileStateData], float | None]
     longitude_fn: Callable[[UbiquitiMobileStateData], float | None]
+    accuracy_fn: Callable[[UbiquitiMobileStateData], float | None]
     source_type: str = "gps"
 
 
-def _client_rate_bytes_per_second(
-    client: HighClientInfo,
-    byte_attr: str,
-    bit_attr: str,
-) -> int | None:
-    """Return client rate in bytes per second, handling bit/byte fields."""
-    value = getattr(client, byte_attr, None)
-    if value is not None:
-        return value
-
-    bit_value = getattr(client, bit_attr, None)
-    if bit_value is None:
-        return None
-
-    # Wireless metrics report bits per second; convert to bytes per second.
-    return int(bit_value / 8)
-
-
-def _client_rx_rate_value(client: HighClientInfo) -> int | None:
-    """Return receive rate in bytes per second."""
-    return _client_rate_bytes_per_second(client, "rx_rate", "rxBitRate")
-
-
-def _client_tx_rate_value(client: HighClientInfo) -> int | None:
-    """Return transmit rate in bytes per second."""
-    return _client_rate_bytes_per_second(client, "tx_rate", "txBitRate")
-
-
 def _client_connection_value(client: HighClientInfo) -> str:
     """Return normalized connection string."""
     connection = (client.connection or "").lower()
@@ -169,133 +202,583 @@ class UbiquitiMobileClientSensorConfig:
     unit_of_measurement: str | None
     device_class: SensorDeviceClass | None
     state_class: SensorStateClass | None
-    value_fn: Callable[[HighClientInfo], StateType]
+    value_fn: Callable[[HighClientInfo], StateType] | None = None
     options: tuple[str, ...] | None = None
+    # Sensors with a usage_fn read the client's accounted usage totals instead of
+    # the live client record, so they keep their value while the client is away.
+    usage_fn: Callable[[ClientUsage], StateType] | None = None
+    # Sensors with a state_fn read a value that the coordinator derives for the
+    # client's MAC, such as its stable association time.
+    state_fn: Callable[[UbiquitiMobileStateData, str], StateType | datetime] | None = (
+        None
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class UbiquitiMobileFieldMetadata:
+    """Presentation of a gateway model field as a sensor."""
+
+    tag: str | None = None
+    name: str | None = None
+    icon: str | None = None
+    unit_of_measurement: str | None = None
+    device_class: SensorDeviceClass | None = None
+    state_class: SensorStateClass | None = None
+    entity_category: EntityCategory | None = EntityCategory.DIAGNOSTIC
+    enabled: bool = False
+
+
+# Models whose scalar fields are exposed as sensors, with the attribute of
+# UbiquitiMobileStateData that holds them.
+FIELD_SENSOR_MODELS: tuple[tuple[str, type[BaseModel]], ...] = (
+    ("info", GetDeviceInfoResponse),
+    ("high", GetHighInfoResponse),
+)
+
+# Fields that are never exposed, either because they are secrets or identifiers or
+# because they are covered by other entities.
+FIELD_SENSOR_EXCLUDED: frozenset[str] = frozenset(
+    {"lte_apn_password", "client_details", "uptime", *IDENTIFIER_FIELDS}
+)
+
+# Fields without an entry here are exposed as disabled diagnostic sensors without a
+# state class, so identifiers, timestamps and status codes are not recorded as
+# long-term statistics. The tag of the fields that were exposed before sensors were
+# generated is kept so their unique ids do not change.
+FIELD_SENSOR_METADATA: dict[str, UbiquitiMobileFieldMetadata] = {
+    "wan_ip": UbiquitiMobileFieldMetadata(
+        name="Wan Ip Address",
+        icon="mdi:ip-network",
+        entity_category=None,
+        enabled=True,
+    ),
+    "lan_ip": UbiquitiMobileFieldMetadata(
+        name="Lan Ip Address",
+        icon="mdi:ip-network",
+        entity_category=None,
+        enabled=True,
+    ),
+    "total_usage": UbiquitiMobileFieldMetadata(
+        tag="data_usage",
+        name="Data Usage",
+        icon="mdi:ip-network",
+        unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=None,
+        enabled=True,
+    ),
+    "client_numbers": UbiquitiMobileFieldMetadata(
+        tag="clients",
+        name="Clients",
+        icon="mdi:counter",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=None,
+        enabled=True,
+    ),
+    # The tag "clients" belongs to client_numbers, which was exposed first.
+    "clients": UbiquitiMobileFieldMetadata(
+        tag="clients_reported",
+        name="Clients Reported",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "wifi_clients": UbiquitiMobileFieldMetadata(
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "signal_level": UbiquitiMobileFieldMetadata(
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "per": UbiquitiMobileFieldMetadata(
+        name="Packet Error Rate",
+        unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "upload_usage_avg": UbiquitiMobileFieldMetadata(
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "download_usage_avg": UbiquitiMobileFieldMetadata(
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "upload_usage": UbiquitiMobileFieldMetadata(
+        name="Upload Usage",
+        icon="mdi:upload",
+        unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=None,
+        enabled=True,
+    ),
+    "download_usage": UbiquitiMobileFieldMetadata(
+        name="Download Usage",
+        icon="mdi:download",
+        unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=None,
+        enabled=True,
+    ),
+    "experience": UbiquitiMobileFieldMetadata(
+        name="Experience",
+        icon="mdi:star-circle",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=None,
+        enabled=True,
+    ),
+    "cpu": UbiquitiMobileFieldMetadata(
+        name="CPU Usage",
+        icon="mdi:cpu-64-bit",
+        unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=None,
+        enabled=True,
+    ),
+    "memory": UbiquitiMobileFieldMetadata(
+        name="Memory Usage",
+        icon="mdi:memory",
+        unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=None,
+        enabled=True,
+    ),
+    "rssi": UbiquitiMobileFieldMetadata(
+        name="RSSI",
+        icon="mdi:signal-cellular-3",
+        unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=None,
+        enabled=True,
+    ),
+    "rsrp": UbiquitiMobileFieldMetadata(
+        name="RSRP",
+        icon="mdi:signal-cellular-3",
+        unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "rsrq": UbiquitiMobileFieldMetadata(
+        name="RSRQ",
+        icon="mdi:signal-cellular-3",
+        unit_of_measurement=SIGNAL_STRENGTH_DECIBELS,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "upload_speed": UbiquitiMobileFieldMetadata(
+        icon="mdi:upload-network",
+        unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "download_speed": UbiquitiMobileFieldMetadata(
+        icon="mdi:download-network",
+        unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        device_class=SensorDeviceClass.DATA_RATE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "latency_avg_ms": UbiquitiMobileFieldMetadata(
+        name="Latency Average",
+        unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    "latency_max_ms": UbiquitiMobileFieldMetadata(
+        name="Latency Maximum",
+        unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+}
+
+
+def _compile_field_accessor(path: str) -> Callable[[UbiquitiMobileStateData], Any]:
+    """Return a function that reads a dotted attribute path from the state data."""
+    getter = attrgetter(path)
+
+    def _accessor(data: UbiquitiMobileStateData) -> Any:
+        try:
+            return getter(data)
+        except AttributeError:
+            # The model holding the field has not been fetched.
+            return None
+
+    return _accessor
+
+
+def _build_field_sensor_configs() -> tuple[UbiquitiMobileSensorConfig, ...]:
+    """Generate a sensor config for every scalar field of the gateway models."""
+    configs: list[UbiquitiMobileSensorConfig] = []
+    for source, model in FIELD_SENSOR_MODELS:
+        for field, info in model.model_fields.items():
+            if field in FIELD_SENSOR_EXCLUDED or info.annotation not in (
+                int,
+                float,
+                str,
+            ):
+                continue
+
+            metadata = FIELD_SENSOR_METADATA.get(field, UbiquitiMobileFieldMetadata())
+            configs.append(
+                UbiquitiMobileSensorConfig(
+                    tag=metadata.tag or field,
+                    entity_description=SensorEntityDescription(
+                        key=field,
+                        name=metadata.name or field.replace("_", " ").title(),
+                        icon=metadata.icon,
+                        native_unit_of_measurement=metadata.unit_of_measurement,
+                        device_class=metadata.device_class,
+                        state_class=metadata.state_class,
+                        entity_category=metadata.entity_category,
+                        entity_registry_enabled_default=metadata.enabled,
+                    ),
+                    value_fn=_compile_field_accessor(f"{source}.{field}"),
+                )
+            )
+    return _ensure_unique_tags(tuple(configs))
+
+
+def _ensure_unique_tags(
+    configs: tuple[UbiquitiMobileSensorConfig, ...],
+) -> tuple[UbiquitiMobileSensorConfig, ...]:
+    """Return the configs, raising if two of them share a tag and so a unique id."""
+    seen: set[str] = set()
+    duplicates: set[str] = set()
+    for config in configs:
+        if config.tag in seen:
+            duplicates.add(config.tag)
+        seen.add(config.tag)
+    if duplicates:
+        msg = f"Duplicate sensor tags: {', '.join(sorted(duplicates))}"
+        raise ValueError(msg)
+    return configs
 
 
 SENSOR_CONFIGS: tuple[UbiquitiMobileSensorConfig, ...] = (
+    *_build_field_sensor_configs(),
+    # The uptime is published as the boot time, which only changes when the
+    # gateway reboots. It has its own tag, so the long-term statistics of the former
+    # Uptime duration sensor are left alone.
     UbiquitiMobileSensorConfig(
-        tag="wan_ip",
+        tag="boot_time",
         entity_description=SensorEntityDescription(
             key=DOMAIN,
-            name="Wan Ip Address",
-            icon="mdi:ip-network",
+            name="Boot Time",
+            icon="mdi:timer-outline",
+            device_class=SensorDeviceClass.TIMESTAMP,
         ),
-        value_fn=lambda data: data.info.wan_ip if data.info else None,
+        value_fn=lambda data: data.boot_time,
     ),
     UbiquitiMobileSensorConfig(
-        tag="lan_ip",
+        tag="cellular_band",
         entity_description=SensorEntityDescription(
             key=DOMAIN,
-            name="Lan Ip Address",
-            icon="mdi:ip-network",
+            name="Cellular Band",
+            icon="mdi:radio-tower",
         ),
-        value_fn=lambda data: data.info.lan_ip if data.info else None,
+        value_fn=lambda data: data.radio.band if data.radio else None,
+        attributes_fn=lambda data: data.radio.as_dict() if data.radio else {},
     ),
     UbiquitiMobileSensorConfig(
-        tag="data_usage",
+        tag="usage_burn_rate",
         entity_description=SensorEntityDescription(
             key=DOMAIN,
-            name="Data Usage",
-            icon="mdi:ip-network",
-            native_unit_of_measurement=UnitOfInformation.BYTES,
-            device_class=SensorDeviceClass.DATA_SIZE,
-            state_class=SensorStateClass.TOTAL_INCREASING,
+            name="Usage Burn Rate",
+            icon="mdi:fire",
+            native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+            device_class=SensorDeviceClass.DATA_RATE,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
         ),
-        value_fn=lambda data: data.high.total_usage if data.high else None,
+        value_fn=lambda data: data.projection.long_rate if data.projection else None,
+        attributes_fn=lambda data: {
+            "short_window_rate": data.projection.short_rate,
+            "cycle_start": data.projection.cycle_start.isoformat(),
+            "cycle_end": data.projection.cycle_end.isoformat(),
+        }
+        if data.projection
+        else {},
     ),
     UbiquitiMobileSensorConfig(
-        tag="clients",
+        tag="projected_cycle_usage",
         entity_description=SensorEntityDescription(
             key=DOMAIN,
-            name="Clients",
-            icon="mdi:counter",
+            name="Projected Cycle Usage",
+            icon="mdi:chart-timeline-variant",
+            native_unit_of_measurement=UnitOfInformation.BYTES,
+            device_class=SensorDeviceClass.DATA_SIZE,
             state_class=SensorStateClass.MEASUREMENT,
+            suggested_unit_of_measurement=UnitOfInformation.GIGABYTES,
+            suggested_display_precision=2,
         ),
-        value_fn=lambda data: data.high.client_numbers if data.high else None,
+        value_fn=lambda data: data.projection.projected_usage
+        if data.projection
+        else None,
     ),
     UbiquitiMobileSensorConfig(
-        tag="uptime",
+        tag="time_to_data_cap",
         entity_description=SensorEntityDescription(
             key=DOMAIN,
-            name="Uptime",
-            icon="mdi:timer-outline",
+            name="Time To Data Cap",
+            icon="mdi:timer-sand",
             native_unit_of_measurement=UnitOfTime.SECONDS,
             device_class=SensorDeviceClass.DURATION,
             state_class=SensorStateClass.MEASUREMENT,
+            suggested_unit_of_measurement=UnitOfTime.HOURS,
+            suggested_display_precision=1,
         ),
-        value_fn=lambda data: data.high.uptime if data.high else None,
+        value_fn=lambda data: round(data.projection.seconds_to_cap)
+        if data.projection and data.projection.seconds_to_cap is not None
+        else None,
     ),
     UbiquitiMobileSensorConfig(
-        tag="upload_usage",
+        tag="packet_loss",
         entity_description=SensorEntityDescription(
             key=DOMAIN,
-            name="Upload Usage",
-            icon="mdi:upload",
-            native_unit_of_measurement=UnitOfInformation.BYTES,
-            device_class=SensorDeviceClass.DATA_SIZE,
-            state_class=SensorStateClass.TOTAL_INCREASING,
+            name="Packet Loss",
+            icon="mdi:lan-disconnect",
+            native_unit_of_measurement=PERCENTAGE,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=1,
         ),
-        value_fn=lambda data: data.high.upload_usage if data.high else None,
+        value_fn=lambda data: data.link_quality.packet_loss
+        if data.link_quality
+        else None,
+        attributes_fn=lambda data: {
+            "interval_packet_loss": data.link_quality.interval_packet_loss,
+        }
+        if data.link_quality
+        else {},
     ),
     UbiquitiMobileSensorConfig(
-        tag="download_usage",
+        tag="latency_jitter",
         entity_description=SensorEntityDescription(
             key=DOMAIN,
-            name="Download Usage",
-            icon="mdi:download",
-            native_unit_of_measurement=UnitOfInformation.BYTES,
-            device_class=SensorDeviceClass.DATA_SIZE,
-            state_class=SensorStateClass.TOTAL_INCREASING,
+            name="Latency Jitter",
+            icon="mdi:pulse",
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=1,
         ),
-        value_fn=lambda data: data.high.download_usage if data.high else None,
+        value_fn=lambda data: data.link_quality.jitter if data.link_quality else None,
     ),
     UbiquitiMobileSensorConfig(
-        tag="experience",
+        tag="latency_median",
         entity_description=SensorEntityDescription(
             key=DOMAIN,
-            name="Experience",
-            icon="mdi:star-circle",
+            name="Latency Median",
+            icon="mdi:timer-outline",
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            device_class=SensorDeviceClass.DURATION,
             state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
         ),
-        value_fn=lambda data: data.high.experience if data.high else None,
+        value_fn=lambda data: data.link_quality.latency_p50
+        if data.link_quality
+        else None,
+        attributes_fn=lambda data: {
+            "interval_latency": data.link_quality.interval_latency,
+            "latency_max": data.link_quality.latency_max,
+        }
+        if data.link_quality
+        else {},
     ),
     UbiquitiMobileSensorConfig(
-        tag="cpu",
+        tag="latency_p95",
         entity_description=SensorEntityDescription(
             key=DOMAIN,
-            name="CPU Usage",
-            icon="mdi:cpu-64-bit",
-            native_unit_of_measurement=PERCENTAGE,
+            name="Latency 95th Percentile",
+            icon="mdi:timer-alert-outline",
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            device_class=SensorDeviceClass.DURATION,
             state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
         ),
-        value_fn=lambda data: data.high.cpu if data.high else None,
+        value_fn=lambda data: data.link_quality.latency_p95
+        if data.link_quality
+        else None,
     ),
     UbiquitiMobileSensorConfig(
-        tag="memory",
+        tag="polling_state",
         entity_description=SensorEntityDescription(
             key=DOMAIN,
-            name="Memory Usage",
-            icon="mdi:memory",
-            native_unit_of_measurement=PERCENTAGE,
-            state_class=SensorStateClass.MEASUREMENT,
+            name="Polling State",
+            icon="mdi:speedometer-slow",
+            device_class=SensorDeviceClass.ENUM,
+            options=list(POLLING_STATES),
+            entity_category=EntityCategory.DIAGNOSTIC,
         ),
-        value_fn=lambda data: data.high.memory if data.high else None,
+        value_fn=lambda data: data.polling.state if data.polling else None,
+        attributes_fn=lambda data: {
+            "interval_factor": data.polling.factor,
+            "reason": data.polling.reason,
+            "deferring_low_priority": data.polling.defer_low_priority,
+        }
+        if data.polling
+        else {},
     ),
-    UbiquitiMobileSensorConfig(
-        tag="rssi",
+)
+
+
+def _client_table_attributes(data: UbiquitiMobileStateData) -> dict[str, Any]:
+    """Return a compact row for every client in the latest sample."""
+    if not data.high:
+        return {}
+    return {
+        "clients": [
+            {
+                "mac": client.mac.lower(),
+                "host_name": client.host_name,
+                "ip": client.ip,
+                "connection": _client_connection_value(client),
+                "band": client.band,
+                "channel": client.channel,
+                "signal": client.signal,
+                "rx_rate": client_rx_rate(client),
+                "tx_rate": client_tx_rate(client),
+                "uptime": client.uptime,
+            }
+            for client in data.high.client_details
+        ]
+    }
+
+
+# Only created in compact client mode.
+CLIENT_TABLE_SENSOR_CONFIG = UbiquitiMobileSensorConfig(
+    tag="client_table",
+    entity_description=SensorEntityDescription(
+        key=DOMAIN,
+        name="Client Table",
+        icon="mdi:table-network",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    value_fn=lambda data: len(data.high.client_details) if data.high else None,
+    attributes_fn=_client_table_attributes,
+)
+
+
+def _top_talker_sensor_config(
+    tag: str, name: str, icon: str, ranking: str
+) -> UbiquitiMobileSensorConfig:
+    """Return the configuration of a sensor for one of the top talker lists."""
+
+    def _value(data: UbiquitiMobileStateData) -> StateType:
+        # The state is the rate of the busiest client, or 0 if no client reports
+        # a rate.
+        if not data.talkers:
+            return None
+        talkers: tuple[Talker, ...] = getattr(data.talkers, ranking)
+        return talkers[0].rate if talkers else 0
+
+    def _attributes(data: UbiquitiMobileStateData) -> dict[str, Any]:
+        if not data.talkers:
+            return {}
+        talkers: tuple[Talker, ...] = getattr(data.talkers, ranking)
+        return {
+            "top_client": talkers[0].host_name or talkers[0].mac if talkers else None,
+            "clients": [talker.as_dict() for talker in talkers],
+        }
+
+    return UbiquitiMobileSensorConfig(
+        tag=tag,
         entity_description=SensorEntityDescription(
             key=DOMAIN,
-            name="RSSI",
-            icon="mdi:signal-cellular-3",
-            native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
-            device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+            name=name,
+            icon=icon,
+            native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+            device_class=SensorDeviceClass.DATA_RATE,
             state_class=SensorStateClass.MEASUREMENT,
+            suggested_display_precision=0,
         ),
-        value_fn=lambda data: data.high.rssi if data.high else None,
+        value_fn=_value,
+        attributes_fn=_attributes,
+    )
+
+
+# Each lists the TOP_TALKERS busiest clients, highest rate first.
+TOP_TALKER_SENSOR_CONFIGS: tuple[UbiquitiMobileSensorConfig, ...] = (
+    _top_talker_sensor_config(
+        "top_receivers", "Top Receivers", "mdi:download-network", "rx"
+    ),
+    _top_talker_sensor_config(
+        "top_transmitters", "Top Transmitters", "mdi:upload-network", "tx"
     ),
+    _top_talker_sensor_config(
+        "top_talkers", "Top Talkers", "mdi:swap-vertical-bold", "combined"
+    ),
+)
+
+# The gateway sensors created for every entry share one unique id namespace.
+_ensure_unique_tags(
+    (*SENSOR_CONFIGS, *TOP_TALKER_SENSOR_CONFIGS, CLIENT_TABLE_SENSOR_CONFIG)
 )
 
+
+def _wifi_band_sensor_configs(band: str) -> tuple[UbiquitiMobileSensorConfig, ...]:
+    """Return the configurations of the occupancy sensors of a Wi-Fi band."""
+
+    def _occupancy(data: UbiquitiMobileStateData) -> BandOccupancy | None:
+        return data.occupancy.get(band) if data.occupancy else None
+
+    def _clients(data: UbiquitiMobileStateData) -> StateType:
+        if data.occupancy is None:
+            return None
+        # A band without clients in a sample has no occupancy entry.
+        occupancy = data.occupancy.get(band)
+        return occupancy.clients if occupancy else 0
+
+    def _clients_attributes(data: UbiquitiMobileStateData) -> dict[str, Any]:
+        if (occupancy := _occupancy(data)) is None:
+            return {}
+        return {
+            "channels": occupancy.labelled_channels(),
+            "per_histogram": occupancy.labelled_per_histogram(),
+        }
+
+    tag = f"wifi_{slugify(band)}"
+    name = f"Wi-Fi {band.upper()}"
+    return (
+        UbiquitiMobileSensorConfig(
+            tag=f"{tag}_clients",
+            entity_description=SensorEntityDescription(
+                key=DOMAIN,
+                name=f"{name} Clients",
+                icon="mdi:wifi",
+                state_class=SensorStateClass.MEASUREMENT,
+            ),
+            value_fn=_clients,
+            attributes_fn=_clients_attributes,
+        ),
+        UbiquitiMobileSensorConfig(
+            tag=f"{tag}_mean_signal",
+            entity_description=SensorEntityDescription(
+                key=DOMAIN,
+                name=f"{name} Mean Signal",
+                icon="mdi:wifi-strength-2",
+                native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+                device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+                state_class=SensorStateClass.MEASUREMENT,
+                suggested_display_precision=0,
+            ),
+            value_fn=lambda data: occupancy.mean_signal
+            if (occupancy := _occupancy(data))
+            else None,
+        ),
+        UbiquitiMobileSensorConfig(
+            tag=f"{tag}_min_signal",
+            entity_description=SensorEntityDescription(
+                key=DOMAIN,
+                name=f"{name} Min Signal",
+                icon="mdi:wifi-strength-1-alert",
+                native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+                device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+                state_class=SensorStateClass.MEASUREMENT,
+            ),
+            value_fn=lambda data: occupancy.min_signal
+            if (occupancy := _occupancy(data))
+            else None,
+        ),
+    )
+
+
 TRACKER_CONFIGS: tuple[UbiquitiMobileTrackerConfig, ...] = (
     UbiquitiMobileTrackerConfig(
         tag="location",
@@ -305,8 +788,9 @@ TRACKER_CONFIGS: tuple[UbiquitiMobileTrackerConfig, ...] = (
             icon="mdi:map-marker-radius",
             entity_category=EntityCategory.CONFIG,
         ),
-        latitude_fn=lambda data: data.gps.latitude if data.gps else None,
-        longitude_fn=lambda data: data.gps.longitude if data.gps else None,
+        latitude_fn=lambda data: data.location.latitude if data.location else None,
+        longitude_fn=lambda data: data.location.longitude if data.location else None,
+        accuracy_fn=lambda data: data.location.accuracy if data.location else None,
     ),
 )
 
@@ -337,7 +821,7 @@ CLIENT_SENSOR_CONFIGS: tuple[UbiquitiMobileClientSensorConfig, ...] = (
         unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
         device_class=SensorDeviceClass.DATA_RATE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_client_rx_rate_value,
+        value_fn=client_rx_rate,
     ),
     UbiquitiMobileClientSensorConfig(
         key="tx_rate",
@@ -346,7 +830,54 @@ CLIENT_SENSOR_CONFIGS: tuple[UbiquitiMobileClientSensorConfig, ...] = (
         unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
         device_class=SensorDeviceClass.DATA_RATE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_client_tx_rate_value,
+        value_fn=client_tx_rate,
+    ),
+    UbiquitiMobileClientSensorConfig(
+        key="signal",
+        name="Signal",
+        icon="mdi:wifi-strength-2",
+        unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda client: client.signal,
+    ),
+    UbiquitiMobileClientSensorConfig(
+        key="link_utilization",
+        name="Link Utilization",
+        icon="mdi:gauge",
+        unit_of_measurement=PERCENTAGE,
+        device_class=None,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=link_utilization,
+    ),
+    UbiquitiMobileClientSensorConfig(
+        key="rx_total",
+        name="Data Received",
+        icon="mdi:download",
+        unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        usage_fn=lambda usage: usage.rx_total,
+    ),
+    UbiquitiMobileClientSensorConfig(
+        key="tx_total",
+        name="Data Sent",
+        icon="mdi:upload",
+        unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        usage_fn=lambda usage: usage.tx_total,
+    ),
+    UbiquitiMobileClientSensorConfig(
+        key="connected_since",
+        name="Connected Since",
+        icon="mdi:clock-start",
+        unit_of_measurement=None,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        state_class=None,
+        state_fn=lambda data, mac: data.associated_at.get(mac)
+        if data.associated_at
+        else None,
     ),
 )
 
@@ -363,12 +894,26 @@ class UbiquitiMobileSensor(UbiquitiMobileEntity, SensorEntity):
         super().__init__(coordinator, config.tag)
         self.entity_description = config.entity_description
         self._value_fn = config.value_fn
+        self._attributes_fn = config.attributes_fn
 
     @property
-    def native_value(self) -> StateType:
+    def native_value(self) -> StateType | datetime:
         """Return the native value of the sensor."""
-        state_data = UbiquitiMobileStateData(**self.coordinator.data)
-        return self._value_fn(state_data)
+        return self._value_fn(self.coordinator.data)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return extra attributes for the sensor."""
+        if self._attributes_fn is None:
+            return None
+        return self._attributes_fn(self.coordinator.data)
+
+
+class UbiquitiMobileClientListSensor(UbiquitiMobileSensor):
+    """Sensor that lists clients in its attributes."""
+
+    # The client list changes with every sample and would bloat the recorder.
+    _unrecorded_attributes = frozenset({"clients"})
 
 
 class UbiquitiMobileTracker(UbiquitiMobileEntity, TrackerEntity):
@@ -384,19 +929,24 @@ class UbiquitiMobileTracker(UbiquitiMobileEntity, TrackerEntity):
         self.entity_description = config.entity_description
         self._latitude_fn = config.latitude_fn
         self._longitude_fn = config.longitude_fn
+        self._accuracy_fn = config.accuracy_fn
         self._source_type = config.source_type
 
     @property
     def latitude(self) -> float | None:
         """Return the latitude of the device."""
-        state_data = UbiquitiMobileStateData(**self.coordinator.data)
-        return self._latitude_fn(state_data)
+        return self._latitude_fn(self.coordinator.data)
 
     @property
     def longitude(self) -> float | None:
         """Return the longitude of the device."""
-        state_data = UbiquitiMobileStateData(**self.coordinator.data)
-        return self._longitude_fn(state_data)
+        return self._longitude_fn(self.coordinator.data)
+
+    @property
+    def location_accuracy(self) -> int:
+        """Return the accuracy of the location in metres (gps_accuracy)."""
+        accuracy = self._accuracy_fn(self.coordinator.data)
+        return round(accuracy) if accuracy is not None else 0
 
     @property
     def source_type(self) -> str:
@@ -466,26 +1016,25 @@ class UbiquitiMobileClientSensor(UbiquitiMobileEntity, SensorEntity):
         return combined_name
 
     @property
-    def native_value(self) -> StateType:
+    def native_value(self) -> StateType | datetime:
         """Return the current value for the metric."""
+        if self._config.state_fn is not None:
+            state_data = self.coordinator.data
+            return self._config.state_fn(state_data, self._mac) if state_data else None
+
+        if self._config.usage_fn is not None:
+            usage = self.coordinator.usage.get(self._mac)
+            return self._config.usage_fn(usage) if usage else None
+
         client = self._client
-        if not client:
+        if not client or self._config.value_fn is None:
             return None
         return self._config.value_fn(client)
 
     @property
     def _client(self) -> HighClientInfo | None:
         """Return the current client data from the coordinator."""
-        data = self.coordinator.data
-        if not data:
+        state_data = self.coordinator.data
+        if not state_data or not state_data.clients:
             return None
-
-        state_data = UbiquitiMobileStateData(**data)
-        if not state_data.high:
-            return None
-
-        for client in state_data.high.client_details:
-            if client.mac.lower() == self._mac:
-                return client
-
-        return None
+        return state_data.clients.get(self._mac)
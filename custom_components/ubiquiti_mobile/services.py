@@ -0,0 +1,86 @@
+"""Services for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.core import ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .track import to_geojson, to_gpx
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import UbiquitiDataUpdateCoordinator
+
+SERVICE_EXPORT_TRACK = "export_track"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_FORMAT = "format"
+
+FORMAT_GPX = "gpx"
+FORMAT_GEOJSON = "geojson"
+
+EXPORT_TRACK_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_FORMAT, default=FORMAT_GPX): vol.In(
+            [FORMAT_GPX, FORMAT_GEOJSON]
+        ),
+    }
+)
+
+
+def _get_coordinator(
+    hass: HomeAssistant, call: ServiceCall
+) -> UbiquitiDataUpdateCoordinator:
+    """Return the coordinator targeted by a service call."""
+    coordinators: dict[str, UbiquitiDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+
+    if (entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID)) is not None:
+        if entry_id not in coordinators:
+            msg = f"No loaded Ubiquiti Mobile gateway with entry id {entry_id}"
+            raise ServiceValidationError(msg)
+        return coordinators[entry_id]
+
+    if len(coordinators) != 1:
+        msg = "config_entry_id is required when more than one gateway is configured"
+        raise ServiceValidationError(msg)
+    return next(iter(coordinators.values()))
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def _async_export_track(call: ServiceCall) -> ServiceResponse:
+        """Export the recorded GPS track for a time range."""
+        coordinator = _get_coordinator(hass, call)
+
+        start = call.data.get(ATTR_START)
+        end = call.data.get(ATTR_END)
+        points = await coordinator.track.async_points(
+            dt_util.as_timestamp(start) if start else 0.0,
+            dt_util.as_timestamp(end) if end else float("inf"),
+        )
+
+        name = coordinator.config_entry.title
+        if call.data[ATTR_FORMAT] == FORMAT_GEOJSON:
+            return {"format": FORMAT_GEOJSON, "data": to_geojson(points, name)}
+        return {"format": FORMAT_GPX, "data": to_gpx(points, name)}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_TRACK,
+        _async_export_track,
+        schema=EXPORT_TRACK_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
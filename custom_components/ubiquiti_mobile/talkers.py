@@ -0,0 +1,130 @@
+"""Top talker and link utilization analytics for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from custom_components.ubiquiti_mobile.model.uimqtt import HighClientInfo
+
+# Number of clients ranked by each top talker list.
+TOP_TALKERS = 5
+
+
+def client_rate(client: HighClientInfo, byte_attr: str, bit_attr: str) -> int | None:
+    """Return client rate in bytes per second, handling bit/byte fields."""
+    value = getattr(client, byte_attr, None)
+    if value is not None:
+        return value
+
+    bit_value = getattr(client, bit_attr, None)
+    if bit_value is None:
+        return None
+
+    # Wireless metrics report bits per second; convert to bytes per second.
+    return int(bit_value / 8)
+
+
+def client_rx_rate(client: HighClientInfo) -> int | None:
+    """Return receive rate in bytes per second."""
+    return client_rate(client, "rx_rate", "rxBitRate")
+
+
+def client_tx_rate(client: HighClientInfo) -> int | None:
+    """Return transmit rate in bytes per second."""
+    return client_rate(client, "tx_rate", "txBitRate")
+
+
+def link_utilization(client: HighClientInfo) -> float | None:
+    """
+    Return the share of the client's link capacity in use, in percent.
+
+    The capacity is the wired link speed in Mbit/s if the gateway reports one, and
+    the negotiated wireless bit rate of each direction otherwise. Only the measured
+    rx_rate and tx_rate count as traffic; the busier direction is returned.
+    """
+    utilization: float | None = None
+    for rate, bit_rate in (
+        (client.rx_rate, client.rxBitRate),
+        (client.tx_rate, client.txBitRate),
+    ):
+        capacity = client.link_speed * 1_000_000 if client.link_speed else bit_rate
+        if rate is None or not capacity:
+            continue
+        percent = min(rate * 8 / capacity * 100, 100.0)
+        if utilization is None or percent > utilization:
+            utilization = percent
+    return round(utilization, 1) if utilization is not None else None
+
+
+@dataclass(frozen=True, slots=True)
+class Talker:
+    """A client ranked by one of the top talker lists."""
+
+    mac: str
+    host_name: str
+    rate: int
+    utilization: float | None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the talker as a dictionary."""
+        return {
+            "mac": self.mac,
+            "host_name": self.host_name,
+            "rate": self.rate,
+            "utilization": self.utilization,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class TopTalkers:
+    """The busiest clients of a sample, by direction, highest rate first."""
+
+    rx: tuple[Talker, ...]
+    tx: tuple[Talker, ...]
+    combined: tuple[Talker, ...]
+
+
+def top_talkers(
+    clients: Iterable[HighClientInfo], count: int = TOP_TALKERS
+) -> TopTalkers:
+    """
+    Rank the clients of a sample by receive, transmit and combined rate.
+
+    Only the measured rx_rate and tx_rate are ranked; the negotiated wireless bit
+    rate is the link's capacity, not its traffic. Rates are read once per client,
+    and each list is selected with a heap bounded to count entries, so a sample
+    with many clients is never fully sorted. Clients that report no measured rate
+    in either direction are not ranked.
+    """
+    rates: list[tuple[int, int, HighClientInfo]] = []
+    for client in clients:
+        rx = client.rx_rate
+        tx = client.tx_rate
+        if rx is None and tx is None:
+            continue
+        rates.append((rx or 0, tx or 0, client))
+
+    def _ranked(
+        rate_fn: Callable[[tuple[int, int, HighClientInfo]], int],
+    ) -> tuple[Talker, ...]:
+        return tuple(
+            Talker(
+                mac=client.mac.lower(),
+                host_name=client.host_name,
+                rate=rate_fn((rx, tx, client)),
+                utilization=link_utilization(client),
+            )
+            for rx, tx, client in heapq.nlargest(count, rates, key=rate_fn)
+        )
+
+    return TopTalkers(
+        rx=_ranked(itemgetter(0)),
+        tx=_ranked(itemgetter(1)),
+        combined=_ranked(lambda entry: entry[0] + entry[1]),
+    )
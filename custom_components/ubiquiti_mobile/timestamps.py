@@ -0,0 +1,46 @@
+"""Stable boot timestamp for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from custom_components.ubiquiti_mobile.model.uimqtt import GetHighInfoResponse
+
+# A derived timestamp is only replaced once it moves by more than this many
+# seconds. uptime and sample_time are whole seconds that are not read at exactly the
+# same instant, and the gateway clock may be stepped by NTP, so the derived boot
+# time wobbles by a few seconds from sample to sample.
+TIMESTAMP_TOLERANCE = 60
+
+
+class TimestampTracker:
+    """
+    Convert the gateway uptime into a boot time that only changes on reboots.
+
+    The gateway's boot time is sample_time - uptime. It is constant between
+    reboots, so the previous timestamp is kept unless the new one differs by more
+    than the tolerance. The association times of clients are tracked with their
+    presence.
+    """
+
+    def __init__(self, tolerance: float = TIMESTAMP_TOLERANCE) -> None:
+        """Initialize the tracker."""
+        self.tolerance = tolerance
+        self.boot_time: datetime | None = None
+
+    def _stable(self, previous: datetime | None, timestamp: float) -> datetime:
+        """Return the previous timestamp unless the new one moved past the tolerance."""
+        if previous is not None and abs(previous.timestamp() - timestamp) <= (
+            self.tolerance
+        ):
+            return previous
+        return dt_util.utc_from_timestamp(timestamp)
+
+    def update(self, high: GetHighInfoResponse) -> None:
+        """Derive the boot time of a new sample."""
+        self.boot_time = self._stable(self.boot_time, high.sample_time - high.uptime)
@@ -0,0 +1,317 @@
+"""GPS track buffer with simplification and GPX/GeoJSON export."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+from xml.sax.saxutils import escape
+
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .gps import GpsFix
+
+# Number of points kept in memory. Older points are dropped, or spilled to disk
+# when spilling is enabled.
+MAX_TRACK_POINTS = 10000
+# Points that lie within this distance of the line through their neighbours are
+# removed as the track is recorded.
+SIMPLIFY_TOLERANCE_METERS = 5.0
+# At most this many removed points are rechecked against each new segment; after
+# that the last point is kept, which bounds the work per fix while stationary.
+MAX_SIMPLIFIED_RUN = 256
+# Spill files are rotated once they grow past this size; one rotation is kept.
+MAX_SPILL_BYTES = 10 * 1024 * 1024
+
+EARTH_RADIUS_METERS = 6371000.0
+
+
+class TrackPoint(NamedTuple):
+    """A single recorded position."""
+
+    timestamp: float
+    latitude: float
+    longitude: float
+    accuracy: float
+
+
+def track_spill_path(hass: HomeAssistant, entry_id: str) -> Path:
+    """Return the spill file of the track of an entry."""
+    return Path(hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry_id}.track"))
+
+
+def _rotation_path(path: Path) -> Path:
+    """Return the file a spill file is rotated to."""
+    return path.with_suffix(path.suffix + ".1")
+
+
+def _recent_path(path: Path) -> Path:
+    """Return the file the in-memory points are saved to on unload."""
+    return path.with_suffix(path.suffix + ".recent")
+
+
+def remove_track_spill(path: Path) -> None:
+    """Delete a spill file, its rotation and the saved in-memory points."""
+    path.unlink(missing_ok=True)
+    _rotation_path(path).unlink(missing_ok=True)
+    _recent_path(path).unlink(missing_ok=True)
+
+
+def _format_point(point: TrackPoint) -> str:
+    """Return a point as a line of a track file."""
+    return f"{point.timestamp},{point.latitude},{point.longitude},{point.accuracy}\n"
+
+
+def _read_points(path: Path) -> list[TrackPoint]:
+    """Read the points of a track file, skipping malformed lines."""
+    if not path.exists():
+        return []
+
+    points: list[TrackPoint] = []
+    with path.open(encoding="utf-8") as track:
+        for line in track:
+            try:
+                points.append(TrackPoint(*(float(v) for v in line.split(","))))
+            except (TypeError, ValueError):
+                # A line cut short by a crash while it was written.
+                LOGGER.debug("Skipping malformed track line %r", line)
+    return points
+
+
+def _offset_meters(origin: TrackPoint, point: TrackPoint) -> tuple[float, float]:
+    """Project a point onto a local plane around origin, in metres."""
+    scale = math.cos(math.radians(origin.latitude))
+    x = math.radians(point.longitude - origin.longitude) * scale * EARTH_RADIUS_METERS
+    y = math.radians(point.latitude - origin.latitude) * EARTH_RADIUS_METERS
+    return x, y
+
+
+def _cross_track_meters(
+    start: TrackPoint, middle: TrackPoint, end: TrackPoint
+) -> float:
+    """Return the distance of middle from the segment start-end, in metres."""
+    mx, my = _offset_meters(start, middle)
+    ex, ey = _offset_meters(start, end)
+    length_sq = ex * ex + ey * ey
+    if length_sq == 0:
+        return math.hypot(mx, my)
+
+    t = max(0.0, min(1.0, (mx * ex + my * ey) / length_sq))
+    return math.hypot(mx - t * ex, my - t * ey)
+
+
+class GpsTrack:
+    """
+    Bounded record of published GPS fixes.
+
+    The last recorded point is provisional. When a new point arrives, the
+    provisional point and every point it replaced since the last kept point are
+    checked against the segment from the last kept point to the new point; if all
+    of them lie within the tolerance, the provisional point is replaced. Otherwise
+    it is kept and the new point becomes provisional. Since every removed point is
+    checked against the segment that finally replaces it, the error never exceeds
+    the tolerance, even on gentle curves, while straight stretches and stationary
+    periods are reduced to two points.
+
+    When spilling is enabled, the points held in memory are saved next to the spill
+    file when the entry unloads or Home Assistant stops, and loaded again on setup.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        spill_path: Path | None = None,
+        max_points: int = MAX_TRACK_POINTS,
+        tolerance: float = SIMPLIFY_TOLERANCE_METERS,
+    ) -> None:
+        """Initialize an empty track."""
+        self._hass = hass
+        self._spill_path = spill_path
+        self._max_points = max_points
+        self._tolerance = tolerance
+        self._points: deque[TrackPoint] = deque()
+        self._pending_spill: list[TrackPoint] = []
+        # Points removed since the last kept point, which is points[-2].
+        self._simplified: list[TrackPoint] = []
+        # False while the last point was loaded from disk, as the points it replaced
+        # are not saved and it can therefore not be checked against a new segment.
+        self._provisional = True
+
+    def __len__(self) -> int:
+        """Return the number of points held in memory."""
+        return len(self._points)
+
+    def append(self, fix: GpsFix) -> None:
+        """Record a published fix."""
+        point = TrackPoint(
+            float(fix.timestamp), fix.latitude, fix.longitude, fix.accuracy
+        )
+        points = self._points
+
+        if (
+            self._provisional
+            and len(points) >= 2  # noqa: PLR2004
+            and len(self._simplified) < MAX_SIMPLIFIED_RUN
+        ):
+            anchor = points[-2]
+            if all(
+                _cross_track_meters(anchor, removed, point) <= self._tolerance
+                for removed in (*self._simplified, points[-1])
+            ):
+                self._simplified.append(points[-1])
+                points[-1] = point
+                return
+
+        self._simplified = []
+        self._provisional = True
+        points.append(point)
+        if len(points) > self._max_points:
+            evicted = points.popleft()
+            if self._spill_path is not None:
+                self._pending_spill.append(evicted)
+
+    async def async_flush(self) -> None:
+        """Write evicted points to the spill file."""
+        if not self._pending_spill or self._spill_path is None:
+            return
+
+        batch, self._pending_spill = self._pending_spill, []
+        await self._hass.async_add_executor_job(self._write_spill, batch)
+
+    async def async_load(self) -> None:
+        """
+        Load the in-memory points saved by the previous run.
+
+        The saved file is deleted once it has been read, so that a crash before the
+        next save cannot load the same points twice.
+        """
+        if self._spill_path is None:
+            return
+
+        points = await self._hass.async_add_executor_job(
+            self._load_recent, self._spill_path
+        )
+        self._points.extendleft(reversed(points[-self._max_points :]))
+        self._provisional = not points
+        evicted = points[: -self._max_points]
+        if evicted:
+            self._pending_spill = evicted + self._pending_spill
+            await self.async_flush()
+
+    async def async_save(self) -> None:
+        """Spill evicted points and save the points held in memory."""
+        if self._spill_path is None:
+            return
+
+        await self.async_flush()
+        await self._hass.async_add_executor_job(
+            self._save_recent, self._spill_path, list(self._points)
+        )
+
+    @staticmethod
+    def _load_recent(path: Path) -> list[TrackPoint]:
+        """Read and delete the saved in-memory points."""
+        recent = _recent_path(path)
+        points = _read_points(recent)
+        recent.unlink(missing_ok=True)
+        return points
+
+    @staticmethod
+    def _save_recent(path: Path, points: list[TrackPoint]) -> None:
+        """Replace the saved in-memory points."""
+        recent = _recent_path(path)
+        recent.parent.mkdir(parents=True, exist_ok=True)
+        temporary = recent.with_suffix(recent.suffix + ".tmp")
+        with temporary.open("w", encoding="utf-8") as track:
+            track.writelines(_format_point(p) for p in points)
+        temporary.replace(recent)
+
+    async def async_points(self, start: float, end: float) -> list[TrackPoint]:
+        """Return recorded points with start <= timestamp <= end, oldest first."""
+        points: list[TrackPoint] = []
+        if self._spill_path is not None and (
+            not self._points or start < self._points[0].timestamp
+        ):
+            points = await self._hass.async_add_executor_job(
+                self._read_spill, start, end
+            )
+            points.extend(p for p in self._pending_spill if start <= p.timestamp <= end)
+
+        points.extend(p for p in self._points if start <= p.timestamp <= end)
+        return points
+
+    def _write_spill(self, batch: list[TrackPoint]) -> None:
+        """Append points to the spill file, rotating it when it grows too large."""
+        path = self._spill_path
+        if path is None:
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists() and path.stat().st_size > MAX_SPILL_BYTES:
+            path.replace(_rotation_path(path))
+
+        with path.open("a", encoding="utf-8") as spill:
+            spill.writelines(_format_point(p) for p in batch)
+
+    def _read_spill(self, start: float, end: float) -> list[TrackPoint]:
+        """Read spilled points within the time range."""
+        path = self._spill_path
+        if path is None:
+            return []
+
+        return [
+            point
+            for candidate in (_rotation_path(path), path)
+            for point in _read_points(candidate)
+            if start <= point.timestamp <= end
+        ]
+
+
+def _isoformat(timestamp: float) -> str:
+    """Format a unix timestamp as an ISO 8601 UTC string."""
+    return dt_util.utc_from_timestamp(timestamp).isoformat()
+
+
+def to_gpx(points: list[TrackPoint], name: str) -> str:
+    """Render points as a GPX 1.1 document."""
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<gpx version="1.1" creator="ubiquiti_mobile" '
+        'xmlns="http://www.topografix.com/GPX/1/1">',
+        f"<trk><name>{escape(name)}</name><trkseg>",
+    ]
+    lines.extend(
+        f'<trkpt lat="{p.latitude:.7f}" lon="{p.longitude:.7f}">'
+        f"<time>{_isoformat(p.timestamp)}</time></trkpt>"
+        for p in points
+    )
+    lines.append("</trkseg></trk></gpx>")
+    return "\n".join(lines)
+
+
+def to_geojson(points: list[TrackPoint], name: str) -> dict[str, Any]:
+    """Render points as a GeoJSON feature collection with a single LineString."""
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "LineString",
+                    "coordinates": [[p.longitude, p.latitude] for p in points],
+                },
+                "properties": {
+                    "name": name,
+                    "times": [_isoformat(p.timestamp) for p in points],
+                    "accuracy": [round(p.accuracy, 1) for p in points],
+                },
+            }
+        ],
+    }
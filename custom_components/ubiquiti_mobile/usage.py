@@ -0,0 +1,176 @@
+"""Per-client data usage accounting for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.ubiquiti_mobile.model.uimqtt import HighClientInfo
+
+USAGE_STORAGE_VERSION = 1
+# The statistics sums are stored here as well, so removing an entry does not need
+# to import the recorder through usage_statistics.
+USAGE_STATISTICS_STORAGE_VERSION = 1
+# Changes are written at most this often, in seconds. Home Assistant also flushes
+# a pending write on shutdown.
+USAGE_SAVE_DELAY = 60
+
+
+def usage_storage_key(entry_id: str) -> str:
+    """Return the storage key for the usage counters of an entry."""
+    return f"{DOMAIN}.{entry_id}.usage"
+
+
+def usage_statistics_storage_key(entry_id: str) -> str:
+    """Return the storage key for the statistics sums of an entry."""
+    return f"{DOMAIN}.{entry_id}.usage_statistics"
+
+
+@dataclass(slots=True)
+class ClientUsage:
+    """Monotonic usage totals of a single client."""
+
+    rx_total: int = 0
+    tx_total: int = 0
+    # Raw counters and session markers from the last sample, used to detect resets.
+    rx_last: int = 0
+    tx_last: int = 0
+    uptime: int | None = None
+    # When the client was last reported, as a unix timestamp.
+    last_seen: float | None = None
+
+
+class ClientUsageAccountant:
+    """
+    Turn the gateway's per-client byte counters into monotonic totals.
+
+    rxAggrBytes/txAggrBytes restart from zero whenever a client reconnects or the
+    gateway reboots. A reset is detected from a falling counter, a falling client
+    uptime or a falling gateway uptime; the counter value after a reset is counted
+    in full. A changed association time alone is not treated as a reset, because
+    roaming between bands does not necessarily clear the counters.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the accountant."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, USAGE_STORAGE_VERSION, usage_storage_key(entry_id)
+        )
+        self._clients: dict[str, ClientUsage] = {}
+        self._gateway_uptime: int | None = None
+        self._save_scheduled = False
+
+    def get(self, mac: str) -> ClientUsage | None:
+        """Return the usage of a client, if it has been seen."""
+        return self._clients.get(mac)
+
+    async def async_load(self) -> None:
+        """Load persisted totals."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+
+        self._gateway_uptime = stored.get("uptime")
+        self._clients = {
+            mac: ClientUsage(*values) for mac, values in stored["clients"].items()
+        }
+        # Totals stored before last_seen was recorded start their expiry now.
+        now = dt_util.utcnow().timestamp()
+        for usage in self._clients.values():
+            if usage.last_seen is None:
+                usage.last_seen = now
+
+    def update(
+        self, clients: Iterable[HighClientInfo], gateway_uptime: int, now: float
+    ) -> None:
+        """Account the counters of a new sample."""
+        rebooted = (
+            self._gateway_uptime is not None and gateway_uptime < self._gateway_uptime
+        )
+        self._gateway_uptime = gateway_uptime
+
+        records = self._clients
+        for client in clients:
+            mac = client.mac.lower()
+            if not mac:
+                continue
+
+            record = records.get(mac)
+            if record is None:
+                # The counters of a newly seen client cover its current session.
+                records[mac] = ClientUsage(
+                    rx_total=client.rxAggrBytes,
+                    tx_total=client.txAggrBytes,
+                    rx_last=client.rxAggrBytes,
+                    tx_last=client.txAggrBytes,
+                    uptime=client.uptime,
+                    last_seen=now,
+                )
+                continue
+
+            reset = rebooted or (
+                client.uptime is not None
+                and record.uptime is not None
+                and client.uptime < record.uptime
+            )
+            rx, tx = client.rxAggrBytes, client.txAggrBytes
+            record.rx_total += (
+                rx if reset or rx < record.rx_last else rx - record.rx_last
+            )
+            record.tx_total += (
+                tx if reset or tx < record.tx_last else tx - record.tx_last
+            )
+            record.rx_last = rx
+            record.tx_last = tx
+            record.uptime = client.uptime
+            record.last_seen = now
+
+        self._async_schedule_save()
+
+    def expire(self, before: float) -> list[str]:
+        """Forget the clients last seen before the given time and return their MACs."""
+        expired = [
+            mac
+            for mac, usage in self._clients.items()
+            if usage.last_seen is not None and usage.last_seen < before
+        ]
+        for mac in expired:
+            del self._clients[mac]
+        if expired:
+            self._async_schedule_save()
+        return expired
+
+    def _async_schedule_save(self) -> None:
+        """Coalesce changes into a single delayed write."""
+        if self._save_scheduled:
+            return
+        self._save_scheduled = True
+        self._store.async_delay_save(self._data_to_save, USAGE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        self._save_scheduled = False
+        return {
+            "uptime": self._gateway_uptime,
+            "clients": {
+                mac: [
+                    usage.rx_total,
+                    usage.tx_total,
+                    usage.rx_last,
+                    usage.tx_last,
+                    usage.uptime,
+                    usage.last_seen,
+                ]
+                for mac, usage in self._clients.items()
+            },
+        }
@@ -0,0 +1,134 @@
+"""Long-term usage statistics for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+from homeassistant.const import UnitOfInformation
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .usage import (
+    USAGE_SAVE_DELAY,
+    USAGE_STATISTICS_STORAGE_VERSION,
+    usage_statistics_storage_key,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.ubiquiti_mobile.model.uimqtt import GetHighInfoResponse
+
+    from .usage import ClientUsageAccountant
+
+# Gateway counters imported as statistics, with the name of their series.
+GATEWAY_USAGE_SERIES: tuple[tuple[str, str], ...] = (
+    ("total_usage", "Data Usage"),
+    ("upload_usage", "Upload Usage"),
+    ("download_usage", "Download Usage"),
+)
+
+
+class UsageStatisticsImporter:
+    """
+    Import hourly usage statistics directly into the recorder.
+
+    Every poll records the current cumulative sum of each series; at the first
+    poll of a new hour the last sums of the previous hour are imported as external
+    statistics, one row per series, in a single pass. The gateway's usage counters
+    restart every billing cycle, so their sums are accumulated here from the
+    counter deltas and persisted, with a falling counter counted in full. Client
+    sums are the monotonic totals of the usage accountant, which are already
+    persisted. Rows of the hour in progress are lost on restart, but the sums stay
+    continuous, so the next hour accounts for the gap.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the importer."""
+        self._hass = hass
+        self._statistic_prefix = f"{DOMAIN}:{entry_id.lower()}"
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            USAGE_STATISTICS_STORAGE_VERSION,
+            usage_statistics_storage_key(entry_id),
+        )
+        self._gateway_sums: dict[str, int] = {}
+        self._gateway_counters: dict[str, int] = {}
+        self._hour: datetime | None = None
+        # The latest sum of every series seen in the current hour, with its name.
+        self._pending: dict[str, tuple[str, int]] = {}
+
+    async def async_load(self) -> None:
+        """Load the persisted gateway sums."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        self._gateway_sums = stored["sums"]
+        self._gateway_counters = stored["counters"]
+
+    def update(
+        self,
+        high: GetHighInfoResponse,
+        usage: ClientUsageAccountant,
+        now: datetime,
+    ) -> None:
+        """Record the sums of a new sample, importing the previous hour if it ended."""
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        if self._hour is not None and hour != self._hour:
+            self._async_import(self._hour)
+        self._hour = hour
+
+        pending = self._pending
+        for field, name in GATEWAY_USAGE_SERIES:
+            counter: int = getattr(high, field)
+            last = self._gateway_counters.get(field)
+            total = self._gateway_sums.get(field, 0) + (
+                counter if last is None or counter < last else counter - last
+            )
+            self._gateway_sums[field] = total
+            self._gateway_counters[field] = counter
+            pending[f"{self._statistic_prefix}_{field}"] = (name, total)
+
+        for client in high.client_details:
+            mac = client.mac.lower()
+            if (client_usage := usage.get(mac)) is None:
+                continue
+            name = client.host_name or mac.upper()
+            statistic_id = f"{self._statistic_prefix}_client_{mac.replace(':', '')}"
+            pending[f"{statistic_id}_rx"] = (
+                f"{name} Data Received",
+                client_usage.rx_total,
+            )
+            pending[f"{statistic_id}_tx"] = (f"{name} Data Sent", client_usage.tx_total)
+
+    def _async_import(self, hour: datetime) -> None:
+        """Import the sums of an hour that has ended."""
+        for statistic_id, (name, total) in self._pending.items():
+            metadata = StatisticMetaData(
+                has_mean=False,
+                has_sum=True,
+                name=name,
+                source=DOMAIN,
+                statistic_id=statistic_id,
+                unit_of_measurement=UnitOfInformation.BYTES,
+            )
+            async_add_external_statistics(
+                self._hass,
+                metadata,
+                [StatisticData(start=hour, state=total, sum=total)],
+            )
+        self._pending = {}
+        self._store.async_delay_save(self._data_to_save, USAGE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {"sums": self._gateway_sums, "counters": self._gateway_counters}
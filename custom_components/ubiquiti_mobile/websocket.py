@@ -0,0 +1,252 @@
+"""Websocket API for ubiquiti_mobile."""
+
+from __future__ import annotations
+
+import weakref
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import UbiquitiDataUpdateCoordinator
+    from .data import UbiquitiMobileStateData
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+
+# Gateway fields that are never sent, either because they are secrets or because
+# they are sent separately.
+GATEWAY_EXCLUDED_FIELDS = frozenset({"lte_apn_password", "client_details"})
+
+COMMAND_SCHEMA = {vol.Optional(ATTR_CONFIG_ENTRY_ID): str}
+
+# Sent when an entry unloads, formatted with its entry id.
+SIGNAL_ENTRY_UNLOADED = f"{DOMAIN}_websocket_unloaded_{{}}"
+
+
+def snapshot(data: UbiquitiMobileStateData | None) -> dict[str, Any]:
+    """Return the client table, gateway metrics and GPS of a coordinator update."""
+    if data is None:
+        return {"gateway": {}, "clients": {}, "gps": None, "location": None}
+    return {
+        "gateway": {
+            **(
+                data.info.model_dump(exclude=GATEWAY_EXCLUDED_FIELDS)
+                if data.info
+                else {}
+            ),
+            **(
+                data.high.model_dump(exclude=GATEWAY_EXCLUDED_FIELDS)
+                if data.high
+                else {}
+            ),
+        },
+        "clients": {
+            client.mac.lower(): client.model_dump()
+            for client in (data.high.client_details if data.high else ())
+        },
+        "gps": data.gps.model_dump() if data.gps else None,
+        "location": asdict(data.location) if data.location else None,
+    }
+
+
+def snapshot_delta(previous: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return the parts of a snapshot that changed.
+
+    Gateway fields and client rows are compared one by one; only changed fields,
+    added or changed client rows and the MACs of removed clients are included.
+    """
+    delta: dict[str, Any] = {}
+
+    old_gateway = previous["gateway"]
+    gateway = {
+        key: value
+        for key, value in current["gateway"].items()
+        if old_gateway.get(key) != value
+    }
+    if gateway:
+        delta["gateway"] = gateway
+
+    old_clients = previous["clients"]
+    clients = {
+        mac: row
+        for mac, row in current["clients"].items()
+        if old_clients.get(mac) != row
+    }
+    if clients:
+        delta["clients"] = clients
+    removed = [mac for mac in old_clients if mac not in current["clients"]]
+    if removed:
+        delta["removed_clients"] = removed
+
+    for key in ("gps", "location"):
+        if current[key] != previous[key]:
+            delta[key] = current[key]
+    return delta
+
+
+class SnapshotCache:
+    """
+    The snapshot of a coordinator's latest update, shared by all commands.
+
+    The snapshot is built once per update, and the delta from the previous
+    snapshot once for all subscribers that saw it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._data: UbiquitiMobileStateData | None = None
+        self._snapshot = snapshot(None)
+        self._delta_from: dict[str, Any] | None = None
+        self._delta: dict[str, Any] = {}
+
+    def snapshot(self, data: UbiquitiMobileStateData | None) -> dict[str, Any]:
+        """Return the snapshot of an update."""
+        if data is not self._data:
+            self._data = data
+            self._snapshot = snapshot(data)
+            self._delta_from = None
+        return self._snapshot
+
+    def delta(
+        self, previous: dict[str, Any], data: UbiquitiMobileStateData | None
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Return the snapshot of an update and its changes since a snapshot."""
+        current = self.snapshot(data)
+        if previous is not self._delta_from:
+            self._delta_from = previous
+            self._delta = snapshot_delta(previous, current)
+        return current, self._delta
+
+
+# Released with the coordinator when its entry unloads.
+_CACHES: weakref.WeakKeyDictionary[UbiquitiDataUpdateCoordinator, SnapshotCache] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_cache(coordinator: UbiquitiDataUpdateCoordinator) -> SnapshotCache:
+    """Return the snapshot cache of a coordinator."""
+    if (cache := _CACHES.get(coordinator)) is None:
+        cache = _CACHES[coordinator] = SnapshotCache()
+    return cache
+
+
+def _get_coordinator(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> UbiquitiDataUpdateCoordinator | None:
+    """Return the coordinator a command targets, or send an error."""
+    coordinators: dict[str, UbiquitiDataUpdateCoordinator] = hass.data.get(DOMAIN, {})
+
+    if (entry_id := msg.get(ATTR_CONFIG_ENTRY_ID)) is not None:
+        if entry_id not in coordinators:
+            connection.send_error(
+                msg["id"],
+                websocket_api.ERR_NOT_FOUND,
+                f"No loaded Ubiquiti Mobile gateway with entry id {entry_id}",
+            )
+            return None
+        return coordinators[entry_id]
+
+    if len(coordinators) != 1:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_INVALID_FORMAT,
+            "config_entry_id is required when more than one gateway is configured",
+        )
+        return None
+    return next(iter(coordinators.values()))
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): f"{DOMAIN}/snapshot", **COMMAND_SCHEMA}
+)
+@callback
+def websocket_snapshot(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the current snapshot in a single message."""
+    if (coordinator := _get_coordinator(hass, connection, msg)) is None:
+        return
+    connection.send_result(
+        msg["id"], _get_cache(coordinator).snapshot(coordinator.data)
+    )
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): f"{DOMAIN}/subscribe", **COMMAND_SCHEMA}
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """
+    Send the current snapshot, then the changes of every poll.
+
+    The subscription ends with an unloaded event when the entry unloads, since a
+    reload replaces the coordinator; clients subscribe again to follow the new one.
+    """
+    if (coordinator := _get_coordinator(hass, connection, msg)) is None:
+        return
+
+    cache = _get_cache(coordinator)
+    previous = cache.snapshot(coordinator.data)
+
+    @callback
+    def _async_forward_delta() -> None:
+        nonlocal previous
+        previous, delta = cache.delta(previous, coordinator.data)
+        if delta:
+            connection.send_message(
+                websocket_api.event_message(msg["id"], {"delta": delta})
+            )
+
+    remove_listener = coordinator.async_add_listener(_async_forward_delta)
+
+    @callback
+    def _async_unsubscribe() -> None:
+        remove_listener()
+        remove_dispatcher()
+
+    @callback
+    def _async_entry_unloaded() -> None:
+        if connection.subscriptions.pop(msg["id"], None) is not None:
+            _async_unsubscribe()
+            connection.send_message(
+                websocket_api.event_message(msg["id"], {"unloaded": True})
+            )
+
+    remove_dispatcher = async_dispatcher_connect(
+        hass,
+        SIGNAL_ENTRY_UNLOADED.format(coordinator.config_entry.entry_id),
+        _async_entry_unloaded,
+    )
+    connection.subscriptions[msg["id"]] = _async_unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(msg["id"], {"snapshot": previous})
+    )
+
+
+@callback
+def async_end_subscriptions(hass: HomeAssistant, entry_id: str) -> None:
+    """End the subscriptions to an entry that is unloading."""
+    async_dispatcher_send(hass, SIGNAL_ENTRY_UNLOADED.format(entry_id))
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_snapshot)
+    websocket_api.async_register_command(hass, websocket_subscribe)
@@ -0,0 +1,168 @@
+"""
+Measure how long the integration takes to import when Home Assistant loads it.
+
+Every run starts a fresh interpreter. It first imports the Home Assistant modules
+that are already loaded when an integration is set up, then times importing the
+integration's entry points and each module Home Assistant imports with them, in
+the same order. The median of the runs is reported per stage. With --profile, the
+modules that took the longest to import, excluding their own imports, are listed
+as well.
+
+The Home Assistant modules are timed in the same runs. If the median total of the
+integration exceeds the given ratio of their median, the benchmark exits with
+status 1, which guards Home Assistant's boot time against regressions. Comparing
+against a baseline measured on the same machine keeps the check stable on runners
+of varying speed.
+
+Run from the repository root, with the requirements from scripts/setup installed:
+    python -m scripts.bench_import [--runs 7] [--ratio 0.5] [--profile 15]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGE = "custom_components.ubiquiti_mobile"
+# Modules Home Assistant has imported before it sets up the integration.
+BASELINE = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.helpers.storage",
+    "homeassistant.components.http",
+    "homeassistant.components.websocket_api",
+    "homeassistant.components.sensor",
+    "homeassistant.components.device_tracker",
+)
+# Modules imported when the integration is loaded and its entry set up, by stage.
+# config_flow and diagnostics are preloaded with the entry points, the platforms
+# are imported when the entry is forwarded to them.
+STAGES = (
+    ("entry points", PACKAGE),
+    ("config flow", f"{PACKAGE}.config_flow"),
+    ("diagnostics", f"{PACKAGE}.diagnostics"),
+    ("sensor", f"{PACKAGE}.sensor"),
+    ("device tracker", f"{PACKAGE}.device_tracker"),
+)
+# Written to stderr between the baseline and the measured imports, so the
+# -X importtime report of the integration can be told apart.
+MARKER = "bench_import: baseline imported"
+
+CHILD = """
+import importlib, json, sys, time
+
+baseline, stages, marker = json.loads(sys.argv[1])
+started = time.perf_counter()
+for name in baseline:
+    importlib.import_module(name)
+baseline_time = time.perf_counter() - started
+print(marker, file=sys.stderr, flush=True)
+timings = {}
+for stage, name in stages:
+    started = time.perf_counter()
+    importlib.import_module(name)
+    timings[stage] = time.perf_counter() - started
+print(json.dumps([baseline_time, timings]))
+"""
+
+
+def run_once(*, profile: bool) -> tuple[float, dict[str, float], str]:
+    """
+    Import the integration in a fresh interpreter.
+
+    Returns the import time of the baseline, the stage timings and the
+    -X importtime report.
+    """
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            *(("-X", "importtime") if profile else ()),
+            "-c",
+            CHILD,
+            json.dumps([BASELINE, STAGES, MARKER]),
+        ],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).resolve().parent.parent,
+        text=True,
+    )
+    baseline, timings = json.loads(result.stdout)
+    return baseline, timings, result.stderr
+
+
+def slowest_imports(report: str, count: int) -> list[tuple[int, str]]:
+    """Return the modules with the longest own import time from -X importtime."""
+    _, _, measured = report.partition(MARKER)
+    imports: list[tuple[int, str]] = []
+    for line in measured.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        own, _, name = line.removeprefix("import time:").split("|")
+        if own.strip().isdigit():
+            imports.append((int(own), name.strip()))
+    return sorted(imports, reverse=True)[:count]
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--runs", type=int, default=7, help="interpreters to time")
+    parser.add_argument(
+        "--ratio",
+        type=float,
+        default=0.5,
+        help="maximum median import time of the integration, as a ratio of the"
+        " median import time of the Home Assistant baseline",
+    )
+    parser.add_argument(
+        "--profile",
+        type=int,
+        default=0,
+        metavar="COUNT",
+        help="list the COUNT modules with the longest own import time",
+    )
+    args = parser.parse_args()
+
+    runs = [run_once(profile=False) for _ in range(args.runs)]
+    print(f"{'stage':<16} {'median ms':>10} {'min ms':>8} {'max ms':>8}")
+    for stage, _ in STAGES:
+        values = [timings[stage] * 1000 for _, timings, _ in runs]
+        print(
+            f"{stage:<16} {statistics.median(values):>10.1f}"
+            f" {min(values):>8.1f} {max(values):>8.1f}"
+        )
+    totals = [sum(timings.values()) * 1000 for _, timings, _ in runs]
+    total = statistics.median(totals)
+    print(f"{'total':<16} {total:>10.1f} {min(totals):>8.1f} {max(totals):>8.1f}")
+    baselines = [baseline * 1000 for baseline, _, _ in runs]
+    baseline = statistics.median(baselines)
+    print(
+        f"{'home assistant':<16} {baseline:>10.1f}"
+        f" {min(baselines):>8.1f} {max(baselines):>8.1f}"
+    )
+
+    if args.profile:
+        _, _, report = run_once(profile=True)
+        print(f"\n{'own ms':>8}  module")
+        for own, name in slowest_imports(report, args.profile):
+            print(f"{own / 1000:>8.1f}  {name}")
+
+    budget = baseline * args.ratio
+    if total > budget:
+        print(
+            f"\nFAIL: {total:.1f} ms exceeds {args.ratio:g} times the Home Assistant"
+            f" baseline, {budget:.1f} ms"
+        )
+        sys.exit(1)
+    print(f"\nOK: {total / baseline:.2f} times the Home Assistant baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Measure the event loop lag caused by parsing InfoHighDump responses.
+
+Synthetic responses with a growing number of clients are parsed through the API
+client, once with decoding and validation on the event loop and once in the
+executor, while a probe task measures how late the event loop runs its callbacks.
+
+Run from the repository root:
+    python -m scripts.bench_parse [--clients 10 100 1000 5000] [--polls 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from custom_components.ubiquiti_mobile import api
+from custom_components.ubiquiti_mobile.api import UbiquitiMobileApiClient
+from custom_components.ubiquiti_mobile.data import SessionData
+from custom_components.ubiquiti_mobile.model.uimqtt import (
+    GetHighInfoResponse,
+    HighClientInfo,
+)
+from scripts.replay import async_probe_loop_lag, percentile
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+# Values used for the required fields of the synthetic responses, by type.
+PLACEHOLDERS: dict[Any, Any] = {str: "placeholder", int: 1, bool: False}
+MODES = (("event loop", float("inf")), ("executor", 0))
+
+
+def _placeholders(model: type[BaseModel]) -> dict[str, Any]:
+    """Return placeholder values for the required fields of a model."""
+    return {
+        name: PLACEHOLDERS[field.annotation]
+        for name, field in model.model_fields.items()
+        if field.is_required()
+    }
+
+
+def synthetic_high_info(clients: int) -> bytes:
+    """Return an InfoHighDump response body with the given number of clients."""
+    result = _placeholders(GetHighInfoResponse)
+    client = _placeholders(HighClientInfo)
+    for index in range(clients):
+        high_byte, low_byte = divmod(index, 256)
+        result[f"client{index}"] = {
+            **client,
+            "mac": f"02:00:00:00:{high_byte:02x}:{low_byte:02x}",
+            "host_name": f"client-{index}",
+        }
+    return json.dumps({"jsonrpc": "2.0", "id": 1, "result": result}).encode()
+
+
+class BenchApiClient(UbiquitiMobileApiClient):
+    """API client that answers every request with the same body."""
+
+    def __init__(self, session: aiohttp.ClientSession, body: bytes) -> None:
+        """Initialize the client."""
+        super().__init__(SessionData(token="bench"), session)  # noqa: S106
+        self._body = body
+
+    async def _api_request(
+        self,
+        method: str,  # noqa: ARG002
+        path: str,  # noqa: ARG002
+        data: dict | None = None,  # noqa: ARG002
+    ) -> bytes:
+        """Return the synthetic response body."""
+        return self._body
+
+
+async def async_bench(client_counts: list[int], polls: int) -> None:
+    """Run the benchmark and print the results."""
+    print(
+        f"{'clients':>8} {'size':>10} {'mode':>11}"
+        f" {'parse ms':>9} {'lag p95 ms':>11} {'lag max ms':>11}"
+    )
+    async with aiohttp.ClientSession() as session:
+        for clients in client_counts:
+            body = synthetic_high_info(clients)
+            client = BenchApiClient(session, body)
+            for mode, threshold in MODES:
+                api.PARSE_IN_EXECUTOR_BYTES = threshold
+                lag: list[float] = []
+                probe = asyncio.create_task(async_probe_loop_lag(lag))
+                await asyncio.sleep(0)
+
+                started = time.perf_counter()
+                for _ in range(polls):
+                    await client.get_high_info()
+                    # Give the probe a chance to run between polls.
+                    await asyncio.sleep(0.001)
+                elapsed = time.perf_counter() - started - polls * 0.001
+                probe.cancel()
+
+                lag_ms = [value * 1000 for value in lag]
+                print(
+                    f"{clients:>8} {len(body) / 1024:>7.0f} KiB {mode:>11}"
+                    f" {elapsed / polls * 1000:>9.2f}"
+                    f" {percentile(lag_ms, 95):>11.2f}"
+                    f" {max(lag_ms, default=0):>11.2f}"
+                )
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--clients",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000, 5000],
+        help="client counts of the synthetic responses",
+    )
+    parser.add_argument("--polls", type=int, default=20, help="polls per measurement")
+    args = parser.parse_args()
+    asyncio.run(async_bench(args.clients, args.polls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""
+Simulate days of client churn and check that memory use stays bounded.
+
+The first poll of a capture is used as a template. The harness sets up the
+integration in a throwaway Home Assistant instance, like scripts.replay, and feeds
+it synthetic InfoHighDump samples in which a population of clients joins, leaves,
+roams between bands and resets its counters. Returning clients often come back
+with a new MAC address, as phones with randomized addresses do, so new clients keep
+appearing and per-client state is only bounded if departed clients expire.
+Simulated time advances by the poll interval on every poll, without waiting, and
+Home Assistant's clock follows it, so the consider-home period and client expiry
+play out as they would in real time. The client expiry is shortened to --expiry
+hours so that it takes effect within the simulation.
+
+Allocations are tracked with tracemalloc, and the integration's own footprint by
+category is sampled at every checkpoint. The first simulated day is a warm-up that
+fills every rolling window; if the traced memory grows by more than the tolerance
+after that, the harness exits with status 1.
+
+Run from the repository root:
+    python -m scripts.churn CAPTURE [--days 2] [--clients 40] [--expiry 6]
+        [--tolerance 1024]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import random
+import sys
+import tempfile
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.ubiquiti_mobile.memory import MemoryFootprint, memory_footprint
+from scripts.replay import (
+    HIGH_INFO_METHOD,
+    ReplayFeed,
+    ReplayPoll,
+    async_setup_hass,
+    async_setup_replay_entry,
+    load_polls,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+POLL_SECONDS = 5
+CHECKPOINT_SECONDS = 6 * 3600
+WARM_UP_SECONDS = 86400
+# Mean duration of a client's sessions and of the gaps between them, in seconds.
+MEAN_SESSION_SECONDS = 2 * 3600
+MEAN_ABSENCE_SECONDS = 3600
+# Chance per poll that a connected client roams to the other band.
+ROAM_PROBABILITY = 0.002
+# Share of the population that is connected when the simulation starts.
+INITIAL_PRESENCE = 0.5
+# Chance that a returning client comes back with a new MAC address.
+NEW_ADDRESS_PROBABILITY = 0.3
+BANDS = (("2g", 6), ("5g", 36))
+
+
+@dataclass(slots=True)
+class SimulatedClient:
+    """A client of the synthetic population."""
+
+    index: int
+    # Distinguishes the MAC addresses a client has used.
+    address: int
+    present: bool
+    next_change: float
+    band: int = 0
+    ip_suffix: int = 0
+    associated_at: int = 0
+    uptime: int = 0
+    rx: int = 0
+    tx: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class Checkpoint:
+    """Memory measured at a point of the simulation."""
+
+    hours: float
+    traced: int
+    footprint: MemoryFootprint
+
+
+class ClientChurn:
+    """Generate InfoHighDump samples for a churning client population."""
+
+    def __init__(
+        self, template: ReplayPoll, count: int, rng: random.Random, now: float
+    ) -> None:
+        """Initialize the population from the clients of a template poll."""
+        self._template = template
+        self._rng = rng
+        high = json.loads(template.responses[HIGH_INFO_METHOD])
+        result = high["result"]
+        client_keys = [
+            key for key in result if key.startswith("client") and key[6:].isdigit()
+        ]
+        if not client_keys:
+            msg = "the template InfoHighDump response has no clients"
+            raise ValueError(msg)
+        self._client_template: dict[str, Any] = result[client_keys[0]]
+        for key in client_keys:
+            del result[key]
+        self._high = high
+        self._clients = [
+            SimulatedClient(
+                index=index,
+                address=index,
+                present=rng.random() < INITIAL_PRESENCE,
+                next_change=now + rng.expovariate(1 / MEAN_ABSENCE_SECONDS),
+                band=rng.randrange(len(BANDS)),
+                ip_suffix=rng.randrange(2, 250),
+                associated_at=int(now),
+            )
+            for index in range(count)
+        ]
+        self._next_address = count
+
+    def poll(self, now: float) -> ReplayPoll:
+        """Advance the population to the given time and return the sample."""
+        rng = self._rng
+        present: list[dict[str, Any]] = []
+        usage = 0
+        for client in self._clients:
+            if now >= client.next_change:
+                client.present = not client.present
+                mean = MEAN_SESSION_SECONDS if client.present else MEAN_ABSENCE_SECONDS
+                client.next_change = now + rng.expovariate(1 / mean)
+                if client.present:
+                    # A new session starts with fresh counters and often a new IP.
+                    client.associated_at = int(now)
+                    client.uptime = 0
+                    client.rx = client.tx = 0
+                    client.band = rng.randrange(len(BANDS))
+                    client.ip_suffix = rng.randrange(2, 250)
+                    if rng.random() < NEW_ADDRESS_PROBABILITY:
+                        client.address = self._next_address
+                        self._next_address += 1
+            if not client.present:
+                continue
+
+            if rng.random() < ROAM_PROBABILITY:
+                client.band = 1 - client.band
+                client.associated_at = int(now)
+            rx = rng.randrange(200_000)
+            tx = rng.randrange(50_000)
+            client.rx += rx
+            client.tx += tx
+            client.uptime += POLL_SECONDS
+            usage += rx + tx
+
+            band, channel = BANDS[client.band]
+            address = client.address.to_bytes(3, "big").hex(":")
+            present.append(
+                {
+                    **self._client_template,
+                    "mac": f"02:00:00:{address}",
+                    "ip": f"192.168.1.{client.ip_suffix}",
+                    "id": client.index,
+                    "host_name": f"client-{client.index}",
+                    "rxAggrBytes": client.rx,
+                    "txAggrBytes": client.tx,
+                    "rxBytes": client.rx,
+                    "txBytes": client.tx,
+                    "rx_rate": rx // POLL_SECONDS,
+                    "tx_rate": tx // POLL_SECONDS,
+                    "uptime": client.uptime,
+                    "associated_at": client.associated_at,
+                    "band": band,
+                    "channel": channel,
+                }
+            )
+
+        base = self._high["result"]
+        base["sample_time"] = int(now)
+        base["uptime"] += POLL_SECONDS
+        base["total_usage"] += usage
+        base["latency_sample_count"] += POLL_SECONDS
+        base["client_numbers"] = base["clients"] = len(present)
+        result = {
+            **base,
+            **{f"client{index}": client for index, client in enumerate(present)},
+        }
+
+        responses = dict(self._template.responses)
+        responses[HIGH_INFO_METHOD] = json.dumps({**self._high, "result": result})
+        return ReplayPoll(now, responses)
+
+
+class SimulatedClock:
+    """Stand-in for Home Assistant's clock that follows the simulated time."""
+
+    def __init__(self, now: float) -> None:
+        """Initialize the clock."""
+        self.now = now
+
+    def utcnow(self) -> datetime:
+        """Return the simulated time."""
+        return dt_util.utc_from_timestamp(self.now)
+
+
+async def async_churn(  # noqa: PLR0913
+    template: ReplayPoll,
+    days: float,
+    clients: int,
+    seed: int,
+    expiry: float,
+    config_dir: Path,
+) -> list[Checkpoint]:
+    """Run the simulation and return the memory checkpoints."""
+    clock = SimulatedClock(
+        float(json.loads(template.responses[HIGH_INFO_METHOD])["result"]["sample_time"])
+    )
+    with patch.object(dt_util, "utcnow", clock.utcnow):
+        now = clock.now
+        churn = ClientChurn(template, clients, random.Random(seed), now)  # noqa: S311
+
+        hass = await async_setup_hass(config_dir)
+        feed = ReplayFeed([churn.poll(now)])
+        coordinator = await async_setup_replay_entry(hass, feed)
+        coordinator.client_expiry = expiry
+
+        tracemalloc.start()
+        checkpoints: list[Checkpoint] = []
+        polls_per_checkpoint = CHECKPOINT_SECONDS // POLL_SECONDS
+        for poll in range(1, int(days * 86400 / POLL_SECONDS) + 1):
+            now += POLL_SECONDS
+            clock.now = now
+            feed.polls[0] = churn.poll(now)
+            await coordinator.async_refresh()
+            await asyncio.sleep(0)
+
+            if poll % polls_per_checkpoint == 0:
+                gc.collect()
+                checkpoint = Checkpoint(
+                    hours=poll * POLL_SECONDS / 3600,
+                    traced=tracemalloc.get_traced_memory()[0],
+                    footprint=memory_footprint(coordinator),
+                )
+                checkpoints.append(checkpoint)
+                print_checkpoint(checkpoint)
+
+        tracemalloc.stop()
+        await hass.config_entries.async_unload(coordinator.config_entry.entry_id)
+        await hass.async_stop()
+        return checkpoints
+
+
+def print_checkpoint(checkpoint: Checkpoint) -> None:
+    """Print the memory measured at a checkpoint."""
+    footprint = checkpoint.footprint
+    print(
+        f"{checkpoint.hours:6.1f} h  traced {checkpoint.traced / 1024:9.1f} KiB"
+        f"  snapshot {footprint.snapshot / 1024:7.1f}"
+        f"  clients {footprint.clients / 1024:7.1f}"
+        f"  entities {footprint.entities / 1024:8.1f}"
+        f"  caches {footprint.caches / 1024:7.1f} KiB"
+        f"  ({footprint.client_count} clients, {footprint.entity_count} entities)"
+    )
+
+
+def main() -> None:
+    """Run the churn simulation from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("capture", type=Path, help="capture to take the template from")
+    parser.add_argument("--days", type=float, default=2.0, help="simulated days")
+    parser.add_argument("--clients", type=int, default=40, help="client population")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument(
+        "--expiry",
+        type=float,
+        default=6.0,
+        help="hours after which departed clients are forgotten",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1024.0,
+        help="allowed growth after the warm-up day, in KiB",
+    )
+    args = parser.parse_args()
+
+    polls = load_polls([args.capture])
+    if not polls:
+        parser.error("the capture contains no InfoHighDump responses")
+    if args.days * 86400 < WARM_UP_SECONDS + CHECKPOINT_SECONDS:
+        parser.error("simulate more than one day to measure growth after warm-up")
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        checkpoints = asyncio.run(
+            async_churn(
+                polls[0],
+                args.days,
+                args.clients,
+                args.seed,
+                args.expiry * 3600,
+                Path(config_dir),
+            )
+        )
+
+    baseline = next(
+        checkpoint
+        for checkpoint in checkpoints
+        if checkpoint.hours * 3600 >= WARM_UP_SECONDS
+    )
+    growth = (checkpoints[-1].traced - baseline.traced) / 1024
+    print(
+        f"Growth after warm-up: {growth:.1f} KiB over"
+        f" {checkpoints[-1].hours - baseline.hours:.1f} h"
+        f" (tolerance {args.tolerance:.0f} KiB)"
+    )
+    if growth > args.tolerance:
+        print("FAIL: memory keeps growing under client churn")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+Command line client for Ubiquiti Mobile gateways.
+
+Uses the integration's API client without Home Assistant; only aiohttp and pydantic
+are needed. Several gateways can be given, in which case they are queried
+concurrently. Run from the repository root:
+
+    python -m scripts.cli poll HOST [HOST ...] [--count 0]
+    python -m scripts.cli dump HOST [--method high]
+    python -m scripts.cli bench HOST [HOST ...] [--polls 20]
+
+The password is read from --password or the UBIQUITI_MOBILE_PASSWORD environment
+variable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+import types
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+PACKAGE = "custom_components.ubiquiti_mobile"
+
+# The package's __init__ imports the Home Assistant entry points. The package is
+# registered without running it, so that only the modules of the API client, which
+# need no Home Assistant, are imported from it.
+if PACKAGE not in sys.modules:
+    _package = types.ModuleType(PACKAGE)
+    _package.__path__ = [
+        str(
+            Path(__file__).resolve().parent.parent
+            / "custom_components"
+            / "ubiquiti_mobile"
+        )
+    ]
+    sys.modules[PACKAGE] = _package
+
+from custom_components.ubiquiti_mobile.api import (  # noqa: E402
+    UbiquitiMobileApiClient,
+    UbiquitiMobileApiClientError,
+    _decode_or_raise,
+)
+from custom_components.ubiquiti_mobile.data import SessionData  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from pydantic import BaseModel
+
+PASSWORD_ENVIRONMENT_VARIABLE = "UBIQUITI_MOBILE_PASSWORD"  # noqa: S105
+
+# API client calls by method name.
+METHODS: dict[str, Callable[[UbiquitiMobileApiClient], Awaitable[Any]]] = {
+    "device": UbiquitiMobileApiClient.get_device_info,
+    "gps": UbiquitiMobileApiClient.get_gps_info,
+    "high": UbiquitiMobileApiClient.get_high_info,
+}
+
+
+@dataclass(slots=True)
+class MethodTimings:
+    """Request latencies and decode times of one uimqtt method, in seconds."""
+
+    latency: list[float] = field(default_factory=list)
+    decode: list[float] = field(default_factory=list)
+    size: int = 0
+
+
+@dataclass(slots=True)
+class TimedParse[T]:
+    """Response parser that records the time spent decoding in a method's timings."""
+
+    parse: Callable[[bytes], T]
+    timings: MethodTimings
+
+    def __call__(self, body: bytes) -> T:
+        """Parse a response body and record the time it took."""
+        started = time.perf_counter()
+        try:
+            return self.parse(body)
+        finally:
+            self.timings.decode.append(time.perf_counter() - started)
+
+
+class TimedApiClient(UbiquitiMobileApiClient):
+    """API client that records the request latency and decode time of every call."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the client."""
+        super().__init__(*args, **kwargs)
+        self.timings: dict[str, MethodTimings] = {}
+
+    async def _api_request(
+        self,
+        method: str,
+        path: str,
+        data: dict | None = None,
+    ) -> bytes:
+        """Send a request and record its latency."""
+        started = time.perf_counter()
+        body = await super()._api_request(method, path, data)
+        timings = self.timings.setdefault(
+            (data or {}).get("method", path), MethodTimings()
+        )
+        timings.latency.append(time.perf_counter() - started)
+        timings.size = len(body)
+        return body
+
+    async def _api_wrapper[T](
+        self,
+        method: str,
+        path: str,
+        data: dict | None = None,
+        parse: Callable[[bytes], T] = _decode_or_raise,
+    ) -> T:
+        """Send a request and record the time spent decoding its response."""
+        # The base class retries with the same parser after a new login, which is
+        # then already timed.
+        if not isinstance(parse, TimedParse):
+            parse = TimedParse(
+                parse,
+                self.timings.setdefault(
+                    (data or {}).get("method", path), MethodTimings()
+                ),
+            )
+        return await super()._api_wrapper(method, path, data, parse)
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of a list of values."""
+    if not values:
+        return math.nan
+    ordered = sorted(values)
+    return ordered[max(math.ceil(percent / 100 * len(ordered)), 1) - 1]
+
+
+def _result(model: BaseModel | None) -> dict[str, Any] | None:
+    """Return a response result as JSON-compatible data."""
+    return model.model_dump(mode="json") if model is not None else None
+
+
+async def async_poll(
+    clients: dict[str, UbiquitiMobileApiClient], count: int, interval: float
+) -> None:
+    """Print a summary line per gateway for every poll."""
+
+    async def _poll(host: str, client: UbiquitiMobileApiClient) -> str:
+        started = time.perf_counter()
+        try:
+            high = (await client.get_high_info()).result
+        except UbiquitiMobileApiClientError as exception:
+            return f"{host:<20} error: {exception}"
+        latency = (time.perf_counter() - started) * 1000
+        if high is None:
+            return f"{host:<20} no data"
+        return (
+            f"{host:<20} {high.operator_name:<12} {high.band:<6}"
+            f" rsrp {high.rsrp:>4} dBm  clients {len(high.client_details):>3}"
+            f"  usage {high.total_usage / 1e9:>8.2f} GB  latency {latency:>6.0f} ms"
+        )
+
+    poll = 0
+    while count <= 0 or poll < count:
+        if poll:
+            await asyncio.sleep(interval)
+        poll += 1
+        for line in await asyncio.gather(
+            *(_poll(host, client) for host, client in clients.items())
+        ):
+            print(line)
+
+
+async def async_dump(client: UbiquitiMobileApiClient, methods: list[str]) -> None:
+    """Print the parsed responses of a gateway as JSON."""
+    # Log in once, rather than once per concurrent request.
+    await client.async_start_session()
+    responses = await asyncio.gather(*(METHODS[name](client) for name in methods))
+    print(
+        json.dumps(
+            {
+                name: _result(response.result)
+                for name, response in zip(methods, responses, strict=True)
+            },
+            indent=2,
+        )
+    )
+
+
+async def async_bench(clients: dict[str, TimedApiClient], polls: int) -> None:
+    """Poll every method repeatedly and print latency and decode distributions."""
+
+    async def _bench(client: TimedApiClient) -> None:
+        for _ in range(polls):
+            for call in METHODS.values():
+                await call(client)
+
+    await asyncio.gather(*(_bench(client) for client in clients.values()))
+
+    print(
+        f"{'gateway':<20} {'method':<14} {'size':>9}"
+        f" {'latency p50/p95/max ms':>24} {'decode p50/p95/max ms':>23}"
+    )
+    for host, client in clients.items():
+        for method, timings in client.timings.items():
+            latency = [value * 1000 for value in timings.latency]
+            decode = [value * 1000 for value in timings.decode]
+            print(
+                f"{host:<20} {method:<14} {timings.size / 1024:>5.1f} KiB"
+                f" {_percentile(latency, 50):>8.1f}"
+                f" {_percentile(latency, 95):>7.1f}"
+                f" {max(latency, default=math.nan):>7.1f}"
+                f" {_percentile(decode, 50):>7.2f}"
+                f" {_percentile(decode, 95):>7.2f}"
+                f" {max(decode, default=math.nan):>7.2f}"
+            )
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run a command against the gateways."""
+    async with aiohttp.ClientSession() as session:
+        clients = {
+            host: TimedApiClient(
+                SessionData(host=host, username=args.username, password=args.password),
+                session,
+            )
+            for host in args.hosts
+        }
+        if args.command == "poll":
+            await async_poll(clients, args.count, args.interval)
+        elif args.command == "dump":
+            await async_dump(clients[args.hosts[0]], args.method)
+        else:
+            await async_bench(clients, args.polls)
+
+
+def main() -> None:
+    """Run the command line client."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1].strip())
+    parser.add_argument("--username", default="ui", help="gateway username")
+    parser.add_argument(
+        "--password",
+        default=os.environ.get(PASSWORD_ENVIRONMENT_VARIABLE),
+        help=f"gateway password (default: ${PASSWORD_ENVIRONMENT_VARIABLE})",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    poll = commands.add_parser("poll", help="print a summary of every poll")
+    poll.add_argument("hosts", nargs="+", help="gateway hosts")
+    poll.add_argument(
+        "--count", type=int, default=1, help="number of polls, 0 to poll until stopped"
+    )
+    poll.add_argument(
+        "--interval", type=float, default=5.0, help="seconds between polls"
+    )
+
+    dump = commands.add_parser("dump", help="print the parsed responses as JSON")
+    dump.add_argument("hosts", nargs=1, help="gateway host")
+    dump.add_argument(
+        "--method",
+        choices=list(METHODS),
+        action="append",
+        help="method to dump, may be repeated (default: all)",
+    )
+
+    bench = commands.add_parser(
+        "bench", help="measure request latency and decode cost per method"
+    )
+    bench.add_argument("hosts", nargs="+", help="gateway hosts")
+    bench.add_argument("--polls", type=int, default=20, help="polls per method")
+
+    args = parser.parse_args()
+    if not args.password:
+        parser.error(f"--password or ${PASSWORD_ENVIRONMENT_VARIABLE} is required")
+    if args.command == "dump" and not args.method:
+        args.method = list(METHODS)
+
+    try:
+        asyncio.run(async_main(args))
+    except UbiquitiMobileApiClientError as exception:
+        sys.exit(f"error: {exception}")
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,357 @@
+"""
+Replay a capture of gateway responses against the integration.
+
+Captures are written by the "Record raw gateway responses" option. The replay sets
+up the integration in a throwaway Home Assistant instance, serves the recorded
+responses from a replay API client and drives the coordinator poll by poll, so the
+real parsing, coordinator and entity code runs against real-world client churn.
+Polls are paced at the recorded intervals divided by the speed-up; a speed-up of 0
+replays as fast as possible.
+
+Time-based logic, such as the consider-home period, still runs on the wall clock,
+so it is compressed along with the recorded intervals.
+
+Run from the repository root:
+    python -m scripts.replay CAPTURE [CAPTURE ...] [--speed 60] [--limit N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import json
+import logging
+import math
+import tempfile
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from homeassistant import bootstrap
+from homeassistant.config_entries import SOURCE_USER
+from homeassistant.const import EVENT_STATE_CHANGED, EVENT_STATE_REPORTED
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.runner import RuntimeConfig
+
+from custom_components.ubiquiti_mobile import config_flow, integration
+from custom_components.ubiquiti_mobile.api import UbiquitiMobileApiClient
+from custom_components.ubiquiti_mobile.const import DOMAIN, EVENT_CLIENT, EVENT_RADIO
+
+if TYPE_CHECKING:
+    import aiohttp
+    from homeassistant.core import Event, HomeAssistant
+
+    from custom_components.ubiquiti_mobile.capture import PayloadCapture
+    from custom_components.ubiquiti_mobile.coordinator import (
+        UbiquitiDataUpdateCoordinator,
+    )
+    from custom_components.ubiquiti_mobile.data import SessionData
+
+HIGH_INFO_METHOD = "InfoHighDump"
+REPLAYED_METHODS = ("GetDeviceInfo", "InfoGpsDump", HIGH_INFO_METHOD)
+# The event loop is probed this often to measure how late callbacks run.
+LAG_PROBE_SECONDS = 0.01
+
+
+@dataclass(slots=True)
+class ReplayPoll:
+    """The gateway state for one recorded poll, as raw JSON per method."""
+
+    timestamp: float
+    responses: dict[str, str]
+
+
+def load_polls(paths: list[Path]) -> list[ReplayPoll]:
+    """
+    Group the captured responses into polls.
+
+    Each InfoHighDump response starts a new poll. Responses that were not captured
+    for a poll, such as device info skipped under load, carry over from the
+    previous poll.
+    """
+    records: list[dict[str, Any]] = []
+    for path in paths:
+        with path.open("rb") as raw:
+            compressed = raw.read(2) == b"\x1f\x8b"
+        opener = gzip.open if compressed else open
+        with opener(path, "rt", encoding="utf-8") as capture:
+            records.extend(
+                record
+                for line in capture
+                if line.strip()
+                and (record := json.loads(line))["method"] in REPLAYED_METHODS
+                and isinstance(record["response"], dict)
+            )
+    records.sort(key=lambda record: record["ts"])
+
+    # Seed the first poll with the first response captured for each method.
+    current: dict[str, str] = {}
+    for record in records:
+        current.setdefault(record["method"], json.dumps(record["response"]))
+
+    polls: list[ReplayPoll] = []
+    for record in records:
+        current[record["method"]] = json.dumps(record["response"])
+        if record["method"] == HIGH_INFO_METHOD:
+            polls.append(ReplayPoll(record["ts"], dict(current)))
+        elif polls:
+            polls[-1].responses[record["method"]] = current[record["method"]]
+    return polls
+
+
+class ReplayFeed:
+    """Serve the responses of the current poll."""
+
+    def __init__(self, polls: list[ReplayPoll]) -> None:
+        """Initialize the feed at the first poll."""
+        self.polls = polls
+        self.index = 0
+        self.requests: dict[str, int] = dict.fromkeys(REPLAYED_METHODS, 0)
+
+    def response(self, method: str) -> bytes:
+        """Return the current response body for a method."""
+        self.requests[method] += 1
+        return self.polls[self.index].responses[method].encode()
+
+
+class ReplayApiClient(UbiquitiMobileApiClient):
+    """API client that answers from a replay feed instead of the gateway."""
+
+    def __init__(
+        self,
+        feed: ReplayFeed,
+        session_data: SessionData,
+        session: aiohttp.ClientSession,
+        capture: PayloadCapture | None = None,
+    ) -> None:
+        """Initialize the client."""
+        super().__init__(session_data, session, capture)
+        self._feed = feed
+        self._session_data.token = "replay"  # noqa: S105
+
+    async def async_start_session(self) -> None:  # type: ignore[override]
+        """Skip authentication; the replay client always has a session."""
+
+    async def _api_request(
+        self,
+        method: str,  # noqa: ARG002
+        path: str,  # noqa: ARG002
+        data: dict | None = None,
+    ) -> bytes:
+        """Return the recorded response body for the requested RPC method."""
+        return self._feed.response((data or {})["method"])
+
+
+@dataclass(slots=True)
+class ReplayReport:
+    """Measurements of a replay run."""
+
+    polls: int = 0
+    setup_duration: float = 0.0
+    duration: float = 0.0
+    poll_latencies: list[float] = field(default_factory=list)
+    loop_lag: list[float] = field(default_factory=list)
+    state_changes: int = 0
+    state_reports: int = 0
+    radio_events: int = 0
+    client_events: int = 0
+    entities: int = 0
+    requests: dict[str, int] = field(default_factory=dict)
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(math.ceil(percent / 100 * len(ordered)), 1) - 1]
+
+
+async def async_probe_loop_lag(samples: list[float]) -> None:
+    """Record how late a periodic sleep wakes up."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + LAG_PROBE_SECONDS
+        await asyncio.sleep(LAG_PROBE_SECONDS)
+        samples.append(max(loop.time() - expected, 0.0))
+
+
+async def async_setup_hass(config_dir: Path) -> HomeAssistant:
+    """Start a minimal Home Assistant instance in a temporary directory."""
+    (config_dir / "configuration.yaml").write_text("homeassistant:\n")
+    hass = await bootstrap.async_setup_hass(
+        RuntimeConfig(
+            config_dir=str(config_dir),
+            skip_pip=True,
+            log_file=str(config_dir / "home-assistant.log"),
+        )
+    )
+    if hass is None:
+        msg = "Home Assistant failed to start"
+        raise RuntimeError(msg)
+    logging.getLogger().setLevel(logging.WARNING)
+    return hass
+
+
+async def async_setup_replay_entry(
+    hass: HomeAssistant, feed: ReplayFeed
+) -> UbiquitiDataUpdateCoordinator:
+    """
+    Add a config entry that is served by the feed and return its coordinator.
+
+    The config flow and the first refresh consume the current poll of the feed. The
+    coordinator's own poll timer is stopped, as the harness drives every refresh;
+    scheduled polls would otherwise add to the request and state write counts. Every
+    refresh replays a recorded poll, so none of them is turned into a GPS-only poll.
+    """
+    replay_client = partial(ReplayApiClient, feed)
+    integration.UbiquitiMobileApiClient = replay_client
+    config_flow.UbiquitiMobileApiClient = replay_client
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": SOURCE_USER},
+        data={"host": "replay", "username": "replay", "password": "replay"},
+    )
+    coordinator: UbiquitiDataUpdateCoordinator = hass.data[DOMAIN][
+        result["result"].entry_id
+    ]
+    # The coordinator sets update_interval on every refresh, so rescheduling is
+    # disabled rather than the interval cleared.
+    coordinator._async_unsub_refresh()  # noqa: SLF001
+    coordinator._schedule_refresh = lambda: None  # noqa: SLF001
+    coordinator._schedule_next_poll = lambda: None  # noqa: SLF001
+    coordinator._gps_only = False  # noqa: SLF001
+    return coordinator
+
+
+async def async_replay(
+    polls: list[ReplayPoll], speed: float, config_dir: Path
+) -> ReplayReport:
+    """Replay the polls and measure the integration."""
+    report = ReplayReport()
+    hass = await async_setup_hass(config_dir)
+    registry = er.async_get(hass)
+
+    @callback
+    def _is_replayed_entity(event_data: dict[str, Any]) -> bool:
+        entry = registry.async_get(event_data["entity_id"])
+        return entry is not None and entry.platform == DOMAIN
+
+    @callback
+    def _count_change(_event: Event) -> None:
+        report.state_changes += 1
+
+    @callback
+    def _count_report(_event: Event) -> None:
+        report.state_reports += 1
+
+    @callback
+    def _count_radio_event(_event: Event) -> None:
+        report.radio_events += 1
+
+    @callback
+    def _count_client_event(_event: Event) -> None:
+        report.client_events += 1
+
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED, _count_change, event_filter=_is_replayed_entity
+    )
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED, _count_report, event_filter=_is_replayed_entity
+    )
+    hass.bus.async_listen(EVENT_RADIO, _count_radio_event)
+    hass.bus.async_listen(EVENT_CLIENT, _count_client_event)
+
+    feed = ReplayFeed(polls)
+    lag_probe = asyncio.create_task(async_probe_loop_lag(report.loop_lag))
+    started = time.perf_counter()
+    coordinator = await async_setup_replay_entry(hass, feed)
+    entry = coordinator.config_entry
+    report.setup_duration = time.perf_counter() - started
+
+    # The first poll was replayed during setup.
+    started = time.perf_counter()
+
+    first_timestamp = polls[0].timestamp
+    for index in range(1, len(polls)):
+        if speed:
+            target = started + (polls[index].timestamp - first_timestamp) / speed
+            await asyncio.sleep(max(target - time.perf_counter(), 0))
+        else:
+            await asyncio.sleep(0)
+        feed.index = index
+        poll_started = time.perf_counter()
+        await coordinator.async_refresh()
+        report.poll_latencies.append(time.perf_counter() - poll_started)
+
+    report.duration = time.perf_counter() - started
+    report.polls = len(polls) - 1
+    report.requests = dict(feed.requests)
+    report.entities = len(er.async_entries_for_config_entry(registry, entry.entry_id))
+
+    lag_probe.cancel()
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_stop()
+    return report
+
+
+def print_report(report: ReplayReport) -> None:
+    """Print a replay report."""
+    milliseconds = [latency * 1000 for latency in report.poll_latencies]
+    lag = [lag * 1000 for lag in report.loop_lag]
+    duration = report.duration or 1.0
+    print(f"Setup:               {report.setup_duration:.2f} s")
+    print(f"Polls replayed:      {report.polls} in {report.duration:.2f} s")
+    print(f"Throughput:          {report.polls / duration:.1f} polls/s")
+    print(
+        f"Poll latency (ms):   p50 {percentile(milliseconds, 50):.2f}"
+        f"  p95 {percentile(milliseconds, 95):.2f}"
+        f"  max {max(milliseconds, default=0):.2f}"
+    )
+    print(
+        f"Loop lag (ms):       p50 {percentile(lag, 50):.2f}"
+        f"  p95 {percentile(lag, 95):.2f}"
+        f"  max {max(lag, default=0):.2f}"
+    )
+    print(
+        f"State writes:        {report.state_changes + report.state_reports}"
+        f" ({report.state_changes} changed, {report.state_reports} unchanged)"
+    )
+    print(f"Entities:            {report.entities}")
+    print(f"Radio events:        {report.radio_events}")
+    print(f"Client events:       {report.client_events}")
+    print(
+        "Requests:            "
+        + ", ".join(f"{method} {count}" for method, count in report.requests.items())
+    )
+
+
+def main() -> None:
+    """Run the replay from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("captures", nargs="+", type=Path, help="capture files")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=60.0,
+        help="speed-up over the recorded intervals; 0 replays without pauses",
+    )
+    parser.add_argument("--limit", type=int, help="replay at most this many polls")
+    args = parser.parse_args()
+
+    polls = load_polls(args.captures)[: args.limit]
+    if not polls:
+        parser.error("the captures contain no InfoHighDump responses")
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        report = asyncio.run(async_replay(polls, args.speed, Path(config_dir)))
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
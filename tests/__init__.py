@@ -0,0 +1 @@
+"""Tests for the ubiquiti_mobile integration."""
@@ -0,0 +1,131 @@
+"""Tests for the link quality analytics."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+from custom_components.ubiquiti_mobile.link_quality import LinkQualityAnalyzer
+
+# One probe per second for a day, polled every five seconds.
+DAY_OF_PROBES = 86_400
+PROBES_PER_POLL = 5
+
+
+@dataclass
+class SimulatedGateway:
+    """Latency counters of a gateway, reported the way InfoHighDump does."""
+
+    count: int = 0
+    losses: int = 0
+    latency_sum: float = 0.0
+    latency_max: float = 0.0
+
+    def probe(self, latency: float, count: int = 1, *, lost: int = 0) -> None:
+        """Record probes with the same latency, some of which were lost."""
+        self.count += count
+        self.losses += lost
+        self.latency_sum += latency * count
+        self.latency_max = max(self.latency_max, latency)
+
+    def sample(self) -> SimpleNamespace:
+        """Return the counters with the mean rounded to whole milliseconds."""
+        return SimpleNamespace(
+            latency_sample_count=self.count,
+            latency_packet_loss_count=self.losses,
+            latency_avg_ms=math.floor(self.latency_sum / self.count + 0.5),
+            latency_max_ms=math.ceil(self.latency_max),
+        )
+
+
+def _poll(
+    analyzer: LinkQualityAnalyzer,
+    gateway: SimulatedGateway,
+    latencies: list[float],
+) -> list:
+    """Feed one poll per latency and return the link quality after each poll."""
+    qualities = []
+    for latency in latencies:
+        gateway.probe(latency, PROBES_PER_POLL)
+        qualities.append(analyzer.update(gateway.sample()))
+    return qualities
+
+
+def _booted_a_day_ago(latency: float = 40.0) -> SimulatedGateway:
+    """Return a gateway that has been probing at a steady latency for a day."""
+    gateway = SimulatedGateway()
+    gateway.probe(latency, DAY_OF_PROBES)
+    return gateway
+
+
+def test_first_sample_only_sets_the_baseline() -> None:
+    """The first sample covers everything since boot and is not an interval."""
+    analyzer = LinkQualityAnalyzer()
+    gateway = _booted_a_day_ago()
+
+    assert analyzer.update(gateway.sample()) is None
+
+
+def test_long_uptime_reports_latency_statistics() -> None:
+    """After a day of uptime, every poll still produces latency statistics."""
+    analyzer = LinkQualityAnalyzer()
+    gateway = _booted_a_day_ago(40.0)
+    analyzer.update(gateway.sample())
+
+    qualities = _poll(analyzer, gateway, [40.0] * 50)
+
+    assert all(quality is not None for quality in qualities)
+    assert qualities[0].jitter is None
+    for quality in qualities[1:]:
+        assert quality.interval_latency == 40.0
+        assert quality.jitter == 0.0
+        assert quality.latency_p50 == 40.0
+        assert quality.latency_p95 == 40.0
+
+
+def test_long_uptime_latency_statistics_keep_rolling() -> None:
+    """A sustained rise in latency reaches the rolling statistics."""
+    analyzer = LinkQualityAnalyzer()
+    gateway = _booted_a_day_ago(40.0)
+    analyzer.update(gateway.sample())
+    before = _poll(analyzer, gateway, [40.0] * 10)[-1]
+
+    after = _poll(analyzer, gateway, [200.0] * 300)[-1]
+
+    assert before.latency_p95 == 40.0
+    assert after.latency_p95 > before.latency_p95
+    assert after.jitter > 0.0
+    assert all(
+        0.0 <= latency <= gateway.latency_max
+        for latency in analyzer._latencies  # noqa: SLF001
+    )
+
+
+def test_counter_reset_sets_a_new_baseline() -> None:
+    """A gateway reboot is not treated as an interval."""
+    analyzer = LinkQualityAnalyzer()
+    gateway = _booted_a_day_ago(40.0)
+    analyzer.update(gateway.sample())
+    before = _poll(analyzer, gateway, [40.0] * 3)[-1]
+
+    rebooted = SimulatedGateway()
+    rebooted.probe(90.0, 10)
+
+    assert analyzer.update(rebooted.sample()) is before
+    quality = _poll(analyzer, rebooted, [90.0])[-1]
+    assert quality.interval_latency == 90.0
+
+
+def test_packet_loss_comes_from_the_counter_deltas() -> None:
+    """Losses since boot do not count, only the losses of each interval."""
+    analyzer = LinkQualityAnalyzer()
+    gateway = _booted_a_day_ago(40.0)
+    gateway.probe(40.0, 100, lost=100)
+    analyzer.update(gateway.sample())
+
+    gateway.probe(40.0, 10, lost=1)
+    quality = analyzer.update(gateway.sample())
+
+    assert quality.interval_packet_loss == 10.0
+    assert quality.packet_loss == 10.0
@@ -0,0 +1,54 @@
+"""Tests for the poll scheduling."""
+
+from __future__ import annotations
+
+import math
+from itertools import pairwise
+
+import pytest
+
+from custom_components.ubiquiti_mobile.polling import SamplePhaseLock
+
+# Seconds between the gateway taking a sample and a poll returning it.
+RESPONSE_SECONDS = 0.2
+
+
+def _run(
+    sample_interval: int, phase: float, polls: int
+) -> tuple[list[bool], list[int]]:
+    """
+    Poll a simulated gateway.
+
+    Returns whether each poll saw a new sample, and the time of every new sample.
+    """
+    lock = SamplePhaseLock()
+    now = 1_000_000.0
+    fresh: list[bool] = []
+    samples: list[int] = []
+    for _ in range(polls):
+        sample_time = int(
+            math.floor((now - phase) / sample_interval) * sample_interval + phase
+        )
+        fresh.append(lock.update(sample_time, sample_interval, now))
+        if fresh[-1]:
+            samples.append(sample_time)
+        now += RESPONSE_SECONDS
+        now += lock.next_delay(now)
+    return fresh, samples
+
+
+@pytest.mark.parametrize("sample_interval", [5, 10, 30, 60, 120])
+def test_lock_settles_on_one_poll_per_sample(sample_interval: int) -> None:
+    """Once locked, every poll returns a new sample."""
+    fresh, _ = _run(sample_interval, phase=1.7, polls=60)
+
+    assert all(fresh[-20:])
+
+
+@pytest.mark.parametrize("sample_interval", [5, 60, 120])
+def test_lock_misses_no_samples(sample_interval: int) -> None:
+    """Once locked, consecutive polls return consecutive samples."""
+    _, samples = _run(sample_interval, phase=1.7, polls=60)
+
+    gaps = {later - earlier for earlier, later in pairwise(samples)}
+    assert gaps == {sample_interval}
@@ -0,0 +1,101 @@
+"""Tests for the client presence tracking."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from custom_components.ubiquiti_mobile.presence import ClientPresenceTracker
+
+MAC = "aa:bb:cc:dd:ee:ff"
+CONSIDER_HOME = 180
+SAMPLE_TIME = 1_700_000_000
+
+
+def _client(associated_at: int | None = None, uptime: int | None = None) -> object:
+    """Return a client record as reported by InfoHighDump."""
+    return SimpleNamespace(mac=MAC.upper(), associated_at=associated_at, uptime=uptime)
+
+
+def _since(tracker: ClientPresenceTracker) -> float | None:
+    """Return the session start of the client as a unix timestamp."""
+    since = tracker.connected_since().get(MAC)
+    return since.timestamp() if since else None
+
+
+def test_short_gap_keeps_the_client_home() -> None:
+    """A client missing from one sample is not declared away."""
+    tracker = ClientPresenceTracker(CONSIDER_HOME)
+    tracker.update([_client(SAMPLE_TIME - 600)], SAMPLE_TIME, SAMPLE_TIME)
+    tracker.update([], SAMPLE_TIME + 5, SAMPLE_TIME + 5)
+
+    assert tracker.is_home(MAC)
+    assert _since(tracker) == SAMPLE_TIME - 600
+
+    tracker.update([], SAMPLE_TIME + CONSIDER_HOME + 10, SAMPLE_TIME + 190)
+
+    assert not tracker.is_home(MAC)
+    assert _since(tracker) is None
+
+
+def test_session_start_comes_from_associated_at() -> None:
+    """The session starts when the gateway says the client associated."""
+    tracker = ClientPresenceTracker(CONSIDER_HOME)
+    tracker.update([_client(SAMPLE_TIME - 600, uptime=30)], SAMPLE_TIME, SAMPLE_TIME)
+
+    assert _since(tracker) == SAMPLE_TIME - 600
+
+
+def test_reconnect_between_polls_starts_a_new_session() -> None:
+    """A new associated_at is a reconnect, although the client never went away."""
+    tracker = ClientPresenceTracker(CONSIDER_HOME)
+    tracker.update([_client(SAMPLE_TIME - 600)], SAMPLE_TIME, SAMPLE_TIME)
+    tracker.update([_client(SAMPLE_TIME + 3)], SAMPLE_TIME + 5, SAMPLE_TIME + 5)
+
+    assert tracker.is_home(MAC)
+    assert _since(tracker) == SAMPLE_TIME + 3
+
+
+def test_reconnect_while_missing_starts_a_new_session() -> None:
+    """A client that reconnected during a gap gets the new association time."""
+    tracker = ClientPresenceTracker(CONSIDER_HOME)
+    tracker.update([_client(SAMPLE_TIME - 600)], SAMPLE_TIME, SAMPLE_TIME)
+    tracker.update([], SAMPLE_TIME + 5, SAMPLE_TIME + 5)
+    tracker.update([_client(SAMPLE_TIME + 7)], SAMPLE_TIME + 10, SAMPLE_TIME + 10)
+
+    assert _since(tracker) == SAMPLE_TIME + 7
+
+
+def test_unchanged_association_keeps_the_session() -> None:
+    """A client that only missed samples keeps its session."""
+    tracker = ClientPresenceTracker(CONSIDER_HOME)
+    tracker.update([_client(SAMPLE_TIME - 600)], SAMPLE_TIME, SAMPLE_TIME)
+    first = tracker.connected_since()[MAC]
+    tracker.update([], SAMPLE_TIME + 5, SAMPLE_TIME + 5)
+    tracker.update([_client(SAMPLE_TIME - 599)], SAMPLE_TIME + 10, SAMPLE_TIME + 10)
+
+    assert tracker.connected_since()[MAC] is first
+
+
+def test_uptime_fallback_tolerates_wobble() -> None:
+    """Without associated_at the session start is derived from the uptime."""
+    tracker = ClientPresenceTracker(CONSIDER_HOME)
+    tracker.update([_client(uptime=100)], SAMPLE_TIME, SAMPLE_TIME)
+    first = tracker.connected_since()[MAC]
+    tracker.update([_client(uptime=103)], SAMPLE_TIME + 5, SAMPLE_TIME + 5)
+
+    assert tracker.connected_since()[MAC] is first
+
+    tracker.update([_client(uptime=2)], SAMPLE_TIME + 10, SAMPLE_TIME + 10)
+
+    assert _since(tracker) == SAMPLE_TIME + 8
+
+
+def test_returning_client_starts_a_new_session() -> None:
+    """A client that was away starts a new session when it comes back."""
+    tracker = ClientPresenceTracker(CONSIDER_HOME)
+    tracker.update([_client()], SAMPLE_TIME, SAMPLE_TIME)
+    away = SAMPLE_TIME + CONSIDER_HOME + 10
+    tracker.update([], away, away)
+    tracker.update([_client()], away + 100, away + 100)
+
+    assert _since(tracker) == away + 100
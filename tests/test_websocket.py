@@ -0,0 +1,40 @@
+"""Tests for the websocket snapshots."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from custom_components.ubiquiti_mobile.data import UbiquitiMobileStateData
+from custom_components.ubiquiti_mobile.websocket import SnapshotCache
+
+
+def _data(latitude: float) -> UbiquitiMobileStateData:
+    """Return a coordinator update with only GPS data."""
+    gps = SimpleNamespace(model_dump=lambda: {"latitude": latitude})
+    return UbiquitiMobileStateData(gps=gps)
+
+
+def test_snapshot_is_built_once_per_update() -> None:
+    """Commands reading the same update share its snapshot."""
+    cache = SnapshotCache()
+    data = _data(1.0)
+
+    first = cache.snapshot(data)
+
+    assert cache.snapshot(data) is first
+    assert first["gps"] == {"latitude": 1.0}
+    assert cache.snapshot(_data(1.0)) is not first
+
+
+def test_subscribers_share_the_delta() -> None:
+    """Subscribers that saw the same snapshot get the same delta."""
+    cache = SnapshotCache()
+    previous = cache.snapshot(_data(1.0))
+    data = _data(2.0)
+
+    current, delta = cache.delta(previous, data)
+
+    assert delta == {"gps": {"latitude": 2.0}}
+    assert cache.delta(previous, data) == (current, delta)
+    assert cache.delta(previous, data)[1] is delta
+    assert cache.delta(current, data)[1] == {}